@@ -1,10 +1,29 @@
 import streamlit as st
 import os
 import json
-from utils.mcp_schema import UserContext, load_user_context, list_saved_contexts, save_user_context
+import logging
+from utils.mcp_schema import UserContext, load_user_context, list_saved_contexts, save_user_context, delete_user_context
 from utils.extract_text import extract_text_from_url, extract_all_text
-from utils.match_score import calculate_match_score
+from utils.match_score import calculate_match_score, precompute_profile_embeddings
+from utils.profile_embeddings import remove_profile_embeddings
 from utils.feedback import generate_job_feedback
+from utils.tracing import Trace
+from utils.circuit_breaker import breaker_states
+from utils.log_config import configure_logging
+
+# 로그 레벨/샘플링 설정 (LOG_LEVEL, LOG_SAMPLE_RATE 환경변수)
+configure_logging()
+logger = logging.getLogger(__name__)
+
+def precompute_embeddings_after_save(context: UserContext, saved_path: str) -> None:
+    """저장 직후 프로필 임베딩 사전 계산 (실패해도 저장은 끝났으므로 로그만 남기고 분석 시 다시 계산)"""
+    try:
+        precompute_profile_embeddings(context, saved_path)
+    except Exception as e:
+        logger.warning("Profile embedding precompute failed for %s: %s", saved_path, e)
+
+# 분석 단계별 timing 표시 여부 (디버그용)
+SHOW_PIPELINE_TIMINGS = os.getenv("SHOW_PIPELINE_TIMINGS", "").lower() in ("1", "true", "yes")
 
 # API 키 불러오기 (config.py 또는 api.py에서)
 CONFIG_API_KEY = None
@@ -226,7 +245,8 @@ if not saved_contexts and not st.session_state.get('has_profile', False):
                 
                 # Save
                 try:
-                    save_user_context(new_context)
+                    saved_path = save_user_context(new_context)
+                    precompute_embeddings_after_save(new_context, saved_path)
                     st.success(f"{name}'s profile has been successfully created!")
                     st.session_state.has_profile = True
                     st.rerun()
@@ -336,11 +356,10 @@ if st.session_state.get('show_delete_modal', False):
                 if st.button("Confirm Delete", type="primary", use_container_width=True):
                     try:
                         # Delete file
-                        import os
                         data_dir = "data/user_contexts"
                         filepath = os.path.join(data_dir, st.session_state.deleting_profile)
-                        if os.path.exists(filepath):
-                            os.remove(filepath)
+                        if delete_user_context(st.session_state.deleting_profile):
+                            remove_profile_embeddings(filepath)
                             st.success("Profile has been deleted.")
                             st.session_state.show_delete_modal = False
                             st.session_state.deleting_profile = None
@@ -625,7 +644,8 @@ if st.session_state.get('create_profile', False) or st.session_state.get('edit_p
             
             # Save
             try:
-                save_user_context(new_context)
+                saved_path = save_user_context(new_context)
+                precompute_embeddings_after_save(new_context, saved_path)
                 st.success(f"{name}'s profile has been successfully saved!")
                 st.session_state.create_profile = False
                 st.session_state.edit_profile = False
@@ -693,8 +713,12 @@ job_title = ""
 
 # Process text input (URL or direct text)
 if url or direct_text:
+    # 이번 분석의 단계별 timing 기록
+    analysis_trace = Trace("analysis")
+    
     if url:
-        extracted_text, headings = extract_text_from_url(url)
+        with st.spinner("🔍 웹페이지에서 텍스트를 추출하는 중..."), analysis_trace.activate():
+            extracted_text, headings = extract_text_from_url(url)
         
         if extracted_text:
             job_text = extracted_text
@@ -711,7 +735,7 @@ if url or direct_text:
     
     # Analyze if we have text and user profile
     if job_text and user_context:
-        with st.spinner("Performing matching analysis..."):
+        with st.spinner("Performing matching analysis..."), analysis_trace.activate():
             # Calculate matching score
             # API 키를 매칭 계산에도 전달 (Additional Notes AI 분석용)
             match_score = calculate_match_score(user_context, job_text, st.session_state.get('openai_api_key'))
@@ -763,6 +787,25 @@ if url or direct_text:
         # Show API key status
         if not st.session_state.get('openai_api_key'):
             st.info("💡 **Tip**: Enter your OpenAI API key above to get more detailed AI-powered feedback!")
+        
+        # 단계별 timing (SHOW_PIPELINE_TIMINGS=1 일 때만 표시)
+        if SHOW_PIPELINE_TIMINGS:
+            with st.expander(f"⏱️ Timing breakdown ({analysis_trace.total_ms():.0f} ms)"):
+                token_usage = analysis_trace.token_usage()
+                st.caption(f"GPT calls: {token_usage['calls']} | prompt tokens: {token_usage['prompt_tokens']} | "
+                           f"completion tokens: {token_usage['completion_tokens']} | "
+                           f"cached: {token_usage['cached_tokens']} ({token_usage['cached_ratio']:.0%})")
+                st.dataframe(analysis_trace.breakdown(), use_container_width=True)
+                dependency_states = breaker_states()
+                if dependency_states:
+                    st.caption("External dependencies (circuit state, error rate, adaptive timeout)")
+                    st.dataframe(list(dependency_states.values()), use_container_width=True)
+                st.download_button(
+                    "Download spans (JSON)",
+                    data=analysis_trace.to_json(),
+                    file_name=f"trace_{analysis_trace.trace_id}.json",
+                    mime="application/json"
+                )
     
     elif job_text and not user_context:
         st.warning("Please select a user profile from the sidebar for analysis.")
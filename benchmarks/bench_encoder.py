@@ -0,0 +1,116 @@
+"""임베딩 백엔드 벤치마크 (torch vs ONNX vs ONNX int8)
+
+각 백엔드를 별도 프로세스에서 실행하여 모델 로드 시간, 최대 RSS,
+초당 문장 처리량을 측정하고, torch 결과 대비 출력 차이를 비교한다.
+
+사용법:
+    python scripts/export_onnx_encoder.py --quantize
+    python benchmarks/bench_encoder.py --backends torch onnx onnx-int8
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import subprocess
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE_SENTENCES = [
+    "자격요건 Python 기반 백엔드 개발 경력 3년 이상, RAG 파이프라인 구축 경험",
+    "주요업무 LLM을 활용한 검색 증강 생성 서비스 설계 및 운영",
+    "우대사항 PyTorch 또는 TensorFlow를 이용한 모델 학습 및 서빙 경험",
+    "Requirements: 5+ years of experience building NLP systems in production",
+    "Responsibilities: design and maintain data pipelines on AWS using Docker and Kubernetes",
+    "Preferred qualifications: publications at ACL, EMNLP or NeurIPS",
+    "Target roles: NLP Engineer, AI Research Assistant Skills: Python, Transformers, PyTorch",
+    "Projects: 챗봇 개발: 고객 상담용 AI 챗봇 시스템 개발 (기술: Python, GPT, FastAPI)",
+]
+
+
+def _max_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB, Linux 기준 ru_maxrss는 KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_worker(backend: str, sentences: int, batch_size: int, output_path: str) -> None:
+    """단일 백엔드 측정 (자식 프로세스에서 실행)"""
+    sys.path.insert(0, ROOT_DIR)
+    baseline_rss = _max_rss_mb()
+
+    load_start = time.perf_counter()
+    from utils.match_score import load_encoder
+    encoder = load_encoder(backend)
+    load_seconds = time.perf_counter() - load_start
+
+    corpus = [SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)] + f" #{i}" for i in range(sentences)]
+
+    # 워밍업 후 측정
+    encoder.encode(corpus[:batch_size], batch_size=batch_size, normalize_embeddings=True)
+    encode_start = time.perf_counter()
+    embeddings = encoder.encode(corpus, batch_size=batch_size, normalize_embeddings=True)
+    encode_seconds = time.perf_counter() - encode_start
+
+    import numpy as np
+    np.save(output_path + ".npy", np.asarray(embeddings, dtype=np.float32))
+
+    result = {
+        'backend': backend,
+        'load_seconds': load_seconds,
+        'rss_mb': _max_rss_mb(),
+        'rss_delta_mb': _max_rss_mb() - baseline_rss,
+        'sentences_per_second': sentences / encode_seconds if encode_seconds else float('inf'),
+    }
+    with open(output_path + ".json", 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark embedding encoder backends")
+    parser.add_argument("--backends", nargs="+", default=["torch", "onnx", "onnx-int8"])
+    parser.add_argument("--sentences", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--tolerance", type=float, default=1e-3, help="max allowed |Δ| for FP32 ONNX vs torch")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.sentences, args.batch_size, args.output)
+        return
+
+    import numpy as np
+
+    results = []
+    embeddings = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for backend in args.backends:
+            output_path = os.path.join(tmp_dir, backend)
+            subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--worker", backend, "--output", output_path,
+                 "--sentences", str(args.sentences), "--batch-size", str(args.batch_size)],
+                check=True, cwd=ROOT_DIR
+            )
+            with open(output_path + ".json", encoding='utf-8') as f:
+                results.append(json.load(f))
+            embeddings[backend] = np.load(output_path + ".npy")
+
+    reference = embeddings.get("torch")
+    print(f"{'backend':<12}{'load (s)':>10}{'max RSS (MB)':>14}{'sent/s':>10}{'max |Δ|':>10}{'min cos':>10}")
+    for result in results:
+        backend = result['backend']
+        max_diff, min_cos = "-", "-"
+        if reference is not None and backend != "torch":
+            diff = np.abs(embeddings[backend] - reference).max()
+            cos = np.sum(embeddings[backend] * reference, axis=1).min()
+            max_diff, min_cos = f"{diff:.2e}", f"{cos:.4f}"
+            if backend == "onnx" and diff > args.tolerance:
+                print(f"WARNING: onnx output differs from torch by {diff:.2e} (> {args.tolerance})")
+        print(f"{backend:<12}{result['load_seconds']:>10.2f}{result['rss_mb']:>14.1f}"
+              f"{result['sentences_per_second']:>10.1f}{max_diff:>10}{min_cos:>10}")
+
+
+if __name__ == "__main__":
+    main()
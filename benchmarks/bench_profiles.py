@@ -0,0 +1,101 @@
+"""UserContext vs CompactUserContext 메모리/직렬화 벤치마크
+
+사용법:
+    python benchmarks/bench_profiles.py --profiles 20000
+"""
+import os
+import sys
+import gc
+import time
+import json
+import random
+import argparse
+import tracemalloc
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.mcp_schema import UserContext, CompactUserContext
+
+SKILLS = ["Python", "PyTorch", "TensorFlow", "Transformers", "RAG", "LLM", "SQL", "Docker",
+          "Kubernetes", "AWS", "FastAPI", "Pandas", "NumPy", "Excel", "Power BI", "Spark"]
+ROLES = ["NLP Engineer", "Data Scientist", "ML Engineer", "AI Research Assistant", "Backend Developer"]
+LANGUAGES = ["Python", "JavaScript", "SQL", "Java", "Go", "C++"]
+
+
+def make_profile_dicts(count: int, seed: int = 0) -> list:
+    """반복되는 스킬/직무 문자열을 가진 합성 프로필 dict 생성"""
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(count):
+        profiles.append(UserContext(
+            name=f"Candidate {i}",
+            target_roles=rng.sample(ROLES, 2),
+            skills=rng.sample(SKILLS, 6),
+            programming_languages=rng.sample(LANGUAGES, 2),
+            languages={"Korean": "Native", "English": "Fluent"},
+            work_preference=["Remote", "Hybrid"],
+            education_level="Master's",
+            major="Computer Science",
+            experience_by_industry={"AI/NLP": rng.randint(0, 10)},
+            projects=[{"name": f"Project {i}", "description": "RAG chatbot", "tech_stack": "Python, FastAPI", "organization": ""}],
+            certifications=["AWS Certified"],
+            location_preference=["Seoul"],
+            additional_notes="",
+        ).to_dict())
+    return profiles
+
+
+def measure_memory(factory, payloads: list) -> float:
+    """JSON 문자열에서 객체 목록을 만들었을 때 남아 있는 메모리 (MB, 파싱된 dict는 버려짐)"""
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(json.loads(payload)) for payload in payloads]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / (1024 * 1024)
+
+
+def measure_seconds(func, items: list, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark UserContext representations")
+    parser.add_argument("--profiles", type=int, default=20000)
+    args = parser.parse_args()
+
+    dicts = make_profile_dicts(args.profiles)
+    payloads = [json.dumps(d, ensure_ascii=False) for d in dicts]
+
+    dataclass_mb = measure_memory(UserContext.from_dict, payloads)
+    compact_mb = measure_memory(CompactUserContext.from_dict, payloads)
+
+    contexts = [UserContext.from_dict(d) for d in dicts]
+    compacts = [CompactUserContext.from_dict(d) for d in dicts]
+
+    asdict_s = measure_seconds(asdict, contexts)
+    to_dict_s = measure_seconds(UserContext.to_dict, contexts)
+    compact_to_dict_s = measure_seconds(CompactUserContext.to_dict, compacts)
+
+    print(f"profiles: {args.profiles}")
+    print(f"{'representation':<28}{'memory (MB)':>12}")
+    print(f"{'UserContext (dataclass)':<28}{dataclass_mb:>12.1f}")
+    print(f"{'CompactUserContext':<28}{compact_mb:>12.1f}")
+    print()
+    print(f"{'serializer':<28}{'total (ms)':>12}{'per profile (µs)':>18}")
+    for label, seconds in [("dataclasses.asdict", asdict_s),
+                           ("UserContext.to_dict", to_dict_s),
+                           ("CompactUserContext.to_dict", compact_to_dict_s)]:
+        print(f"{label:<28}{seconds * 1000:>12.1f}{seconds / args.profiles * 1e6:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""벤치마크용 OpenAI 대체 클라이언트 (네트워크 호출 없이 고정 응답 반환)
+
+JobMatcher/FeedbackGenerator가 사용하는 `client.chat.completions.create(...)`
+형태만 흉내 내며, 시스템 프롬프트를 보고 각 호출 유형에 맞는 응답을 돌려준다.
+"""
+import time
+import threading
+from types import SimpleNamespace
+from typing import Dict, List
+
+# provider prompt 캐시 흉내: 이 토큰 수 이상인 prefix만 캐시되고 128토큰 단위로 적중
+PROMPT_CACHE_MIN_TOKENS = 1024
+PROMPT_CACHE_BLOCK_TOKENS = 128
+
+CANNED_FEEDBACK = """**전체 평가:**
+공고의 주요 요구조건인 Python 기반 개발 경험과 언어 모델 활용 경험을 충족하여 적합도가 높습니다.
+
+**강점:**
+RAG 챗봇 프로젝트와 Transformers 활용 경험이 공고의 핵심 업무와 직접 연결됩니다.
+
+**개선점:**
+컨테이너 기반 배포 경험이 공고 요구 수준에 비해 부족합니다.
+
+**추천사항:**
+지원을 권장하며, 배포 경험을 보완할 수 있는 사례를 준비하세요.
+
+**Action Plan:**
+1. 기존 챗봇 프로젝트를 Docker 이미지로 패키징
+2. 배포 과정과 성능 지표를 README에 정리
+3. 면접용 RAG 설계 사례 1페이지 요약 작성
+
+**매칭 근거:**
+Python, Transformers, RAG 경험 ↔ 공고의 LLM 서비스 개발 요구사항"""
+
+
+def canned_completion(messages: List[Dict[str, str]]) -> str:
+    """요청 메시지로 호출 유형을 판별해 고정 응답 반환"""
+    system = next((m.get("content", "") for m in messages if m.get("role") == "system"), "")
+    if "required skills that candidates lack" in system:
+        return "Docker, Kubernetes"
+    if "Return only a number" in system:
+        return "0.7"
+    return CANNED_FEEDBACK
+
+
+class PromptCacheSimulator:
+    """마지막 메시지를 제외한 prefix가 이전 요청과 같으면 cached_tokens를 돌려주는 단순 캐시"""
+
+    def __init__(self):
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def cached_tokens(self, messages: List[Dict[str, str]]) -> int:
+        prefix = tuple((m.get("role", ""), m.get("content", "")) for m in messages[:-1])
+        prefix_tokens = sum(len(content) for _, content in prefix) // 4
+        if prefix_tokens < PROMPT_CACHE_MIN_TOKENS:
+            return 0
+        with self._lock:
+            if prefix in self._seen:
+                return prefix_tokens // PROMPT_CACHE_BLOCK_TOKENS * PROMPT_CACHE_BLOCK_TOKENS
+            self._seen.add(prefix)
+        return 0
+
+
+class _Completions:
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+        self.calls = 0
+        self.prompt_cache = PromptCacheSimulator()
+
+    def create(self, model: str, messages: List[Dict[str, str]], **kwargs):
+        self.calls += 1
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        content = canned_completion(messages)
+        prompt_chars = sum(len(m.get("content", "")) for m in messages)
+        return SimpleNamespace(
+            model=model,
+            choices=[SimpleNamespace(index=0, finish_reason="stop",
+                                     message=SimpleNamespace(role="assistant", content=content))],
+            usage=SimpleNamespace(prompt_tokens=prompt_chars // 4, completion_tokens=len(content) // 4,
+                                  total_tokens=(prompt_chars + len(content)) // 4,
+                                  prompt_tokens_details=SimpleNamespace(
+                                      cached_tokens=self.prompt_cache.cached_tokens(messages))),
+        )
+
+
+class FakeOpenAI:
+    """`OpenAI()` 클라이언트 대체 (latency_s: 호출당 고정 지연)"""
+
+    def __init__(self, latency_s: float = 0.0):
+        self.chat = SimpleNamespace(completions=_Completions(latency_s))
@@ -0,0 +1,167 @@
+"""로컬 OpenAI 호환 stub 서버 (chat completions 엔드포인트)
+
+실제 API 대신 고정 응답을 돌려주며, 응답 지연 분포와 오류 비율을 조절할 수 있어
+동시성/캐시/타임아웃 동작을 네트워크와 비용 없이 부하 테스트할 수 있다.
+
+사용법:
+    python benchmarks/openai_stub_server.py --port 8787 --latency lognormal --latency-ms 400 --error-rate 0.05
+    export OPENAI_BASE_URL=http://127.0.0.1:8787/v1   # openai 클라이언트가 자동으로 사용
+    python benchmarks/run_benchmarks.py --openai-base-url http://127.0.0.1:8787/v1
+"""
+import os
+import sys
+import json
+import time
+import math
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_openai import canned_completion, PromptCacheSimulator
+
+
+class StubConfig:
+    """지연 분포와 오류 주입 설정"""
+
+    def __init__(self, latency: str = "fixed", latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 500, seed: Optional[int] = None):
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample_latency(self) -> float:
+        """요청 하나의 지연 시간 (초)"""
+        with self._lock:
+            if self.latency == "uniform":
+                value = self._rng.uniform(max(0.0, self.latency_ms - self.jitter_ms), self.latency_ms + self.jitter_ms)
+            elif self.latency == "lognormal":
+                # latency_ms를 중앙값으로 하는 긴 꼬리 분포 (jitter_ms는 sigma로 환산)
+                sigma = self.jitter_ms / self.latency_ms if self.latency_ms and self.jitter_ms else 0.5
+                value = self.latency_ms * math.exp(self._rng.gauss(0.0, sigma))
+            else:
+                value = self.latency_ms
+        return value / 1000
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            return self._rng.random() < self.error_rate
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    config: StubConfig = StubConfig()
+    prompt_cache: PromptCacheSimulator = PromptCacheSimulator()
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        # 부하 테스트 중 요청마다 stderr에 찍히지 않도록 비활성화
+        pass
+
+    def _send_json(self, status: int, payload: dict, headers: Optional[dict] = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {"object": "list", "data": [
+                {"id": model, "object": "model", "created": 0, "owned_by": "stub"}
+                for model in ("gpt-3.5-turbo", "gpt-4o-mini")
+            ]})
+        else:
+            self._send_json(404, {"error": {"message": "not found", "type": "invalid_request_error"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": {"message": "invalid JSON body", "type": "invalid_request_error"}})
+            return
+
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found", "type": "invalid_request_error"}})
+            return
+
+        time.sleep(self.config.sample_latency())
+
+        if self.config.should_fail():
+            status = self.config.error_status
+            error_type = "rate_limit_exceeded" if status == 429 else "server_error"
+            headers = {"Retry-After": "1"} if status == 429 else None
+            self._send_json(status, {"error": {"message": f"stub injected {status}", "type": error_type}}, headers)
+            return
+
+        messages = request.get("messages", [])
+        content = canned_completion(messages)
+        prompt_tokens = sum(len(m.get("content", "")) for m in messages) // 4
+        completion_tokens = len(content) // 4
+        self._send_json(200, {
+            "id": f"chatcmpl-stub-{time.time_ns()}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "gpt-3.5-turbo"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": self.prompt_cache.cached_tokens(messages)},
+            },
+        })
+
+
+def start_stub_server(host: str = "127.0.0.1", port: int = 0, config: Optional[StubConfig] = None) -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 stub 서버 시작 (port=0이면 빈 포트 자동 선택)
+
+    반환된 서버의 base URL: f"http://{host}:{server.server_address[1]}/v1", 종료는 server.shutdown()
+    """
+    handler = type("ConfiguredStubHandler", (StubHandler,),
+                   {"config": config or StubConfig(), "prompt_cache": PromptCacheSimulator()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI-compatible chat completions stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="fixed")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="fixed value / uniform center / lognormal median")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="uniform half-width / lognormal spread")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=500, choices=[429, 500, 502, 503])
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    StubHandler.config = StubConfig(args.latency, args.latency_ms, args.jitter_ms,
+                                    args.error_rate, args.error_status, args.seed)
+    server = ThreadingHTTPServer((args.host, args.port), StubHandler)
+    server.daemon_threads = True
+    print(f"OpenAI stub listening on http://{args.host}:{args.port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
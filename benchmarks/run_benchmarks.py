@@ -0,0 +1,321 @@
+"""매칭/추출/피드백 파이프라인 벤치마크 (오프라인 fixture 사용)
+
+benchmarks/fixtures/pages의 한국어/영어 채용 공고 HTML과 합성 프로필로
+각 단계를 반복 실행하여 호출당 p50/p95 지연과 처리량을 측정한다.
+OpenAI 호출은 benchmarks/fake_openai.py의 고정 응답 클라이언트로 대체되며,
+--openai-base-url을 주면 실제 openai 클라이언트로 stub 서버(openai_stub_server.py)를 호출한다.
+URL 수집 경로는 fixture 페이지를 녹화 응답으로 가져온 replay transport로 실행된다.
+
+사용법:
+    python benchmarks/run_benchmarks.py                          # 전체 실행
+    python benchmarks/run_benchmarks.py --only keyword_score extract_html
+    python benchmarks/run_benchmarks.py --json results.json      # 결과 저장
+    python benchmarks/run_benchmarks.py --baseline results.json  # p95가 기준보다 느려지면 exit 1
+    python benchmarks/run_benchmarks.py --openai-base-url http://127.0.0.1:8787/v1
+    python benchmarks/run_benchmarks.py --only extract_url_replay --replay-latency-ms 150
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import functools
+import tempfile
+import statistics
+from typing import Callable, Dict, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.fake_openai import FakeOpenAI
+
+FIXTURE_DIR = os.path.join(ROOT_DIR, "benchmarks", "fixtures", "pages")
+FIXTURE_BASE_URL = "https://fixtures.local/jobs/"
+
+SKILLS = ["Python", "PyTorch", "TensorFlow", "Transformers", "RAG", "LLM", "SQL", "Docker",
+          "Kubernetes", "AWS", "FastAPI", "Pandas", "NumPy", "Excel", "Power BI", "Tableau",
+          "파이썬", "엑셀", "Spark", "BigQuery", "React", "Node.js", "PostgreSQL", "MongoDB"]
+ROLES = ["NLP Engineer", "Data Scientist", "ML Engineer", "Data Analyst", "Backend Developer",
+         "AI Research Assistant", "데이터 분석가"]
+LANGUAGES = ["Python", "JavaScript", "SQL", "Java", "Go", "R"]
+INDUSTRIES = ["AI/NLP", "Data Science", "Commerce", "Finance", "Web Development"]
+
+
+def load_pages() -> Dict[str, bytes]:
+    """fixture HTML 파일 로드 (파일명 → 원본 바이트)"""
+    pages = {}
+    for filename in sorted(os.listdir(FIXTURE_DIR)):
+        if filename.endswith(".html"):
+            with open(os.path.join(FIXTURE_DIR, filename), "rb") as f:
+                pages[filename] = f.read()
+    return pages
+
+
+def make_profiles(count: int, seed: int = 0) -> list:
+    """재현 가능한 합성 프로필 생성"""
+    from utils.mcp_schema import UserContext
+
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(count):
+        profiles.append(UserContext(
+            name=f"Candidate {i}",
+            target_roles=rng.sample(ROLES, 2),
+            skills=rng.sample(SKILLS, rng.randint(4, 10)),
+            programming_languages=rng.sample(LANGUAGES, 2),
+            languages={"Korean": "Native", "English": rng.choice(["Fluent", "Business", "Basic"])},
+            work_preference=["Remote", "Hybrid"],
+            education_level=rng.choice(["Bachelor's", "Master's", "PhD"]),
+            major="Computer Science",
+            experience_by_industry={rng.choice(INDUSTRIES): rng.randint(0, 8)},
+            projects=[{"name": f"Project {i}", "description": "RAG 기반 사내 문서 검색 챗봇",
+                       "tech_stack": "Python, FastAPI, Transformers", "organization": ""}],
+            certifications=rng.sample(["AWS Certified", "SQLD", "ADsP", "TOEIC 900"], 1),
+            location_preference=["Seoul"],
+            additional_notes=rng.choice(["", "LLM 서비스 개발에 관심이 많습니다.", "Interested in search and ranking."]),
+        ))
+    return profiles
+
+
+def percentile(values: List[float], q: float) -> float:
+    """선형 보간 백분위수"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def run_case(name: str, func: Callable, inputs: list, iterations: int, warmup: int) -> dict:
+    """입력을 순환하며 func 호출, 호출별 지연 측정"""
+    for i in range(warmup):
+        func(inputs[i % len(inputs)])
+
+    latencies = []
+    start = time.perf_counter()
+    for i in range(iterations):
+        call_start = time.perf_counter()
+        func(inputs[i % len(inputs)])
+        latencies.append((time.perf_counter() - call_start) * 1000)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'name': name,
+        'calls': iterations,
+        'p50_ms': percentile(latencies, 0.5),
+        'p95_ms': percentile(latencies, 0.95),
+        'mean_ms': statistics.fmean(latencies),
+        'throughput_per_s': iterations / elapsed if elapsed else float('inf'),
+    }
+
+
+def setup_replay_archive(replay_latency_ms: float) -> List[str]:
+    """fixture 페이지를 임시 아카이브로 가져오고 replay 모드로 전환, 재현할 URL 목록 반환"""
+    from utils.http_transport import configure_transport, import_html_dir
+
+    archive_dir = tempfile.mkdtemp(prefix="bench_http_archive_")
+    import_html_dir(FIXTURE_DIR, FIXTURE_BASE_URL, archive_dir=archive_dir)
+    configure_transport("replay", archive_dir, replay_latency=replay_latency_ms)
+    return [FIXTURE_BASE_URL + filename for filename in sorted(os.listdir(FIXTURE_DIR)) if filename.endswith(".html")]
+
+
+def lazy(factory: Callable):
+    """처음 호출할 때 한 번만 만들고 이후에는 같은 값을 돌려주는 인자 없는 함수"""
+    return functools.lru_cache(maxsize=None)(factory)
+
+
+def build_cases(profiles: list, pages: Dict[str, bytes], openai_latency_s: float,
+                openai_base_url: Optional[str] = None, replay_latency_ms: float = 0.0) -> Dict[str, Callable[[], tuple]]:
+    """벤치마크 이름 → (함수, 입력 목록)을 만드는 함수
+
+    입력과 매처는 선택된 벤치마크를 실행할 때 처음 만들어진다. 그래서 --only로 고른 항목만
+    준비 비용을 치르고, replay transport 전환도 extract_url_replay를 실행할 때만 일어난다.
+    """
+    from utils.extract_text import parse_job_html
+
+    job_texts = lazy(lambda: [parse_job_html(content)[0] for content in pages.values()])
+    pairs = lazy(lambda: [(profile, job_text) for profile in profiles for job_text in job_texts()])
+
+    def cold(func):
+        # 구성요소/공고 임베딩 캐시를 비우고 호출 (반복 입력이 캐시 적중으로 측정되지 않도록)
+        from utils.match_score import clear_score_caches
+
+        def run(item):
+            clear_score_caches()
+            return func(item)
+        return run
+
+    # 키워드 전용 매처 (OpenAI 없음)
+    @lazy
+    def keyword_matcher():
+        from utils.match_score import JobMatcher
+        return JobMatcher()
+
+    # AI 경로 매처와 피드백 생성기 (고정 응답 클라이언트, 또는 stub 서버를 실제 HTTP 클라이언트로 호출)
+    @lazy
+    def ai_matcher():
+        from utils.match_score import JobMatcher
+        if openai_base_url:
+            return JobMatcher(api_key="stub", base_url=openai_base_url)
+        matcher = JobMatcher()
+        matcher.openai_client = FakeOpenAI(latency_s=openai_latency_s)
+        return matcher
+
+    @lazy
+    def feedback_generator():
+        from utils.feedback import FeedbackGenerator
+        if openai_base_url:
+            return FeedbackGenerator(api_key="stub", base_url=openai_base_url)
+        generator = FeedbackGenerator()
+        generator.client = FakeOpenAI(latency_s=openai_latency_s)
+        return generator
+
+    def pair_case(matcher_factory, method_name: str):
+        # (프로필, 공고) 쌍마다 캐시를 비우고 매처 메서드 호출 (매처는 측정 구간 밖에서 준비)
+        method = getattr(matcher_factory(), method_name)
+        return cold(lambda pair: method(*pair)), pairs()
+
+    def lexical_prefilter():
+        matcher = keyword_matcher()
+        texts = job_texts()
+        return (lambda profile: matcher.prefilter_jobs(profile, texts, top_k=3)), profiles
+
+    def extract_url_replay():
+        from utils.extract_text import extract_text_from_url
+        return extract_text_from_url, setup_replay_archive(replay_latency_ms)
+
+    def extract_requirements_case():
+        from utils.requirements import extract_requirements
+        return extract_requirements.__wrapped__, job_texts()
+
+    def normalize_case():
+        from utils.text_normalize import normalize
+        return normalize.__wrapped__, job_texts()
+
+    def skill_variations():
+        skills = sorted({skill.lower() for profile in profiles
+                         for skill in profile.skills + profile.programming_languages})
+        return keyword_matcher()._get_skill_variations, skills
+
+    def lexical_fallback():
+        from utils.lexical_index import LexicalIndex
+        # 어휘 인덱스는 고정 공고 코퍼스로 미리 채움 (IDF 갱신 비용이 매 반복에 섞이지 않도록)
+        lexical_index = LexicalIndex()
+        lexical_index.add_many(job_texts())
+        matcher = keyword_matcher()
+        return (lambda pair: lexical_index.similarity(matcher._context_to_text(pair[0]), pair[1])), pairs()
+
+    def score_pairs_batch():
+        # 공고 수만큼 묶은 배치
+        size = len(job_texts())
+        batches = [pairs()[start:start + size] for start in range(0, len(pairs()), size)]
+        return cold(keyword_matcher().score_pairs), batches
+
+    def reweight_components():
+        from utils.score_cache import ScoreInputs
+        from utils.scoring import SCORING_COMPONENTS, SCORING_WEIGHTS, ScoringWeights
+        # 한 번 계산한 구성요소 행렬에 가중치만 바꿔 집계 (A/B)
+        component_names = SCORING_COMPONENTS.names('keyword') + SCORING_COMPONENTS.names('embedding')
+        component_matrix, _ = SCORING_COMPONENTS.compute(keyword_matcher(), [ScoreInputs(*pair) for pair in pairs()],
+                                                         component_names)
+        weight_variants = [ScoringWeights(keyword=SCORING_WEIGHTS.keyword,
+                                          blend={'keyword': blend, 'embedding': 1 - blend})
+                           for blend in (0.5, 0.6, 0.7, 0.8, 0.9)]
+        return (lambda weights: SCORING_COMPONENTS.aggregate(component_matrix, component_names, weights),
+                weight_variants)
+
+    def rescore_one_field():
+        from dataclasses import replace
+        # 프로필 한 필드(자격증)만 바꾼 변형들: 나머지 구성요소는 캐시 재사용
+        rescore_inputs = [(replace(profiles[0], certifications=[f"Certificate {i}"]), job_texts()[0])
+                          for i in range(1000)]
+        matcher = keyword_matcher()
+        return (lambda pair: matcher.calculate_overall_score(*pair)), rescore_inputs
+
+    def feedback():
+        matcher = keyword_matcher()
+        feedback_inputs = [(profile, job_text, matcher.calculate_overall_score(profile, job_text))
+                           for profile, job_text in pairs()[:len(job_texts()) * 2]]
+        generator = feedback_generator()
+        return (lambda item: generator.generate_feedback(item[0], item[1], item[2], "Benchmark")), feedback_inputs
+
+    return {
+        'extract_html': lambda: (parse_job_html, list(pages.values())),
+        'extract_url_replay': extract_url_replay,
+        'extract_requirements': extract_requirements_case,
+        'normalize_job_text': normalize_case,
+        'skill_variations': skill_variations,
+        'keyword_score': lambda: pair_case(keyword_matcher, 'calculate_keyword_score'),
+        'embedding_similarity': lambda: pair_case(keyword_matcher, 'calculate_embedding_similarity'),
+        'overall_score': lambda: pair_case(keyword_matcher, 'calculate_overall_score'),
+        'overall_score_ai': lambda: pair_case(ai_matcher, 'calculate_overall_score'),
+        'lexical_prefilter': lexical_prefilter,
+        'lexical_fallback': lexical_fallback,
+        'score_pairs_batch': score_pairs_batch,
+        'reweight_components': reweight_components,
+        'rescore_one_field': rescore_one_field,
+        'feedback': feedback,
+    }
+
+
+def compare_with_baseline(results: List[dict], baseline_path: str, tolerance: float) -> List[str]:
+    """기준 결과 대비 p95가 tolerance 이상 느려진 항목 목록"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {item['name']: item for item in json.load(f)['results']}
+
+    regressions = []
+    for result in results:
+        reference = baseline.get(result['name'])
+        if reference and result['p95_ms'] > reference['p95_ms'] * (1 + tolerance):
+            regressions.append(f"{result['name']}: p95 {reference['p95_ms']:.2f} ms -> {result['p95_ms']:.2f} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark matching, extraction and feedback on offline fixtures")
+    parser.add_argument("--only", nargs="+", help="benchmark names to run")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--profiles", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--openai-latency-ms", type=float, default=0.0, help="simulated latency per fake OpenAI call")
+    parser.add_argument("--openai-base-url", help="call an OpenAI-compatible stub server instead of the in-process fake")
+    parser.add_argument("--replay-latency-ms", type=float, default=0.0, help="simulated latency per replayed HTTP response")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare p95 against a previous --json result")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 slowdown vs baseline (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    cases = build_cases(make_profiles(args.profiles, args.seed), load_pages(), args.openai_latency_ms / 1000,
+                        args.openai_base_url, args.replay_latency_ms)
+    names = args.only or list(cases)
+    unknown = [name for name in names if name not in cases]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)} (available: {', '.join(cases)})")
+
+    results = []
+    print(f"{'benchmark':<24}{'calls':>8}{'p50 (ms)':>12}{'p95 (ms)':>12}{'mean (ms)':>12}{'ops/s':>12}")
+    for name in names:
+        func, inputs = cases[name]()
+        result = run_case(name, func, inputs, args.iterations, args.warmup)
+        results.append(result)
+        print(f"{name:<24}{result['calls']:>8}{result['p50_ms']:>12.3f}{result['p95_ms']:>12.3f}"
+              f"{result['mean_ms']:>12.3f}{result['throughput_per_s']:>12.1f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({'created_at': time.time(), 'args': vars(args), 'results': results}, f, indent=2)
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
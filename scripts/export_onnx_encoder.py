@@ -0,0 +1,67 @@
+"""all-MiniLM-L6-v2를 ONNX로 내보내고 선택적으로 int8 동적 양자화
+
+사용법:
+    python scripts/export_onnx_encoder.py --output models/all-MiniLM-L6-v2-onnx --quantize
+
+내보낸 디렉토리는 EMBEDDING_BACKEND=onnx (또는 onnx-int8) 와
+EMBEDDING_ONNX_DIR 환경변수로 JobMatcher에서 사용한다.
+"""
+import os
+import argparse
+
+MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
+
+
+def export_onnx_encoder(output_dir: str, quantize: bool = False, opset: int = 14) -> None:
+    """트랜스포머 본체를 ONNX로 내보내고 토크나이저를 함께 저장"""
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
+    model = AutoModel.from_pretrained(MODEL_NAME)
+    model.eval()
+
+    # tokenizer.json (fast tokenizer) 저장 - OnnxEncoder가 tokenizers 라이브러리로 직접 로드
+    tokenizer.save_pretrained(output_dir)
+
+    sample = tokenizer(["job matcher onnx export"], return_tensors="pt")
+    model_path = os.path.join(output_dir, "model.onnx")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (sample["input_ids"], sample["attention_mask"], sample["token_type_ids"]),
+            model_path,
+            input_names=["input_ids", "attention_mask", "token_type_ids"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "token_type_ids": {0: "batch", 1: "sequence"},
+                "last_hidden_state": {0: "batch", 1: "sequence"},
+            },
+            opset_version=opset,
+        )
+    print(f"Exported {model_path}")
+
+    if quantize:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+
+        quantized_path = os.path.join(output_dir, "model_quantized.onnx")
+        quantize_dynamic(model_path, quantized_path, weight_type=QuantType.QInt8)
+        print(f"Quantized {quantized_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the embedding model to ONNX")
+    parser.add_argument("--output", default="models/all-MiniLM-L6-v2-onnx", help="output directory")
+    parser.add_argument("--quantize", action="store_true", help="also write an int8 dynamically quantized model")
+    parser.add_argument("--opset", type=int, default=14)
+    args = parser.parse_args()
+
+    export_onnx_encoder(args.output, quantize=args.quantize, opset=args.opset)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""utils.chunk_text 임베딩 창 분할 회귀 테스트"""
+from utils.chunk_text import chunk_job_text
+
+
+def count_chars(text: str) -> int:
+    # 글자 하나를 토큰 하나로 세는 테스트용 토크나이저
+    return len(text)
+
+
+def test_windows_fit_token_budget():
+    text = " ".join(f"문장 {i}번은 파이썬과 머신러닝 경험을 설명합니다." for i in range(40))
+    chunks = chunk_job_text(text, max_tokens=60, count_tokens=count_chars)
+    assert len(chunks) > 1
+    assert all(count_chars(chunk) <= 60 for chunk in chunks)
+
+
+def test_over_long_word_is_hard_split():
+    text = "가" * 1200
+    chunks = chunk_job_text(text, max_tokens=100, count_tokens=count_chars, max_chunks=100)
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert "".join(chunks) == text
+
+
+def test_windows_overlap_within_section():
+    text = "첫째 문장. 둘째 문장. 셋째 문장. 넷째 문장."
+    chunks = chunk_job_text(text, max_tokens=14, count_tokens=count_chars, overlap_tokens=6)
+    assert chunks[1].startswith(chunks[0].split(" ")[-2])
+
+
+def test_section_header_starts_new_window_without_overlap():
+    chunks = chunk_job_text("자격요건 Python 3년 이상. 우대사항 Kaggle 입상.", count_tokens=count_chars)
+    assert chunks == ["자격요건 Python 3년 이상.", "우대사항 Kaggle 입상."]
@@ -0,0 +1,149 @@
+"""utils.circuit_breaker 상태 전환 / 적응형 timeout 테스트"""
+import pytest
+from utils import circuit_breaker
+from utils.circuit_breaker import CLOSED, OPEN, HALF_OPEN, CircuitBreaker, CircuitOpenError, host_breaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", fake)
+    return fake
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    options = dict(min_calls=4, failure_threshold=0.5, cooldown_s=30.0)
+    options.update(kwargs)
+    return CircuitBreaker("test", **options)
+
+
+def open_breaker(breaker: CircuitBreaker) -> None:
+    while breaker.state != OPEN:
+        assert breaker.allow()
+        breaker.record(False, 0.1)
+
+
+def test_opens_when_failure_rate_reaches_threshold(clock):
+    breaker = make_breaker()
+    breaker.record(True, 0.1)
+    breaker.record(True, 0.1)
+    breaker.record(False, 0.1)
+    assert breaker.state == CLOSED
+    breaker.record(False, 0.1)
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert not breaker.is_available()
+
+
+def test_stays_closed_below_min_calls(clock):
+    breaker = make_breaker()
+    for _ in range(breaker.min_calls - 1):
+        breaker.record(False, 0.1)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_allows_single_probe_after_cooldown(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock.now += 29.0
+    assert not breaker.allow()
+    assert breaker.retry_in() == pytest.approx(1.0)
+
+    clock.now += 1.0
+    assert breaker.is_available()
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    # 시험 호출이 끝나기 전에는 다른 호출을 막음
+    assert not breaker.allow()
+
+
+def test_successful_probe_closes_and_keeps_success_latencies(clock):
+    breaker = make_breaker()
+    breaker.record(True, 0.2)
+    breaker.record(True, 0.2)
+    breaker.record(False, 0.1)
+    breaker.record(False, 0.1)
+    clock.now += 30.0
+    assert breaker.allow()
+    breaker.record(True, 0.3)
+    assert breaker.state == CLOSED
+    assert all(ok for _, ok in breaker.calls)
+    assert len(breaker.calls) == 3
+
+
+def test_failed_probe_reopens(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock.now += 30.0
+    assert breaker.allow()
+    breaker.record(False, 0.1)
+    assert breaker.state == OPEN
+    assert breaker.opened_at == clock.now
+    assert not breaker.allow()
+
+
+def test_release_returns_probe_slot_without_recording(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    calls = len(breaker.calls)
+    clock.now += 30.0
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == HALF_OPEN
+    assert len(breaker.calls) == calls
+    assert breaker.allow()
+
+
+def test_guard_records_and_raises_when_open(clock):
+    breaker = make_breaker()
+    with breaker.guard():
+        pass
+    with pytest.raises(RuntimeError):
+        with breaker.guard():
+            raise RuntimeError("boom")
+    assert [ok for _, ok in breaker.calls] == [True, False]
+
+    open_breaker(breaker)
+    with pytest.raises(CircuitOpenError) as error:
+        with breaker.guard():
+            pass
+    assert error.value.name == "test"
+
+
+def test_timeout_defaults_until_enough_successes():
+    breaker = make_breaker(default_timeout=20.0, min_timeout=3.0, max_timeout=30.0)
+    for _ in range(breaker.min_calls - 1):
+        breaker.record(True, 1.0)
+    breaker.record(False, 50.0)
+    assert breaker.timeout() == 20.0
+
+
+def test_timeout_is_p95_of_successes_times_multiplier():
+    breaker = make_breaker(min_timeout=1.0, max_timeout=100.0, timeout_multiplier=1.5, window=100)
+    for latency in range(1, 21):
+        breaker.record(True, float(latency))
+    # 20개 중 p95 = 정렬 후 인덱스 int(20 × 0.95) = 19 → 20초
+    assert breaker.timeout() == pytest.approx(30.0)
+
+
+def test_timeout_is_clamped():
+    fast = make_breaker(min_timeout=3.0, max_timeout=30.0)
+    slow = make_breaker(min_timeout=3.0, max_timeout=30.0)
+    for _ in range(10):
+        fast.record(True, 0.01)
+        slow.record(True, 100.0)
+    assert fast.timeout() == 3.0
+    assert slow.timeout() == 30.0
+
+
+def test_host_breaker_is_shared_per_host():
+    assert host_breaker("https://Example.com/jobs/1") is host_breaker("https://example.com/jobs/2")
+    assert host_breaker("https://example.com/") is not host_breaker("https://other.example.com/")
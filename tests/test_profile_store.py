@@ -0,0 +1,103 @@
+"""utils.profile_store / mcp_schema 저장·로드 테스트"""
+import json
+import logging
+import os
+import pytest
+from utils import profile_store
+from utils.mcp_schema import UserContext, save_user_context, load_user_context, delete_user_context, list_saved_contexts
+from utils.profile_store import ProfileStore, get_profile_store
+
+
+def make_context(name: str, skills=None) -> UserContext:
+    return UserContext(name=name, target_roles=["NLP Engineer"], skills=skills or ["Python"],
+                       programming_languages=["Python"], languages={"한국어": "Native"}, work_preference=["Remote"])
+
+
+def write_json(directory, filename: str, context: UserContext) -> None:
+    with open(os.path.join(directory, filename), 'w', encoding='utf-8') as f:
+        json.dump(context.to_dict(), f, ensure_ascii=False)
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # 상대 경로(data/...)를 쓰는 저장/로드 함수를 임시 디렉토리에서 실행하고 전역 저장소를 새로 연다
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(profile_store, "_store", None)
+    os.makedirs("data/user_contexts")
+    yield tmp_path
+    if profile_store._store is not None:
+        profile_store._store.close()
+
+
+def test_upsert_get_delete(tmp_path):
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+    store.upsert("kim_context.json", make_context("Kim"))
+    assert store.get("kim_context.json").name == "Kim"
+    assert store.list_filenames() == ["kim_context.json"]
+    assert store.delete("kim_context.json")
+    assert store.get("kim_context.json") is None
+    assert store.count() == 0
+    store.close()
+
+
+def test_sync_imports_only_new_or_edited_files(tmp_path):
+    data_dir = tmp_path / "json"
+    data_dir.mkdir()
+    write_json(data_dir, "kim_context.json", make_context("Kim"))
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+
+    assert store.sync_json_dir(str(data_dir)) == 1
+    assert store.sync_json_dir(str(data_dir)) == 0
+
+    write_json(data_dir, "kim_context.json", make_context("Kim", skills=["Python", "PyTorch", "Transformers"]))
+    assert store.sync_json_dir(str(data_dir)) == 1
+    assert store.get("kim_context.json").skills == ["Python", "PyTorch", "Transformers"]
+
+    # 저장소가 원본이므로 내보낸 파일이 사라져도 프로필은 유지
+    os.remove(data_dir / "kim_context.json")
+    assert store.sync_json_dir(str(data_dir)) == 0
+    assert store.get("kim_context.json") is not None
+    store.close()
+
+
+def test_unreadable_file_is_warned_once(tmp_path, caplog):
+    data_dir = tmp_path / "json"
+    data_dir.mkdir()
+    (data_dir / "broken_context.json").write_text("{not json", encoding='utf-8')
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+
+    with caplog.at_level(logging.WARNING, logger="utils.profile_store"):
+        store.sync_json_dir(str(data_dir))
+        store.sync_json_dir(str(data_dir))
+    assert sum("broken_context.json" in record.getMessage() for record in caplog.records) == 1
+    assert store.count() == 0
+    store.close()
+
+
+def test_save_writes_store_then_exports_json(workdir):
+    path = save_user_context(make_context("Lee"))
+    assert os.path.exists(path)
+    assert list_saved_contexts() == ["Lee_context.json"]
+    assert load_user_context("Lee_context.json").name == "Lee"
+
+    # 내보낸 파일은 다음 시작 때 다시 가져오지 않음
+    assert get_profile_store().sync_json_dir() == 0
+
+
+def test_load_reflects_new_save(workdir):
+    save_user_context(make_context("Lee"))
+    assert load_user_context("Lee_context.json").skills == ["Python"]
+    save_user_context(make_context("Lee", skills=["Python", "SQL"]))
+    assert load_user_context("Lee_context.json").skills == ["Python", "SQL"]
+
+
+def test_startup_imports_existing_json(workdir):
+    write_json("data/user_contexts", "park_context.json", make_context("Park"))
+    assert load_user_context("park_context.json").name == "Park"
+
+
+def test_delete_removes_store_row_and_export(workdir):
+    path = save_user_context(make_context("Choi"))
+    assert delete_user_context("Choi_context.json")
+    assert not os.path.exists(path)
+    assert load_user_context("Choi_context.json") is None
@@ -0,0 +1,15 @@
+"""utils.prompt_budget 자르기 회귀 테스트"""
+from utils.prompt_budget import truncate_to_tokens, count_tokens
+
+
+def test_dense_hangul_keeps_longest_fitting_prefix():
+    text = "가" * 50
+    truncated = truncate_to_tokens(text, 10)
+    assert truncated
+    assert text.startswith(truncated)
+    assert count_tokens(truncated) <= 10
+    assert count_tokens(text[:len(truncated) + 1]) > 10
+
+
+def test_text_within_budget_is_unchanged():
+    assert truncate_to_tokens("첫 문장입니다. 둘째 문장.", 100) == "첫 문장입니다. 둘째 문장."
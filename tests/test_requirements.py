@@ -0,0 +1,48 @@
+"""utils.requirements 추출 회귀 테스트"""
+import pytest
+from utils.requirements import extract_requirements, degree_rank
+
+
+@pytest.mark.parametrize("text", [
+    "founded 2015 years ago",
+    "2023-2024 year plan",
+    "100 years old company",
+])
+def test_years_ignore_longer_numbers(text):
+    assert extract_requirements(text).min_years is None
+
+
+@pytest.mark.parametrize("text, min_years, max_years", [
+    ("3~5년 경력", 3, 5),
+    ("5+ years of Python", 5, None),
+    ("3년 이상", 3, None),
+])
+def test_years(text, min_years, max_years):
+    requirements = extract_requirements(text)
+    assert (requirements.min_years, requirements.max_years) == (min_years, max_years)
+
+
+@pytest.mark.parametrize("text", [
+    "mastery of SQL",
+    "Scrum Master wanted",
+    "team.s lead",
+])
+def test_degree_ignores_non_degree_words(text):
+    assert extract_requirements(text).degree_level is None
+
+
+@pytest.mark.parametrize("text, level", [
+    ("M.S. in Computer Science", 2),
+    ("B.S. or Master's degree", 1),
+    ("Ph.D. 우대", 3),
+    ("학사 이상, 석사 우대", 1),
+])
+def test_degree(text, level):
+    assert extract_requirements(text).degree_level == level
+
+
+def test_degree_rank_uses_word_boundaries():
+    assert degree_rank("mastery") == 0
+    assert degree_rank("Scrum Master") == 0
+    assert degree_rank("M.S.") == 2
+    assert degree_rank("Master's") == 2
@@ -0,0 +1,25 @@
+"""utils.segment_text 섹션 분할 회귀 테스트"""
+from utils.segment_text import segment_job_posting
+
+
+def test_english_header_words_in_prose_do_not_start_sections():
+    sections = segment_job_posting("We build ML systems. The role is great. Requirements: 3 years of Python.")
+    assert sections == {
+        'overview': "We build ML systems. The role is great.",
+        'requirements': "3 years of Python.",
+    }
+
+
+def test_english_headers_on_their_own_line():
+    text = "About us\nWe build ML.\nResponsibilities\nBuild models.\nPreferred qualifications\nPhD"
+    assert segment_job_posting(text) == {
+        'company_intro': "We build ML.",
+        'responsibilities': "Build models.",
+        'preferred': "PhD",
+    }
+
+
+def test_korean_headers_inline():
+    sections = segment_job_posting("회사소개 AI 스타트업 주요업무 모델 개발 자격요건 Python 3년 이상")
+    assert sections['responsibilities'] == "모델 개발"
+    assert sections['requirements'] == "Python 3년 이상"
@@ -0,0 +1,122 @@
+"""utils.single_flight 호출 합치기 / 결과 복사 테스트"""
+import threading
+import time
+import pytest
+from utils.single_flight import SingleFlight, single_flight
+
+WAITERS = 3
+
+# 리더가 실행을 시작했음 / 리더를 끝내도 됨
+started = threading.Event()
+release = threading.Event()
+
+
+def wait_for_waiters(group: SingleFlight, key: str, count: int) -> None:
+    # 기다리는 호출이 모두 합류할 때까지 대기 (테스트용으로 내부 상태 확인)
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        with group._lock:
+            call = group._calls.get(key)
+            if call is not None and call.waiters == count:
+                return
+        time.sleep(0.001)
+    raise AssertionError("waiters did not join")
+
+
+def run_concurrently(group: SingleFlight, func, count: int):
+    """리더 하나가 func 안에서 멈춘 동안 count개의 호출을 합류시킨 뒤 모든 결과(또는 예외) 반환"""
+    results = [None] * (count + 1)
+
+    def call(index):
+        try:
+            results[index] = group.do("key", func)
+        except Exception as e:
+            results[index] = e
+
+    leader = threading.Thread(target=call, args=(0,))
+    leader.start()
+    started.wait(5)
+    waiters = [threading.Thread(target=call, args=(i + 1,)) for i in range(count)]
+    for thread in waiters:
+        thread.start()
+    wait_for_waiters(group, "key", count)
+    release.set()
+    for thread in [leader] + waiters:
+        thread.join(5)
+    return results
+
+
+@pytest.fixture(autouse=True)
+def reset_events():
+    started.clear()
+    release.clear()
+
+
+def test_concurrent_calls_run_once():
+    group = SingleFlight("test")
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"text": "공고", "headings": ["제목"]}
+
+    results = run_concurrently(group, fetch, WAITERS)
+    assert len(calls) == 1
+    assert all(result == {"text": "공고", "headings": ["제목"]} for result in results)
+    assert group.in_flight() == 0
+
+
+def test_each_caller_gets_its_own_copy():
+    group = SingleFlight("test")
+
+    def fetch():
+        started.set()
+        release.wait(5)
+        return {"headings": ["제목"]}
+
+    results = run_concurrently(group, fetch, WAITERS)
+    assert len({id(result) for result in results}) == len(results)
+    results[0]["headings"].append("수정")
+    assert all(result["headings"] == ["제목"] for result in results[1:])
+
+
+def test_error_is_shared_and_not_cached():
+    group = SingleFlight("test")
+    calls = []
+
+    def fail():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    results = run_concurrently(group, fail, WAITERS)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(calls) == 1
+
+    # 완료된 결과는 보관하지 않으므로 다음 호출은 다시 실행
+    with pytest.raises(ValueError):
+        group.do("key", fail)
+    assert len(calls) == 2
+
+
+def test_unshared_result_is_returned_as_is():
+    group = SingleFlight("test")
+    result = {"a": 1}
+    assert group.do("key", lambda: result) is result
+
+
+def test_decorator_keys_by_key_func():
+    seen = []
+
+    @single_flight("test_decorator", lambda url: url.lower())
+    def fetch(url):
+        seen.append(url)
+        return url
+
+    assert fetch("HTTP://A") == "HTTP://A"
+    assert fetch("http://a") == "http://a"
+    assert len(seen) == 2
+    assert fetch.single_flight_group.in_flight() == 0
@@ -0,0 +1,82 @@
+"""utils.skill_vocab 어휘 / 공고 마스크 테스트"""
+import threading
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from utils.skill_vocab import SkillVocabulary  # noqa: E402
+
+MAPPING = {
+    'python': ['파이썬', 'python3'],
+    'excel': ['microsoft excel'],
+    'pytorch': [],
+}
+
+
+def make_vocab() -> SkillVocabulary:
+    return SkillVocabulary(MAPPING, ['Python', 'Excel'])
+
+
+def test_variants_share_one_id():
+    vocab = make_vocab()
+    assert vocab.intern('Python') == vocab.intern('파이썬') == vocab.intern('python3')
+    assert vocab.intern('Excel') == vocab.intern('Microsoft Excel')
+
+
+def test_unknown_skill_gets_new_id():
+    vocab = make_vocab()
+    size = len(vocab)
+    term_id = vocab.intern('LangChain')
+    assert term_id == size
+    assert vocab.intern('langchain') == term_id
+    assert vocab.name(term_id) == 'langchain'
+
+
+def test_posting_mask_matches_tokens_not_substrings():
+    vocab = make_vocab()
+    mask = vocab.posting_mask("파이썬을 활용한 excellent 협업 능력")
+    assert mask[vocab.intern('python')]
+    assert not mask[vocab.intern('excel')]
+    assert not mask[vocab.intern('pytorch')]
+
+
+def test_posting_mask_grows_with_vocabulary():
+    vocab = make_vocab()
+    job = "experience with langchain and python"
+    first = vocab.posting_mask(job)
+    term_id = vocab.intern('LangChain')
+    second = vocab.posting_mask(job)
+    assert first.size == term_id
+    assert second.size == len(vocab)
+    assert second[term_id]
+    assert np.array_equal(second[:first.size], first)
+
+
+def test_cached_mask_is_read_only():
+    vocab = make_vocab()
+    mask = vocab.posting_mask("python")
+    with pytest.raises(ValueError):
+        mask[0] = False
+
+
+def test_concurrent_interning_and_masks():
+    vocab = make_vocab()
+    job = " ".join(f"skill{i}" for i in range(200))
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(offset, 200, 4):
+                term_id = vocab.intern(f"skill{i}")
+                # 방금 받은 id는 바로 뒤의 마스크 안에 있어야 함
+                assert vocab.posting_mask(job)[term_id]
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(vocab) == len(MAPPING) + 200
@@ -0,0 +1,119 @@
+import re
+from typing import Callable, List, Optional, Tuple
+from utils.segment_text import SECTION_HEADER_PATTERN
+
+# all-MiniLM-L6-v2는 256 토큰 이후를 잘라내므로 [CLS]/[SEP]를 뺀 토큰 수로 창을 나눈다
+DEFAULT_MAX_TOKENS = 254
+# 이웃한 창이 같은 섹션이면 앞 창의 마지막 문장들을 이만큼까지 다음 창 앞에 겹쳐 넣음
+DEFAULT_OVERLAP_TOKENS = 32
+DEFAULT_MAX_CHUNKS = 32
+
+# 문장 경계 (마침표/물음표/느낌표 뒤 공백 또는 줄바꿈)
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+|\s*\n\s*')
+
+
+def split_sentences(text: str) -> List[str]:
+    """섹션 헤더와 문장 경계를 기준으로 텍스트를 문장 단위로 분리"""
+    # 헤더가 시작되는 위치에서 섹션을 나눈다
+    boundaries = [0] + [match.start() for match in SECTION_HEADER_PATTERN.finditer(text)] + [len(text)]
+    sentences = []
+    for start, end in zip(boundaries, boundaries[1:]):
+        section = text[start:end]
+        for sentence in SENTENCE_BOUNDARY_PATTERN.split(section):
+            sentence = sentence.strip()
+            if sentence:
+                sentences.append(sentence)
+    return sentences
+
+
+def split_words(sentence: str) -> List[str]:
+    """문장을 공백 기준 단어 목록으로 분리"""
+    return sentence.split()
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저가 없을 때의 WordPiece 토큰 수 근사치 (영문 약 4자당 1토큰, 한글 등 비ASCII 1자당 2토큰)"""
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return -(-ascii_chars // 4) + 2 * (len(text) - ascii_chars)
+
+
+def _split_long_word(word: str, max_tokens: int, count_tokens: Callable[[str], int]) -> List[str]:
+    """창보다 긴 단어(공백 없는 한글 등)를 토큰 수 안에 들어가는 가장 긴 앞부분씩 자르기"""
+    pieces = []
+    while word:
+        low, high = 1, len(word)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if count_tokens(word[:middle]) <= max_tokens:
+                low = middle
+            else:
+                high = middle - 1
+        pieces.append(word[:low])
+        word = word[low:]
+    return pieces
+
+
+def _split_long_sentence(sentence: str, max_tokens: int, count_tokens: Callable[[str], int]) -> List[str]:
+    """창 크기보다 긴 문장을 단어 단위로 분할 (단어 하나가 창보다 길면 글자 단위로 분할)"""
+    pieces = []
+    current, current_tokens = "", 0
+    for word in split_words(sentence):
+        word_tokens = count_tokens(word)
+        parts = [word] if word_tokens <= max_tokens else _split_long_word(word, max_tokens, count_tokens)
+        for part in parts:
+            part_tokens = word_tokens if len(parts) == 1 else count_tokens(part)
+            if current and current_tokens + part_tokens > max_tokens:
+                pieces.append(current)
+                current, current_tokens = part, part_tokens
+            else:
+                current = f"{current} {part}" if current else part
+                current_tokens += part_tokens
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_job_text(text: str, max_tokens: int = DEFAULT_MAX_TOKENS, max_chunks: int = DEFAULT_MAX_CHUNKS,
+                   count_tokens: Optional[Callable[[str], int]] = None,
+                   overlap_tokens: int = DEFAULT_OVERLAP_TOKENS) -> List[str]:
+    """채용 공고를 섹션 경계를 존중하는 임베딩용 창으로 분할
+
+    창 크기와 겹침은 count_tokens(임베딩 모델 토크나이저 기준 토큰 수, 없으면 근사치)로 잰다.
+    """
+    if not text or not text.strip():
+        return []
+    count_tokens = count_tokens or estimate_tokens
+
+    sentences: List[Tuple[str, int, bool]] = []
+    for sentence in split_sentences(text):
+        # 섹션 헤더로 시작하는 문장은 새 창을 연다
+        starts_section = SECTION_HEADER_PATTERN.match(sentence) is not None
+        tokens = count_tokens(sentence)
+        if tokens <= max_tokens:
+            sentences.append((sentence, tokens, starts_section))
+            continue
+        for i, piece in enumerate(_split_long_sentence(sentence, max_tokens, count_tokens)):
+            sentences.append((piece, count_tokens(piece), starts_section and i == 0))
+
+    chunks = []
+    window: List[Tuple[str, int]] = []
+    window_tokens = 0
+    for sentence, tokens, starts_section in sentences:
+        if window and (starts_section or window_tokens + tokens > max_tokens):
+            chunks.append(" ".join(part for part, _ in window))
+            # 같은 섹션 안에서 넘어가는 창은 앞 창의 마지막 문장들을 겹쳐서 시작
+            overlap: List[Tuple[str, int]] = []
+            overlap_total = 0
+            if not starts_section:
+                for part, part_tokens in reversed(window):
+                    if overlap_total + part_tokens > overlap_tokens or overlap_total + part_tokens + tokens > max_tokens:
+                        break
+                    overlap.insert(0, (part, part_tokens))
+                    overlap_total += part_tokens
+            window, window_tokens = overlap, overlap_total
+        window.append((sentence, tokens))
+        window_tokens += tokens
+    if window:
+        chunks.append(" ".join(part for part, _ in window))
+
+    return chunks[:max_chunks]
@@ -0,0 +1,167 @@
+"""외부 의존성(OpenAI, 채용 사이트 호스트, Selenium)별 circuit breaker와 적응형 timeout
+
+최근 호출의 지연/실패를 창(window) 단위로 추적하여
+    - 실패율이 임계값을 넘으면 open 상태로 전환해 일정 시간 호출을 바로 거부하고
+      (호출부는 기존 키워드/기본 피드백 fallback으로 진행)
+    - cooldown 뒤에는 half-open 상태에서 시험 호출 하나만 통과시켜 회복 여부를 판단하며
+    - timeout은 고정값 대신 최근 성공 호출 p95 × 배수로 조정한다 (의존성별 하한/상한 내)
+"""
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+# 의존성 종류별 timeout 기본값/하한/상한 (초)
+BREAKER_PROFILES = {
+    'openai': {'default_timeout': 30.0, 'min_timeout': 5.0, 'max_timeout': 60.0},
+    'http': {'default_timeout': 20.0, 'min_timeout': 3.0, 'max_timeout': 30.0},
+    'selenium': {'default_timeout': 15.0, 'min_timeout': 8.0, 'max_timeout': 30.0},
+}
+
+
+class CircuitOpenError(Exception):
+    """circuit이 열려 있어 호출하지 않고 바로 실패 처리"""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"circuit '{name}' is open (retry in {retry_in:.0f}s)")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """의존성 하나의 건강 상태 (스레드 안전)"""
+
+    def __init__(self, name: str, default_timeout: float = 20.0, min_timeout: float = 3.0,
+                 max_timeout: float = 30.0, window: int = 50, min_calls: int = 5,
+                 failure_threshold: float = 0.5, cooldown_s: float = 30.0, timeout_multiplier: float = 1.5):
+        self.name = name
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.min_calls = min_calls
+        self.failure_threshold = failure_threshold
+        self.cooldown_s = cooldown_s
+        self.timeout_multiplier = timeout_multiplier
+        # (지연 초, 성공 여부) 최근 호출 기록
+        self.calls: Deque[Tuple[float, bool]] = deque(maxlen=window)
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def timeout(self) -> float:
+        """최근 성공 호출 p95 기반 timeout (표본이 적으면 기본값)"""
+        with self._lock:
+            latencies = sorted(latency for latency, ok in self.calls if ok)
+        if len(latencies) < self.min_calls:
+            return self.default_timeout
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        return min(self.max_timeout, max(self.min_timeout, p95 * self.timeout_multiplier))
+
+    def is_available(self) -> bool:
+        """호출해 볼 수 있는 상태인지 (상태를 바꾸지 않는 조회용)"""
+        with self._lock:
+            return self.state != OPEN or time.monotonic() - self.opened_at >= self.cooldown_s
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (cooldown이 끝난 open 상태면 half-open으로 바꾸고 시험 호출 하나만 허용)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.cooldown_s:
+                    return False
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record(self, ok: bool, latency_s: float) -> None:
+        """호출 결과 기록 및 상태 전환"""
+        with self._lock:
+            self.calls.append((latency_s, ok))
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+                if ok:
+                    # 실패 기록만 비우고 성공 지연 표본은 timeout 계산용으로 유지
+                    self.state = CLOSED
+                    successes = [call for call in self.calls if call[1]]
+                    self.calls.clear()
+                    self.calls.extend(successes)
+                    logger.info("Circuit %s closed after successful probe", self.name)
+                else:
+                    self._open()
+                return
+            if self.state == CLOSED and not ok and len(self.calls) >= self.min_calls:
+                failures = sum(1 for _, call_ok in self.calls if not call_ok)
+                if failures / len(self.calls) >= self.failure_threshold:
+                    self._open()
+
+    def release(self) -> None:
+        """건강 상태와 무관한 결과(요청 오류, rate limit 등)로 끝난 호출: 기록 없이 시험 호출 자리만 반환"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        logger.warning("Circuit %s opened for %.0fs", self.name, self.cooldown_s)
+
+    def retry_in(self) -> float:
+        return max(0.0, self.cooldown_s - (time.monotonic() - self.opened_at))
+
+    @contextmanager
+    def guard(self):
+        """호출 구간 보호 (열려 있으면 CircuitOpenError, 예외는 실패로 기록 후 다시 발생)"""
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+        start = time.perf_counter()
+        try:
+            yield self
+        except Exception:
+            self.record(False, time.perf_counter() - start)
+            raise
+        self.record(True, time.perf_counter() - start)
+
+    def snapshot(self) -> Dict[str, object]:
+        """현재 상태 요약 (디버그 표시용)"""
+        with self._lock:
+            total = len(self.calls)
+            failures = sum(1 for _, ok in self.calls if not ok)
+            state = self.state
+        return {'name': self.name, 'state': state, 'calls': total,
+                'error_rate': failures / total if total else 0.0, 'timeout_s': round(self.timeout(), 2)}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(name: str, kind: Optional[str] = None) -> CircuitBreaker:
+    """이름별 breaker (처음 요청 시 kind의 기본 설정으로 생성)"""
+    with _registry_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name, **BREAKER_PROFILES.get(kind or name.split(':')[0], {}))
+        return breaker
+
+
+def host_breaker(url: str) -> CircuitBreaker:
+    """채용 사이트 호스트별 breaker"""
+    return get_breaker(f"http:{urlparse(url).netloc.lower()}", 'http')
+
+
+def breaker_states() -> Dict[str, Dict[str, object]]:
+    """등록된 모든 breaker 상태"""
+    with _registry_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
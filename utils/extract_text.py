@@ -1,17 +1,58 @@
 import re
+import logging
 import requests
 from bs4 import BeautifulSoup
 from typing import List, Tuple, Optional
-import streamlit as st
 import time
 import json
 import urllib.parse
 import random
+from utils.tracing import span, traced
+from utils.http_transport import wrap_session, is_offline, ArchiveMissError
+from utils.circuit_breaker import host_breaker, get_breaker, CircuitOpenError
+from utils.single_flight import single_flight
+
+logger = logging.getLogger(__name__)
+
+# requests 호출을 record/replay transport로 감싼 세션 (기본 live 모드는 그대로 네트워크 요청)
+http_session = wrap_session(requests)
+
+def guarded_get(session, url: str, speculative: bool = False, **kwargs):
+    """호스트별 circuit breaker를 거쳐 GET (timeout은 해당 호스트의 최근 p95로 조정)
+
+    speculative=True (추측한 API 경로 등)는 실패해도 호스트 실패로 기록하지 않는다.
+    """
+    breaker = host_breaker(url)
+    if not breaker.allow():
+        raise CircuitOpenError(breaker.name, breaker.retry_in())
+    start = time.perf_counter()
+    # None이면 건강 상태와 무관한 결과 (기록 없이 시험 호출 자리만 반환)
+    healthy = None
+    try:
+        response = session.get(url, timeout=breaker.timeout(), **kwargs)
+        # 5xx만 호스트 이상으로 취급 (404 등은 정상 응답)
+        if response.status_code >= 500:
+            healthy = False
+        elif response.status_code < 400:
+            healthy = True
+        return response
+    except ArchiveMissError:
+        # replay archive에 없는 요청은 호스트 상태와 무관
+        raise
+    except requests.exceptions.RequestException:
+        healthy = False
+        raise
+    finally:
+        if healthy is None or (speculative and not healthy):
+            breaker.release()
+        else:
+            breaker.record(healthy, time.perf_counter() - start)
 
 def clean_text(text: str) -> str:
     """텍스트 정리 및 전처리"""
-    # 불필요한 공백 제거
-    text = re.sub(r'\s+', ' ', text)
+    # 불필요한 공백 제거 (줄바꿈은 하나로 남겨 영문 섹션 헤더 줄을 구분할 수 있게 함)
+    text = re.sub(r'[^\S\n]+', ' ', text)
+    text = re.sub(r' ?\n\s*', '\n', text)
     
     # 특수 문자 정리 (한글, 영어, 숫자, 기본 문장부호만 유지)
     text = re.sub(r'[^\w\s가-힣.,!?;:()\-]', '', text)
@@ -46,20 +87,21 @@ def get_robust_headers() -> dict:
         'Referer': 'https://www.google.com/'
     }
 
+@traced("fetch.cloudscraper", outcome=lambda result: "ok" if result and len(result[0]) > 200 else "empty")
 def try_cloudscraper(url: str) -> Optional[Tuple[str, List[str]]]:
     """Cloudflare 보호 사이트를 위한 cloudscraper 시도"""
     try:
         import cloudscraper
         
-        scraper = cloudscraper.create_scraper(
+        scraper = wrap_session(cloudscraper.create_scraper(
             browser={
                 'browser': 'chrome',
                 'platform': 'windows',
                 'desktop': True
             }
-        )
+        ))
         
-        response = scraper.get(url, timeout=30)
+        response = guarded_get(scraper, url)
         if response.status_code == 200:
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -124,8 +166,18 @@ def try_cloudscraper(url: str) -> Optional[Tuple[str, List[str]]]:
     except Exception as e:
         return None
 
+@traced("fetch.selenium", outcome=lambda result: "ok" if result[0] else "empty")
 def extract_text_with_selenium(url: str) -> Tuple[str, List[str]]:
     """Selenium을 사용하여 동적 콘텐츠가 있는 웹사이트에서 텍스트 추출"""
+    # replay 모드에서는 녹화되지 않는 브라우저 경로를 건너뜀
+    if is_offline():
+        return "", []
+    
+    # 최근 브라우저 실행이 계속 실패했으면 시작하지 않음
+    breaker = get_breaker("selenium")
+    if not breaker.allow():
+        return "", []
+    
     try:
         from selenium import webdriver
         from selenium.webdriver.chrome.service import Service
@@ -163,13 +215,17 @@ def extract_text_with_selenium(url: str) -> Tuple[str, List[str]]:
         driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']})")
         
         try:
-            # 페이지 로드
+            # 페이지 로드 (대기 시간은 최근 p95에 맞춰 조정)
+            load_timeout = breaker.timeout()
+            driver.set_page_load_timeout(load_timeout)
+            load_started = time.perf_counter()
             driver.get(url)
             
-            # 페이지 로딩 대기 (최대 15초)
-            WebDriverWait(driver, 15).until(
+            # 페이지 로딩 대기
+            WebDriverWait(driver, load_timeout).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
+            load_seconds = time.perf_counter() - load_started
             
             # 추가 대기 (JavaScript 로딩을 위해)
             time.sleep(5)
@@ -240,18 +296,23 @@ def extract_text_with_selenium(url: str) -> Tuple[str, List[str]]:
             full_text = '\n'.join(text_parts)
             cleaned_text = clean_text(full_text)
             
+            breaker.record(True, load_seconds)
             return cleaned_text, headings
             
         finally:
             driver.quit()
             
     except ImportError:
-        st.warning("⚠️ Selenium이 설치되지 않았습니다. pip install selenium webdriver-manager로 설치하세요.")
+        breaker.release()
+        logger.warning("Selenium is not installed (pip install selenium webdriver-manager)")
         return "", []
     except Exception as e:
-        st.error(f"Selenium을 사용한 텍스트 추출 중 오류가 발생했습니다: {str(e)}")
+        # 드라이버 시작 실패, 페이지 로드 timeout 등은 브라우저 경로 이상으로 기록
+        breaker.record(False, 0.0)
+        logger.warning("Selenium text extraction failed for %s: %s", url, e)
         return "", []
 
+@traced("fetch.api", outcome=lambda result: "ok" if result and len(result) > 100 else "empty")
 def try_api_endpoint(url: str) -> Optional[str]:
     """API 엔드포인트가 있는지 확인하고 데이터 추출 시도"""
     try:
@@ -271,7 +332,7 @@ def try_api_endpoint(url: str) -> Optional[str]:
         
         for api_url in api_patterns:
             try:
-                response = requests.get(api_url, headers=headers, timeout=10)
+                response = guarded_get(http_session, api_url, speculative=True, headers=headers)
                 if response.status_code == 200:
                     data = response.json()
                     # JSON에서 텍스트 추출
@@ -294,96 +355,125 @@ def try_api_endpoint(url: str) -> Optional[str]:
     except:
         return None
 
+@traced("parse.html")
+def parse_job_html(content) -> Tuple[str, List[str]]:
+    """HTML 문서에서 채용 공고 텍스트와 헤딩 추출 (광고/메뉴 등 불필요한 요소 제거)"""
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    # 불필요한 태그 제거
+    for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'noscript', 'iframe']):
+        tag.decompose()
+    
+    # 특정 클래스나 ID를 가진 불필요한 요소들 제거
+    unwanted_selectors = [
+        '.advertisement', '.ads', '.banner', '.sidebar', '.navigation',
+        '.menu', '.footer', '.header', '.cookie-notice', '.popup',
+        '.modal', '.overlay', '.loading', '.spinner', '.breadcrumb'
+    ]
+    
+    for selector in unwanted_selectors:
+        for element in soup.select(selector):
+            element.decompose()
+    
+    # 텍스트 추출
+    text_parts = []
+    
+    # 제목 추출
+    title = soup.find('title')
+    if title:
+        title_text = title.get_text().strip()
+        if title_text:
+            text_parts.append(f"제목: {title_text}")
+    
+    # 메타 설명 추출
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    if meta_desc and meta_desc.get('content'):
+        text_parts.append(f"설명: {meta_desc['content']}")
+    
+    # 주요 헤딩 추출
+    headings = []
+    for heading in soup.find_all(['h1', 'h2', 'h3', 'h4']):
+        heading_text = heading.get_text().strip()
+        if heading_text and len(heading_text) > 3:
+            headings.append(heading_text)
+            text_parts.append(heading_text)
+    
+    # 본문 텍스트 추출 (더 정교하게)
+    content_selectors = [
+        'main', 'article', '.content', '.main-content', '.post-content',
+        '.job-description', '.job-content', '.description', '.details',
+        '[role="main"]', '.container', '.wrapper', '.job-detail',
+        '.recruit-content', '.job-info', '.position-detail', '.job-text'
+    ]
+    
+    main_content = None
+    for selector in content_selectors:
+        main_content = soup.select_one(selector)
+        if main_content:
+            break
+    
+    if main_content:
+        content_text = main_content.get_text()
+        text_parts.append(content_text)
+    else:
+        body = soup.find('body')
+        if body:
+            content_text = body.get_text()
+            text_parts.append(content_text)
+    
+    # 모든 텍스트 결합 및 정리
+    full_text = '\n'.join(text_parts)
+    cleaned_text = clean_text(full_text)
+    
+    return cleaned_text, headings
+
+# 추적용 쿼리 파라미터 (같은 공고를 가리키므로 합치기 키에서 제외)
+TRACKING_QUERY_KEYS = {'fbclid', 'gclid', 'ref'}
+
+def normalize_url(url: str) -> str:
+    """같은 공고 URL을 같은 문자열로 (스킴/호스트 소문자, fragment·추적 파라미터 제거, 쿼리 정렬)"""
+    parsed = urllib.parse.urlsplit(url.strip())
+    query = sorted((key, value) for key, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+                   if not (key.lower().startswith('utm_') or key.lower() in TRACKING_QUERY_KEYS))
+    path = parsed.path.rstrip('/') or '/'
+    return urllib.parse.urlunsplit((parsed.scheme.lower(), parsed.netloc.lower(), path,
+                                    urllib.parse.urlencode(query), ''))
+
+@single_flight("extract_url", normalize_url)
+@traced("extract_text_from_url", outcome=lambda result: "ok" if result[0] else "empty")
 def extract_text_from_url(url: str) -> Tuple[str, List[str]]:
-    """URL에서 텍스트 추출 (다중 전략)"""
+    """URL에서 텍스트 추출 (다중 전략)
+
+    여러 세션의 호출이 합쳐지므로 UI(스피너, 경고)는 호출하는 쪽에서 표시한다.
+    """
     
-    with st.spinner("🔍 웹페이지에서 텍스트를 추출하는 중..."):
-        # 1단계: API 엔드포인트 시도
-        api_text = try_api_endpoint(url)
-        if api_text and len(api_text) > 100:
-            return clean_text(api_text), []
-        
-        # 2단계: Cloudscraper 시도 (Cloudflare 보호 사이트용)
-        cloudscraper_result = try_cloudscraper(url)
-        if cloudscraper_result and len(cloudscraper_result[0]) > 200:
-            return cloudscraper_result
-        
-        # 3단계: 기본 HTTP 요청
+    # 호스트가 최근 계속 실패했으면 네트워크 전략을 모두 건너뛰고 바로 수동 입력으로 넘김
+    if not host_breaker(url).is_available():
+        return "", []
+    
+    # 1단계: API 엔드포인트 시도
+    api_text = try_api_endpoint(url)
+    if api_text and len(api_text) > 100:
+        return clean_text(api_text), []
+    
+    # 2단계: Cloudscraper 시도 (Cloudflare 보호 사이트용)
+    cloudscraper_result = try_cloudscraper(url)
+    if cloudscraper_result and len(cloudscraper_result[0]) > 200:
+        return cloudscraper_result
+    
+    # 3단계: 기본 HTTP 요청
     try:
         headers = get_robust_headers()
-        response = requests.get(url, headers=headers, timeout=20)
-        response.raise_for_status()
+        with span("fetch.http") as fetch_span:
+            response = guarded_get(http_session, url, headers=headers)
+            fetch_span.set('status_code', response.status_code)
+            response.raise_for_status()
         
         # 응답 인코딩 확인 및 설정
         if response.encoding == 'ISO-8859-1':
             response.encoding = 'utf-8'
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # 불필요한 태그 제거
-        for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'noscript', 'iframe']):
-            tag.decompose()
-        
-        # 특정 클래스나 ID를 가진 불필요한 요소들 제거
-        unwanted_selectors = [
-            '.advertisement', '.ads', '.banner', '.sidebar', '.navigation',
-            '.menu', '.footer', '.header', '.cookie-notice', '.popup',
-            '.modal', '.overlay', '.loading', '.spinner', '.breadcrumb'
-        ]
-        
-        for selector in unwanted_selectors:
-            for element in soup.select(selector):
-                element.decompose()
-        
-        # 텍스트 추출
-        text_parts = []
-        
-        # 제목 추출
-        title = soup.find('title')
-        if title:
-            title_text = title.get_text().strip()
-            if title_text:
-                text_parts.append(f"제목: {title_text}")
-        
-        # 메타 설명 추출
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            text_parts.append(f"설명: {meta_desc['content']}")
-        
-        # 주요 헤딩 추출
-        headings = []
-        for heading in soup.find_all(['h1', 'h2', 'h3', 'h4']):
-            heading_text = heading.get_text().strip()
-            if heading_text and len(heading_text) > 3:
-                headings.append(heading_text)
-                text_parts.append(heading_text)
-        
-        # 본문 텍스트 추출 (더 정교하게)
-        content_selectors = [
-            'main', 'article', '.content', '.main-content', '.post-content',
-            '.job-description', '.job-content', '.description', '.details',
-            '[role="main"]', '.container', '.wrapper', '.job-detail',
-            '.recruit-content', '.job-info', '.position-detail', '.job-text'
-        ]
-        
-        main_content = None
-        for selector in content_selectors:
-            main_content = soup.select_one(selector)
-            if main_content:
-                break
-        
-        if main_content:
-            content_text = main_content.get_text()
-            text_parts.append(content_text)
-        else:
-            body = soup.find('body')
-            if body:
-                content_text = body.get_text()
-                text_parts.append(content_text)
-        
-        # 모든 텍스트 결합 및 정리
-        full_text = '\n'.join(text_parts)
-        cleaned_text = clean_text(full_text)
+        cleaned_text, headings = parse_job_html(response.content)
         
         # 4단계: 텍스트가 부족하면 Selenium 시도
         if len(cleaned_text) < 200:
@@ -1,49 +1,92 @@
 import os
+import logging
 import json
+from collections.abc import Mapping
 from typing import Dict, List, Optional
-from openai import OpenAI
 from utils.mcp_schema import UserContext
+from utils.tracing import span, traced, current_span, record_usage
+from utils.openai_client import get_openai_client, chat_completion
+from utils.single_flight import single_flight, text_hash
+from utils.profile_embeddings import profile_content_hash
+from utils.requirements import extract_requirements
+from utils.text_normalize import normalize
+from utils.prompt_budget import PROMPT_BUDGETS, job_excerpt_for, truncate_to_tokens, record_prompt_tokens, build_prefixed_messages
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트 나머지 부분의 토큰 수를 센 뒤 공고 발췌로 바꿔 넣을 자리
+JOB_EXCERPT_PLACEHOLDER = "<<JOB_EXCERPT>>"
+
+# 피드백 지침과 응답 형식 (사용자/공고와 무관한 고정 prefix)
+FEEDBACK_SYSTEM_PROMPT = """채용공고의 구체적 요구사항을 인용하여 사용자의 실제 보유 역량과 비교해 평가하고, 키워드나 기술 용어 없이, 이미 가진 역량은 부족하다고 하지 않으며, 제공된 키워드 분석 요약을 근거로 3~5개의 짧고 구체적인 실행계획을 제시하라.
+
+이어지는 사용자 정보와 채용 공고를 바탕으로 채용 공고와의 적합성에 대한 상세한 피드백을 제공해주세요.
+
+**중요한 지침:**
+1. 각 평가 항목은 반드시 채용 공고의 구체적인 요구조건과 직접 매칭해서 분석하세요
+2. 사용자가 보유한 기술을 "부족하다"고 절대 표현하지 마세요
+3. 기술적 용어(키워드 매칭, 임베딩 유사도, 매칭 스코어 등)는 절대 사용하지 마세요
+4. Action Plan은 짧고 구체적인 행동 단계로만 제한하세요 (포괄적 조언 금지)
+
+다음 형식으로 피드백을 제공해주세요:
+
+**전체 평가:**
+[채용 공고의 요구조건 대비 사용자 적합성을 구체적으로 평가]
+
+**강점:**
+[공고에서 요구하는 조건 중 사용자가 충족하는 부분들을 명시적으로]
+
+**개선점:**
+[공고에서 요구하는 조건 중 사용자가 보완해야 할 부분들을 구체적으로]
+
+**추천사항:**
+[지원 여부 판단과 준비 방안을 명확하게]
+
+**Action Plan:**
+[3-5개의 짧고 구체적인 실행 단계만. "공부하세요", "경험 쌓으세요" 같은 포괄적 조언 금지]
+
+**매칭 근거:**
+[공고 요구조건과 사용자 역량의 구체적인 대응 관계]"""
 
 class FeedbackGenerator:
-    def __init__(self, api_key: str = None):
-        """피드백 생성기 초기화"""
+    def __init__(self, api_key: str = None, base_url: Optional[str] = None):
+        """피드백 생성기 초기화 (base_url: OpenAI 호환 서버 주소, 기본은 OPENAI_BASE_URL 또는 공식 API)"""
         # OpenAI API 키 확인 (환경변수 또는 직접 전달된 키)
         if api_key:
-            self.client = OpenAI(api_key=api_key)
+            self.client = get_openai_client(api_key, base_url)
         else:
             # 환경변수에서 확인
             env_api_key = os.getenv('OPENAI_API_KEY')
             if env_api_key:
-                self.client = OpenAI(api_key=env_api_key)
+                self.client = get_openai_client(env_api_key, base_url)
             else:
                 self.client = None
-                print("Warning: OpenAI API key not found. Feedback generation will be limited.")
+                logger.warning("OpenAI API key not found. Feedback generation will be limited.")
     
+    @traced("generate_feedback")
     def generate_feedback(self, user_context: UserContext, job_text: str, 
                          match_score: Dict, job_title: str = "") -> Dict[str, str]:
         """GPT를 사용하여 매칭 피드백 생성"""
         
         if not self.client:
+            current_span().set_outcome("fallback")
             return self._generate_basic_feedback(user_context, job_text, match_score, job_title)
         
         try:
-            # 프롬프트 구성
-            prompt = self._create_feedback_prompt(user_context, job_text, match_score, job_title)
+            # 프롬프트 구성 (지침 + 사용자 정보가 고정 prefix라 같은 사용자의 반복 분석 시 prompt 캐시 적중)
+            messages = self._create_feedback_messages(user_context, job_text, match_score, job_title)
             
             # GPT API 호출
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-  "role": "system",
-  "content": "채용공고의 구체적 요구사항을 인용하여 사용자의 실제 보유 역량과 비교해 평가하고, 키워드나 기술 용어 없이, 이미 가진 역량은 부족하다고 하지 않으며, 제공된 키워드 분석 요약을 근거로 3~5개의 짧고 구체적인 실행계획을 제시하라."
-}
-,
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1000,
-                temperature=0.3
-            )
+            with span("gpt.feedback", model="gpt-4o-mini") as gpt_span:
+                record_prompt_tokens(gpt_span, messages, "gpt-4o-mini")
+                response = chat_completion(
+                    self.client,
+                    model="gpt-4o-mini",
+                    messages=messages,
+                    max_tokens=1000,
+                    temperature=0.3
+                )
+                record_usage(gpt_span, response)
             
             feedback_text = response.choices[0].message.content
             
@@ -53,20 +96,33 @@ class FeedbackGenerator:
             return structured_feedback
             
         except Exception as e:
-            print(f"GPT API 호출 실패: {e}")
+            logger.warning("GPT API 호출 실패: %s", e)
+            current_span().set_outcome("fallback")
             return self._generate_basic_feedback(user_context, job_text, match_score, job_title)
     
-    def _create_feedback_prompt(self, user_context: UserContext, job_text: str, 
-                               match_score: Dict, job_title: str) -> str:
-        """피드백 생성을 위한 프롬프트 생성"""
+    def _create_feedback_messages(self, user_context: UserContext, job_text: str, 
+                                  match_score: Dict, job_title: str) -> List[Dict[str, str]]:
+        """피드백 생성을 위한 메시지 구성 (고정 지침 → 사용자 정보 → 공고/사전 분석 순)"""
         
         # 키워드 매칭 결과로 사전 분석 요약 생성
         keyword_analysis = self._create_keyword_analysis_summary(match_score, job_text)
+        profile_block = self._create_profile_block(user_context)
         
-        prompt = f"""
-다음 정보를 바탕으로 채용 공고와의 적합성에 대한 상세한 피드백을 제공해주세요.
+        job_block = f"""**채용 공고:**
+- 제목: {job_title if job_title else '제목 없음'}
+- 주요 요구사항: {JOB_EXCERPT_PLACEHOLDER}
 
-**사용자 정보:**
+**사전 분석 요약:**
+{keyword_analysis}"""
+        # 지침/프로필/요약을 제외하고 남은 예산만큼 요구사항 섹션 우선으로 공고 발췌
+        job_excerpt = job_excerpt_for(job_text, 'feedback',
+                                      reserved_text=FEEDBACK_SYSTEM_PROMPT + profile_block + job_block)
+        return build_prefixed_messages(FEEDBACK_SYSTEM_PROMPT, profile_block,
+                                       job_block.replace(JOB_EXCERPT_PLACEHOLDER, job_excerpt))
+    
+    def _create_profile_block(self, user_context: UserContext) -> str:
+        """사용자 정보 블록 (같은 프로필이면 공고가 바뀌어도 바이트 단위로 동일)"""
+        return f"""**사용자 정보:**
 - 이름: {user_context.name}
 - 목표 직무: {', '.join(user_context.target_roles)}
 - 경력: {', '.join([f'{industry}({years}년)' for industry, years in user_context.experience_by_industry.items()]) if user_context.experience_by_industry else '없음'}
@@ -78,42 +134,7 @@ class FeedbackGenerator:
 - 자격증: {', '.join(user_context.certifications) if user_context.certifications else '없음'}
 - 희망 지역: {', '.join(user_context.location_preference) if user_context.location_preference else '없음'}
 - 근무 선호: {', '.join(user_context.work_preference)}
-- 추가 정보: {user_context.additional_notes if user_context.additional_notes else '없음'}
-
-**채용 공고:**
-- 제목: {job_title if job_title else '제목 없음'}
-- 내용: {job_text[:1500]}
-
-**사전 분석 요약:**
-{keyword_analysis}
-
-**중요한 지침:**
-1. 각 평가 항목은 반드시 채용 공고의 구체적인 요구조건과 직접 매칭해서 분석하세요
-2. 사용자가 보유한 기술을 "부족하다"고 절대 표현하지 마세요
-3. 기술적 용어(키워드 매칭, 임베딩 유사도, 매칭 스코어 등)는 절대 사용하지 마세요
-4. Action Plan은 짧고 구체적인 행동 단계로만 제한하세요 (포괄적 조언 금지)
-
-다음 형식으로 피드백을 제공해주세요:
-
-**전체 평가:**
-[채용 공고의 요구조건 대비 사용자 적합성을 구체적으로 평가]
-
-**강점:**
-[공고에서 요구하는 조건 중 사용자가 충족하는 부분들을 명시적으로]
-
-**개선점:**
-[공고에서 요구하는 조건 중 사용자가 보완해야 할 부분들을 구체적으로]
-
-**추천사항:**
-[지원 여부 판단과 준비 방안을 명확하게]
-
-**Action Plan:**
-[3-5개의 짧고 구체적인 실행 단계만. "공부하세요", "경험 쌓으세요" 같은 포괄적 조언 금지]
-
-**매칭 근거:**
-[공고 요구조건과 사용자 역량의 구체적인 대응 관계]
-"""
-        return prompt
+- 추가 정보: {truncate_to_tokens(user_context.additional_notes, PROMPT_BUDGETS['notes']) if user_context.additional_notes else '없음'}"""
     
     def _create_keyword_analysis_summary(self, match_score: Dict, job_text: str) -> str:
         """키워드 매칭 결과를 요약하여 GPT에게 전달할 사전 분석 생성"""
@@ -128,8 +149,8 @@ class FeedbackGenerator:
         matched_skills = match_score.get('matched_skills', [])
         missing_skills = match_score.get('missing_skills', [])
         
-        # 공고에서 언급된 주요 기술들 추출 (간단한 키워드 기반)
-        job_lower = job_text.lower()
+        # 공고에서 언급된 주요 기술들 추출 (정규화 토큰 기준, "email" 안의 "ai" 같은 오탐 제외)
+        normalized_job = normalize(job_text)
         mentioned_techs = []
         tech_keywords = [
             'python', 'java', 'javascript', 'sql', 'r', 'tensorflow', 'pytorch', 
@@ -139,7 +160,7 @@ class FeedbackGenerator:
         ]
         
         for tech in tech_keywords:
-            if tech in job_lower:
+            if normalized_job.contains(tech):
                 mentioned_techs.append(tech)
         
         analysis = f"""
@@ -151,6 +172,9 @@ class FeedbackGenerator:
 
 ◎ 경험 매칭: {experience_match:.1f}%
 
+◎ 공고 요구 조건 (경력/학위/언어):
+  {extract_requirements(job_text).summary()}
+
 ◎ 공고에서 언급된 주요 기술:
   {', '.join(mentioned_techs) if mentioned_techs else '특별히 언급된 기술 없음'}
 
@@ -165,7 +189,7 @@ class FeedbackGenerator:
         
         formatted_projects = []
         for project in projects:
-            if isinstance(project, dict):
+            if isinstance(project, Mapping):
                 project_info = project.get('name', '')
                 if project.get('description'):
                     project_info += f": {project.get('description', '')}"
@@ -297,12 +321,21 @@ class FeedbackGenerator:
             'raw_feedback': f"{assessment}\n\n강점:\n{strengths_text}\n\n개선점:\n{improvements_text}\n\n추천사항:\n{recommendations}\n\nAction Plan:\n{action_plan_text}"
         }
 
+def _feedback_request_key(user_context: UserContext, job_text: str, match_score: Dict, job_title: str = "",
+                          api_key: str = None, base_url: Optional[str] = None) -> str:
+    """같은 프로필 × 같은 공고 × 같은 매칭 결과 × 같은 API 설정이면 같은 키"""
+    score_payload = json.dumps(match_score, ensure_ascii=False, sort_keys=True, default=str)
+    return text_hash(f"{profile_content_hash(user_context)}|{text_hash(job_text)}|{text_hash(score_payload)}|"
+                     f"{job_title}|{text_hash(api_key or '')}|{base_url or ''}")
+
+@single_flight("feedback", _feedback_request_key)
 def generate_job_feedback(user_context: UserContext, job_text: str, 
-                         match_score: Dict, job_title: str = "", api_key: str = None) -> Dict[str, str]:
+                         match_score: Dict, job_title: str = "", api_key: str = None,
+                         base_url: Optional[str] = None) -> Dict[str, str]:
     """피드백 생성 함수 (외부에서 호출용)"""
     # API 키가 제공되면 새로운 인스턴스 생성, 아니면 전역 인스턴스 사용
     if api_key:
-        feedback_generator = FeedbackGenerator(api_key=api_key)
+        feedback_generator = FeedbackGenerator(api_key=api_key, base_url=base_url)
     else:
         # 전역 인스턴스 (환경변수 사용)
         if not hasattr(generate_job_feedback, '_global_generator'):
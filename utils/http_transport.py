@@ -0,0 +1,202 @@
+"""채용 공고 수집용 HTTP record/replay transport
+
+requests 모듈이나 cloudscraper 세션을 감싸서 세 가지 모드로 동작한다.
+    live   : 그대로 네트워크 요청 (기본값)
+    record : 네트워크 요청 후 응답을 로컬 아카이브에 저장
+    replay : 아카이브에서 응답을 읽어 반환 (네트워크 없음, 녹화된/지정한 지연 재현)
+
+환경변수:
+    HTTP_TRANSPORT_MODE=live|record|replay
+    HTTP_ARCHIVE_DIR=data/http_archive
+    HTTP_REPLAY_LATENCY=recorded|<밀리초>   (replay 시 응답 지연, 기본은 녹화 당시 소요 시간)
+
+사용법 (저장된 HTML 파일을 아카이브로 가져오기):
+    python -m utils.http_transport import-html benchmarks/fixtures/pages --base-url https://fixtures.local/jobs/
+"""
+import os
+import json
+import time
+import logging
+import hashlib
+import argparse
+from typing import Optional
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+TRANSPORT_MODES = ("live", "record", "replay")
+
+
+class TransportConfig:
+    """현재 transport 설정 (환경변수로 초기화, configure_transport로 변경)"""
+
+    def __init__(self):
+        self.mode = os.getenv("HTTP_TRANSPORT_MODE", "live").lower()
+        self.archive_dir = os.getenv("HTTP_ARCHIVE_DIR", "data/http_archive")
+        self.replay_latency = os.getenv("HTTP_REPLAY_LATENCY", "recorded")
+
+
+TRANSPORT_CONFIG = TransportConfig()
+
+
+def configure_transport(mode: Optional[str] = None, archive_dir: Optional[str] = None,
+                        replay_latency: Optional[str] = None) -> TransportConfig:
+    """transport 모드/아카이브 경로/재현 지연 변경 (벤치마크, 스크립트용)"""
+    if mode is not None:
+        if mode not in TRANSPORT_MODES:
+            raise ValueError(f"unknown transport mode: {mode} (expected one of {', '.join(TRANSPORT_MODES)})")
+        TRANSPORT_CONFIG.mode = mode
+    if archive_dir is not None:
+        TRANSPORT_CONFIG.archive_dir = archive_dir
+    if replay_latency is not None:
+        TRANSPORT_CONFIG.replay_latency = str(replay_latency)
+    return TRANSPORT_CONFIG
+
+
+def is_offline() -> bool:
+    """replay 모드 여부 (브라우저 자동화 등 녹화되지 않는 경로를 건너뛸 때 사용)"""
+    return TRANSPORT_CONFIG.mode == "replay"
+
+
+def _archive_key(method: str, url: str) -> str:
+    return hashlib.sha256(f"{method.upper()} {url}".encode("utf-8")).hexdigest()[:32]
+
+
+def _archive_paths(archive_dir: str, method: str, url: str):
+    key = _archive_key(method, url)
+    return os.path.join(archive_dir, f"{key}.json"), os.path.join(archive_dir, f"{key}.body")
+
+
+def save_response(url: str, status_code: int, headers: dict, content: bytes, encoding: Optional[str] = None,
+                  elapsed_ms: float = 0.0, method: str = "GET", archive_dir: Optional[str] = None) -> str:
+    """응답 하나를 아카이브에 저장 (메타데이터 JSON + 본문 바이트, 원자적 쓰기)"""
+    archive_dir = archive_dir or TRANSPORT_CONFIG.archive_dir
+    os.makedirs(archive_dir, exist_ok=True)
+    meta_path, body_path = _archive_paths(archive_dir, method, url)
+
+    meta = {
+        'method': method.upper(),
+        'url': url,
+        'status_code': status_code,
+        'headers': dict(headers),
+        'encoding': encoding,
+        'elapsed_ms': elapsed_ms,
+        'recorded_at': time.time(),
+    }
+    for path, data, mode in ((body_path, content, 'wb'), (meta_path, json.dumps(meta, ensure_ascii=False, indent=2), 'w')):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, mode, **({} if mode == 'wb' else {'encoding': 'utf-8'})) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return meta_path
+
+
+def load_response(url: str, method: str = "GET", archive_dir: Optional[str] = None) -> Optional[requests.Response]:
+    """아카이브에서 응답 복원 (없으면 None), 반환값은 실제 requests.Response 객체"""
+    meta_path, body_path = _archive_paths(archive_dir or TRANSPORT_CONFIG.archive_dir, method, url)
+    if not os.path.exists(meta_path) or not os.path.exists(body_path):
+        return None
+
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    with open(body_path, 'rb') as f:
+        content = f.read()
+
+    response = requests.Response()
+    response._content = content
+    response.status_code = meta['status_code']
+    response.headers = CaseInsensitiveDict(meta.get('headers') or {})
+    response.encoding = meta.get('encoding')
+    response.url = meta['url']
+    response.reason = "OK" if response.status_code < 400 else "Replayed error"
+    response._recorded_elapsed_ms = meta.get('elapsed_ms', 0.0)
+    return response
+
+
+def _replay_delay_seconds(response: requests.Response) -> float:
+    setting = TRANSPORT_CONFIG.replay_latency
+    if setting == "recorded":
+        return getattr(response, '_recorded_elapsed_ms', 0.0) / 1000
+    try:
+        return float(setting) / 1000
+    except ValueError:
+        return 0.0
+
+
+class ArchiveMissError(requests.exceptions.ConnectionError):
+    """replay 모드에서 녹화되지 않은 요청 (호스트 장애가 아니라 archive에 없는 것)"""
+
+
+class TransportSession:
+    """requests 모듈 / requests.Session / cloudscraper 세션을 감싸는 record/replay 래퍼"""
+
+    def __init__(self, session):
+        self._session = session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        mode = TRANSPORT_CONFIG.mode
+
+        if mode == "replay":
+            response = load_response(url)
+            if response is None:
+                # 녹화되지 않은 요청은 연결 실패로 취급 (수집 파이프라인의 기존 예외 처리 경로 사용)
+                raise ArchiveMissError(f"no archived response for {url}")
+            delay = _replay_delay_seconds(response)
+            if delay > 0:
+                time.sleep(delay)
+            return response
+
+        start = time.perf_counter()
+        response = self._session.get(url, **kwargs)
+        if mode == "record":
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            try:
+                save_response(url, response.status_code, response.headers, response.content,
+                              response.encoding, elapsed_ms)
+            except OSError as e:
+                logger.warning("Failed to record response for %s: %s", url, e)
+        return response
+
+    def __getattr__(self, name):
+        # get 이외의 속성(headers, cookies 등)은 원래 세션으로 위임
+        return getattr(self._session, name)
+
+
+def wrap_session(session=requests) -> TransportSession:
+    """세션을 record/replay transport로 감싸기 (기본은 requests 모듈)"""
+    return TransportSession(session)
+
+
+def import_html_dir(html_dir: str, base_url: str, archive_dir: Optional[str] = None, elapsed_ms: float = 0.0) -> int:
+    """저장된 HTML 파일들을 base_url + 파일명 URL의 녹화 응답으로 아카이브에 추가"""
+    count = 0
+    for filename in sorted(os.listdir(html_dir)):
+        if not filename.endswith((".html", ".htm")):
+            continue
+        with open(os.path.join(html_dir, filename), 'rb') as f:
+            content = f.read()
+        save_response(base_url.rstrip('/') + '/' + filename, 200,
+                      {'Content-Type': 'text/html; charset=utf-8'}, content, 'utf-8', elapsed_ms,
+                      archive_dir=archive_dir)
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the HTTP record/replay archive")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    import_parser = subparsers.add_parser("import-html", help="archive saved HTML files as replayable responses")
+    import_parser.add_argument("html_dir")
+    import_parser.add_argument("--base-url", default="https://fixtures.local/jobs/")
+    import_parser.add_argument("--archive-dir", default=None)
+    import_parser.add_argument("--elapsed-ms", type=float, default=0.0, help="latency to replay for each response")
+    args = parser.parse_args()
+
+    if args.command == "import-html":
+        count = import_html_dir(args.html_dir, args.base_url, args.archive_dir, args.elapsed_ms)
+        print(f"Archived {count} pages into {args.archive_dir or TRANSPORT_CONFIG.archive_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""공고 코퍼스 위 TF-IDF / BM25 어휘 점수 (임베딩 fallback과 사전 필터)
+
+분석한 공고를 text_normalize 토큰 기준 HashingVectorizer(고정 차원 희소 행)로 저장하고,
+문서 빈도(df)는 공고가 들어올 때마다 증분 갱신한다. 어휘 사전을 다시 학습하지 않으므로
+새 공고가 들어오면 IDF에 바로 반영된다.
+    - similarity(): 프로필 ↔ 공고 TF-IDF 코사인 (0~1), 임베딩 모델이 없을 때의 유사도
+    - top_k(): 프로필 토큰으로 공고 전체의 BM25 점수를 희소 행렬 곱 한 번으로 계산해
+      임베딩 전에 후보 공고를 추리는 사전 필터
+"""
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+import numpy as np
+from utils.single_flight import text_hash
+from utils.text_normalize import tokenize
+
+# 해시 공간 크기 (충돌이 드물 만큼 크고 df 배열은 1MB 수준)
+N_FEATURES = 2 ** 18
+BM25_K1 = 1.2
+BM25_B = 0.75
+# 보관할 최대 공고 수 (넘으면 가장 오래 전에 본 공고부터 df에서 빼고 제거)
+MAX_DOCUMENTS = 5000
+PREFILTER_TOP_K = 20
+
+_vectorizer = None
+
+
+def _get_vectorizer():
+    """정규화 토큰을 단어 빈도 희소 행으로 바꾸는 HashingVectorizer (scikit-learn은 처음 쓸 때 import)"""
+    global _vectorizer
+    if _vectorizer is None:
+        from sklearn.feature_extraction.text import HashingVectorizer
+        _vectorizer = HashingVectorizer(analyzer=tokenize, n_features=N_FEATURES, alternate_sign=False,
+                                        norm=None, dtype=np.float32)
+    return _vectorizer
+
+
+def vectorize(texts: Sequence[str]):
+    """텍스트 목록 → (문서 수 × N_FEATURES) 단어 빈도 CSR 행렬 (열 인덱스 정렬/중복 없음)"""
+    return _get_vectorizer().transform(list(texts))
+
+
+def _tf_weights(counts: np.ndarray) -> np.ndarray:
+    # 반복 언급에 대한 sublinear tf (1 + log tf)
+    return 1.0 + np.log(counts)
+
+
+class LexicalIndex:
+    """공고 단어 빈도 행과 증분 문서 빈도를 보관하는 어휘 인덱스 (스레드 안전)"""
+
+    def __init__(self, max_documents: int = MAX_DOCUMENTS, k1: float = BM25_K1, b: float = BM25_B):
+        self.max_documents = max_documents
+        self.k1 = k1
+        self.b = b
+        self._docs: "OrderedDict[str, object]" = OrderedDict()
+        self._df = np.zeros(N_FEATURES, dtype=np.int32)
+        # (공고 키 → 행 번호, BM25 가중치 CSC 행렬), 공고가 추가/제거되면 다음 조회 때 다시 만듦
+        self._bm25 = None
+        # 공고가 추가/제거될 때마다 증가 (IDF가 바뀌었는지 캐시 키에서 확인)
+        self.version = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, job_text: str) -> str:
+        """공고 하나를 인덱스에 넣고 (이미 있으면 그대로) 공고 키 반환"""
+        return self.add_many([job_text])[0]
+
+    def add_many(self, job_texts: Sequence[str]) -> List[str]:
+        """공고 여러 개를 한 번에 벡터화해 인덱스에 넣고 입력 순서대로 공고 키 반환"""
+        keys = [text_hash(job_text) for job_text in job_texts]
+        with self._lock:
+            new_positions = {}
+            for position, key in enumerate(keys):
+                if key in self._docs:
+                    self._docs.move_to_end(key)
+                elif key not in new_positions:
+                    new_positions[key] = position
+        if not new_positions:
+            return keys
+
+        rows = vectorize([job_texts[position] for position in new_positions.values()])
+        with self._lock:
+            for row_index, key in enumerate(new_positions):
+                if key in self._docs:
+                    continue
+                row = rows[row_index]
+                self._docs[key] = row
+                self._df[row.indices] += 1
+            while len(self._docs) > self.max_documents:
+                _, evicted = self._docs.popitem(last=False)
+                self._df[evicted.indices] -= 1
+            self._bm25 = None
+            self.version += 1
+        return keys
+
+    def _tfidf_idf(self, columns: np.ndarray) -> np.ndarray:
+        # smooth idf: log((1 + N) / (1 + df)) + 1 (코퍼스에 없는 단어도 유한한 값)
+        return np.log((1.0 + len(self._docs)) / (1.0 + self._df[columns])) + 1.0
+
+    def _bm25_idf(self, columns: np.ndarray) -> np.ndarray:
+        # BM25 idf (음수가 되지 않는 log(1 + ...) 형태)
+        df = self._df[columns]
+        return np.log(1.0 + (len(self._docs) - df + 0.5) / (df + 0.5))
+
+    def similarity(self, query_text: str, job_text: str) -> float:
+        """질의(프로필) 텍스트와 공고의 TF-IDF 코사인 유사도 (공고는 인덱스에 추가되어 IDF에 반영)"""
+        key = self.add(job_text)
+        query = vectorize([query_text])
+        with self._lock:
+            document = self._docs.get(key)
+            if document is None:
+                # 동시에 많은 공고가 들어와 바로 밀려난 경우
+                document = vectorize([job_text])
+            query_weights = _tf_weights(query.data) * self._tfidf_idf(query.indices)
+            document_weights = _tf_weights(document.data) * self._tfidf_idf(document.indices)
+
+        norm = np.linalg.norm(query_weights) * np.linalg.norm(document_weights)
+        if norm == 0:
+            return 0.0
+        _, query_positions, document_positions = np.intersect1d(
+            query.indices, document.indices, assume_unique=True, return_indices=True)
+        dot = float(np.dot(query_weights[query_positions], document_weights[document_positions]))
+        return min(1.0, dot / norm)
+
+    def _bm25_matrix(self):
+        """(공고 키 → 행 번호, BM25 tf 가중치 CSC 행렬), 잠금을 잡은 상태에서 호출"""
+        if self._bm25 is None:
+            from scipy import sparse
+            keys = list(self._docs)
+            term_counts = sparse.vstack(list(self._docs.values()), format='csr')
+            lengths = np.asarray(term_counts.sum(axis=1), dtype=np.float32).ravel()
+            average_length = float(lengths.mean()) or 1.0
+            # tf * (k1 + 1) / (tf + k1 * (1 - b + b * 문서 길이 / 평균 길이))
+            length_norm = self.k1 * (1.0 - self.b + self.b * lengths / average_length)
+            per_entry = np.repeat(length_norm, np.diff(term_counts.indptr))
+            counts = term_counts.data
+            term_counts.data = counts * (self.k1 + 1.0) / (counts + per_entry)
+            self._bm25 = ({key: row for row, key in enumerate(keys)}, term_counts.tocsc())
+        return self._bm25
+
+    def bm25_scores(self, query_text: str, job_keys: Sequence[str]) -> np.ndarray:
+        """질의 텍스트에 대한 공고별 BM25 점수 (job_keys 순서, 인덱스에 없는 공고는 0)"""
+        query_columns = vectorize([query_text]).indices
+        scores = np.zeros(len(job_keys), dtype=np.float32)
+        with self._lock:
+            if not self._docs or len(query_columns) == 0:
+                return scores
+            rows_by_key, weights = self._bm25_matrix()
+            # 공고 전체 점수 = (공고 × 질의 단어) BM25 가중치 @ 질의 단어 idf
+            all_scores = np.asarray(weights[:, query_columns] @ self._bm25_idf(query_columns)).ravel()
+        for position, key in enumerate(job_keys):
+            row = rows_by_key.get(key)
+            if row is not None:
+                scores[position] = all_scores[row]
+        return scores
+
+    def top_k(self, query_text: str, job_texts: Sequence[str], k: int = PREFILTER_TOP_K) -> List[int]:
+        """job_texts 중 BM25 점수가 높은 k개의 위치 (점수 내림차순, 동점은 입력 순서)"""
+        if not job_texts:
+            return []
+        scores = self.bm25_scores(query_text, self.add_many(job_texts))
+        return [int(position) for position in np.argsort(-scores, kind='stable')[:k]]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._docs.clear()
+            self._df[:] = 0
+            self._bm25 = None
+            self.version += 1
+
+
+# 앱 전체가 공유하는 공고 코퍼스 인덱스
+JOB_INDEX = LexicalIndex()
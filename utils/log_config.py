@@ -0,0 +1,46 @@
+import os
+import random
+import logging
+from typing import Optional
+
+# 로그 레벨과 DEBUG 로그 샘플링 비율 (환경변수로 조정, 기본은 경고 이상만 출력)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING")
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# utils 하위 모듈 로거들의 공통 부모 (logging.getLogger(__name__))
+PACKAGE_LOGGER = "utils"
+
+
+class SamplingFilter(logging.Filter):
+    """DEBUG 레코드를 지정한 비율만 통과시키는 필터 (INFO 이상은 항상 통과)
+
+    필터는 메시지 포매팅 전에 실행되므로 버려진 레코드는 문자열을 만들지 않는다.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = max(0.0, min(1.0, rate))
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+def configure_logging(level: Optional[str] = None, sample_rate: Optional[float] = None) -> logging.Logger:
+    """utils 로거에 핸들러/레벨/샘플링 설정 (여러 번 호출해도 핸들러는 하나만 유지)"""
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    logger.setLevel((level or LOG_LEVEL).upper())
+
+    handler = next((h for h in logger.handlers if getattr(h, '_job_matcher_handler', False)), None)
+    if handler is None:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handler._job_matcher_handler = True
+        logger.addHandler(handler)
+        # Streamlit 등 루트 로거 설정과 중복 출력되지 않도록 전파하지 않음
+        logger.propagate = False
+
+    handler.filters = [SamplingFilter(LOG_SAMPLE_RATE if sample_rate is None else sample_rate)]
+    return logger
@@ -1,220 +1,362 @@
-import re
-from typing import Dict, List, Tuple, Optional
-from sentence_transformers import SentenceTransformer
+import os
+import logging
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Callable, Dict, List, Tuple, Optional
 import numpy as np
-from utils.mcp_schema import UserContext
-from openai import OpenAI
+from utils.mcp_schema import UserContext, get_context_filename
+from utils.chunk_text import chunk_job_text
+from utils.segment_text import get_focus_text
+from utils.profile_embeddings import profile_content_hash, load_profile_embeddings, save_profile_embeddings
+from utils.skill_vocab import SKILL_MAPPING, SKILL_VOCABULARY, basic_variations
+from utils.tracing import span, traced, record_usage, current_span
+from utils.prompt_budget import PROMPT_BUDGETS, job_excerpt_for, truncate_to_tokens, record_prompt_tokens, build_prefixed_messages
+from utils.openai_client import get_openai_client, chat_completion
+from utils.single_flight import single_flight, text_hash
+from utils.score_cache import COMPONENT_CACHE, ScoreInputs, mark_uncacheable, register_state_version
+from utils.text_normalize import normalize
+from utils.lexical_index import JOB_INDEX, PREFILTER_TOP_K
+from utils.scoring import SCORING_COMPONENTS, SCORING_WEIGHTS, ScoringWeights
+from utils.requirements import SCORE_PATTERN, extract_requirements, degree_rank, proficiency_rank, canonical_language
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
+
+# 임베딩 백엔드 설정 (torch: SentenceTransformer, onnx: ONNX Runtime FP32, onnx-int8: 동적 양자화 모델)
+EMBEDDING_BACKEND = os.getenv('EMBEDDING_BACKEND', 'torch')
+EMBEDDING_ONNX_DIR = os.getenv('EMBEDDING_ONNX_DIR', 'models/all-MiniLM-L6-v2-onnx')
+
+# 임베딩 유사도를 구성하는 프로필 필드별 가중치
+FIELD_WEIGHTS = {
+    'roles': 0.25,
+    'skills': 0.25,
+    'experience': 0.15,
+    'projects': 0.15,
+    'notes': 0.1,
+    'certifications': 0.05,
+    'languages': 0.05,
+}
+
+# GPT 호출별 고정 지침 (사용자/공고 내용이 들어가지 않아 매 호출 바이트 단위로 동일한 prefix가 됨)
+ROLE_MATCH_SYSTEM_PROMPT = """You are an expert career counselor. Analyze the relevance between user's target roles and job posting. Consider semantic similarity, not just exact keyword matches. Return only a number between 0 and 1.
+
+사용자가 원하는 직무와 채용 공고의 직무 간 매칭도를 0-1 사이의 점수로 평가해주세요.
+
+평가 기준:
+1. 직무명이 정확히 일치하지 않아도 업무 내용이나 요구 역량이 유사한가?
+2. 사용자가 원하는 직무의 핵심 업무와 공고의 업무가 얼마나 관련성이 있는가?
+3. 커리어 발전 경로상 연관성이 있는가?
+
+예: "NLP Engineer"와 "AI Research Scientist"는 높은 관련성
+예: "Data Scientist"와 "Machine Learning Engineer"는 높은 관련성
+예: "Frontend Developer"와 "Backend Developer"는 중간 관련성
+
+응답 형식: 숫자만 반환 (예: 0.8)"""
+
+NOTES_MATCH_SYSTEM_PROMPT = """You are an expert career counselor. Analyze the relevance between user's additional notes and job posting. Return only a number between 0 and 1.
+
+사용자의 추가 정보와 채용 공고 간의 매칭도를 0-1 사이의 점수로 평가해주세요.
+
+평가 기준:
+1. 사용자의 관심사, 경험, 목표가 채용 공고의 요구사항이나 업무 내용과 얼마나 관련성이 있는가?
+2. 사용자가 언급한 프로젝트, 기술, 경험이 해당 직무에 얼마나 적합한가?
+3. 사용자의 커리어 목표나 관심 분야가 해당 회사/직무와 얼마나 일치하는가?
+
+응답 형식: 숫자만 반환 (예: 0.7)"""
+
+MISSING_SKILLS_SYSTEM_PROMPT = """You are an expert technical recruiter. Analyze job postings to identify required skills that candidates lack. Be precise and avoid false positives.
+
+다음 채용 공고에서 요구하는 기술들 중에서 사용자가 보유하지 않은 기술들을 찾아주세요.
+
+중요한 지침:
+1. 채용 공고에서 명시적으로 요구하거나 언급된 기술들을 식별하세요
+2. 사용자가 이미 보유한 기술은 절대 포함하지 마세요
+3. 유사한 기술은 같은 것으로 취급하세요:
+   - "RAG" = "Retrieval Augmented Generation" = "검색 증강 생성"
+   - "MCP" = "Model Context Protocol"
+   - "Power BI" = "PowerBI" = "파워 BI"
+   - "Excel" = "엑셀" = "Microsoft Excel"
+   - "Python" = "파이썬"
+   - "SQL" = "에스큐엘" = "Structured Query Language"
+4. 대소문자나 표기법이 다른 경우도 같은 기술로 취급하세요
+5. 사용자가 보유한 기술과 겹치는 것은 절대 "부족한 기술"로 분류하지 마세요
+
+응답 형식: 콤마로 구분된 기술 이름만 반환 (예: Docker, Kubernetes, React)
+사용자가 필요한 기술을 모두 보유했다면 "없음"이라고 반환하세요."""
+
+# 스킬 표기(유사어) → 매핑 사전의 대표 표기
+_SKILL_REVERSE_MAPPING = {value: key for key, values in SKILL_MAPPING.items() for value in values}
+
+# 인코더 식별자 + 프로필 내용 해시 → 필드별 임베딩 (모든 JobMatcher 인스턴스가 공유하는 LRU 캐시)
+_profile_embedding_cache: "OrderedDict[str, Dict[str, np.ndarray]]" = OrderedDict()
+_PROFILE_EMBEDDING_CACHE_SIZE = 128
+
+# 필드 텍스트별 임베딩 (프로필 일부만 바뀌면 바뀐 필드만 다시 인코딩) / 공고별 청크 임베딩
+_field_embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_FIELD_EMBEDDING_CACHE_SIZE = 1024
+_job_chunk_embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_JOB_CHUNK_CACHE_SIZE = 64
+
+def _remember_embedding(cache: "OrderedDict[str, np.ndarray]", cache_key: str, value: np.ndarray, max_size: int) -> None:
+    """임베딩 LRU 캐시에 저장 (오래된 항목부터 제거)"""
+    cache[cache_key] = value
+    cache.move_to_end(cache_key)
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
+def _remember_profile_embeddings(cache_key: str, embeddings: Dict[str, np.ndarray]) -> None:
+    """프로필 임베딩을 메모리 캐시에 저장 (오래된 항목부터 제거)"""
+    _remember_embedding(_profile_embedding_cache, cache_key, embeddings, _PROFILE_EMBEDDING_CACHE_SIZE)
+
+class OnnxEncoder:
+    """ONNX Runtime 기반 CPU 임베딩 인코더 (SentenceTransformer.encode 호환)
+
+    scripts/export_onnx_encoder.py로 내보낸 모델 디렉토리(model.onnx,
+    model_quantized.onnx, tokenizer.json)를 사용하며, 원본 파이프라인과 동일하게
+    mean pooling 후 L2 정규화한다.
+    """
+
+    def __init__(self, model_dir: str, quantized: bool = False, max_seq_length: int = 256, batch_size: int = 32):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_file = "model_quantized.onnx" if quantized else "model.onnx"
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, model_file), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+        output_dim = self.session.get_outputs()[0].shape[-1]
+        self.dimension = output_dim if isinstance(output_dim, int) else 384
+
+        tokenizer_path = os.path.join(model_dir, "tokenizer.json")
+        self.tokenizer = Tokenizer.from_file(tokenizer_path)
+        self.tokenizer.enable_truncation(max_length=max_seq_length)
+        self.tokenizer.enable_padding(pad_id=0, pad_token="[PAD]")
+        # 청크 크기를 잴 때는 잘라내지 않는 토크나이저로 실제 토큰 수를 센다
+        self._counting_tokenizer = Tokenizer.from_file(tokenizer_path)
+        self.max_seq_length = max_seq_length
+        self.batch_size = batch_size
+
+    def count_tokens(self, text: str) -> int:
+        """특수 토큰을 제외한 모델 토큰 수"""
+        return len(self._counting_tokenizer.encode(text, add_special_tokens=False).ids)
+
+    def encode(self, sentences, batch_size: Optional[int] = None, normalize_embeddings: bool = True, **kwargs) -> np.ndarray:
+        """문장 목록을 임베딩 (all-MiniLM-L6-v2는 Normalize 레이어를 포함하므로 항상 정규화)"""
+        single_input = isinstance(sentences, str)
+        if single_input:
+            sentences = [sentences]
+
+        batch_size = batch_size or self.batch_size
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            encodings = self.tokenizer.encode_batch(list(sentences[start:start + batch_size]))
+            input_ids = np.array([encoding.ids for encoding in encodings], dtype=np.int64)
+            attention_mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+            feeds = {
+                'input_ids': input_ids,
+                'attention_mask': attention_mask,
+                'token_type_ids': np.zeros_like(input_ids),
+            }
+            token_embeddings = self.session.run(None, {name: feeds[name] for name in self.input_names})[0]
+
+            # 패딩 토큰을 제외한 mean pooling
+            mask = attention_mask[..., None].astype(np.float32)
+            pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            batches.append(pooled)
+
+        if not batches:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        embeddings = np.vstack(batches).astype(np.float32)
+        embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings[0] if single_input else embeddings
+
+def encoder_token_budget(encoder) -> Tuple[Callable[[str], int], int]:
+    """인코더 토크나이저 기준 (토큰 수 함수, [CLS]/[SEP]를 뺀 창 최대 토큰 수)"""
+    if isinstance(encoder, OnnxEncoder):
+        return encoder.count_tokens, encoder.max_seq_length - 2
+    tokenizer = encoder.tokenizer
+    return (lambda text: len(tokenizer.tokenize(text))), encoder.max_seq_length - 2
+
+# 백엔드별로 로드된 인코더 (API 키마다 JobMatcher를 새로 만들어도 모델은 한 번만 로드)
+_loaded_encoders: Dict[str, object] = {}
+
+def load_encoder(backend: Optional[str] = None):
+    """설정된 백엔드로 임베딩 인코더 로드"""
+    backend = (backend or EMBEDDING_BACKEND).lower()
+    if backend in _loaded_encoders:
+        return _loaded_encoders[backend]
+
+    with span("model.load", backend=backend):
+        if backend in ('onnx', 'onnx-int8'):
+            encoder = OnnxEncoder(EMBEDDING_ONNX_DIR, quantized=backend == 'onnx-int8')
+        else:
+            from sentence_transformers import SentenceTransformer
+            encoder = SentenceTransformer(MODEL_NAME)
+
+    _loaded_encoders[backend] = encoder
+    return encoder
 
 class JobMatcher:
-    def __init__(self, api_key: Optional[str] = None):
-        """매칭 점수 계산을 위한 클래스 초기화"""
+    def __init__(self, api_key: Optional[str] = None, encoder_backend: Optional[str] = None,
+                 base_url: Optional[str] = None, scoring_weights: Optional[ScoringWeights] = None):
+        """매칭 점수 계산을 위한 클래스 초기화 (base_url: OpenAI 호환 서버 주소, 기본은 OPENAI_BASE_URL 또는 공식 API)"""
+        # 구성요소 가중치 / 키워드·임베딩 혼합 비율 (기본은 SCORING_WEIGHTS_PATH 설정)
+        self.scoring_weights = scoring_weights or SCORING_WEIGHTS
+
         # 임베딩 모델 로드 (한국어 지원)
+        self.encoder_backend = (encoder_backend or EMBEDDING_BACKEND).lower()
         try:
-            self.model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
-        except:
-            # 모델 로드 실패시 기본값 설정
+            self.model = load_encoder(self.encoder_backend)
+        except Exception as e:
+            logger.warning("%s encoder could not be loaded (%s)", self.encoder_backend, e)
             self.model = None
-            print("Warning: Sentence transformer model could not be loaded")
+            # ONNX 모델이 없으면 기본 SentenceTransformer로 재시도
+            if self.encoder_backend != 'torch':
+                try:
+                    self.encoder_backend = 'torch'
+                    self.model = load_encoder('torch')
+                except Exception:
+                    pass
+            if self.model is None:
+                # 모델 로드 실패시 기본값 설정
+                logger.warning("Sentence transformer model could not be loaded")
+
+        # 저장된 프로필 임베딩이 어느 인코더로 계산되었는지 구분하는 식별자
+        self.encoder_id = MODEL_NAME if self.encoder_backend == 'torch' else f"{MODEL_NAME}@{self.encoder_backend}"
         
         # OpenAI client 초기화 (Additional Notes AI 분석용)
         self.openai_client = None
         if api_key:
             try:
-                self.openai_client = OpenAI(api_key=api_key)
-                print("[DEBUG] OpenAI client initialized for additional notes analysis")
+                # 키별로 캐시된 클라이언트 (매 호출 새 인스턴스를 만들어도 연결 풀은 재사용)
+                self.openai_client = get_openai_client(api_key, base_url)
+                logger.debug("OpenAI client initialized for additional notes analysis")
             except Exception as e:
-                print(f"[DEBUG] Failed to initialize OpenAI client: {e}")
+                logger.warning("Failed to initialize OpenAI client: %s", e)
                 self.openai_client = None
     
-    def calculate_keyword_score(self, user_context: UserContext, job_text: str) -> Dict[str, float]:
-        """키워드 규칙 기반 점수 계산"""
-        job_lower = job_text.lower()
-        scores = {}
-        
-        # 1. 기술 스택 매칭 (25% 가중치)
-        skill_matches = []
-        all_user_skills = []
-        
+    def calculate_keyword_score(self, user_context: UserContext, job_text: str,
+                                inputs: Optional[ScoreInputs] = None) -> Dict[str, float]:
+        """키워드 규칙 기반 구성요소별 가중 점수 (구성요소별로 입력이 바뀐 것만 다시 계산)"""
+        names = SCORING_COMPONENTS.names('keyword')
+        matrix, _ = SCORING_COMPONENTS.compute(self, [inputs or ScoreInputs(user_context, job_text)], names)
+        weighted = SCORING_COMPONENTS.aggregate(matrix, names, self.scoring_weights)['weighted'][0]
+        return {name: float(score) for name, score in zip(names, weighted)}
+    
+    def _analysis_mode(self) -> str:
+        """GPT 사용 여부 (같은 입력이라도 AI/키워드 분석 결과는 따로 캐시)"""
+        return "ai" if self.openai_client else "keyword"
+    
+    def _skill_match_score(self, user_context: UserContext, job_text: str) -> float:
+        """사용자 기술 스택 중 공고에 등장하는 비율"""
         # Skills와 Programming Languages를 모두 합쳐서 기술 스택으로 취급
-        if user_context.skills:
-            all_user_skills.extend(user_context.skills)
-        if user_context.programming_languages:
-            all_user_skills.extend(user_context.programming_languages)
+        all_user_skills = self._user_skills(user_context)
         
-        # 강화된 키워드 매칭 - 여러 표기법과 유사어 고려
-        for skill in all_user_skills:
-            skill_lower = skill.lower()
-            
-            # 기본 매칭
-            if skill_lower in job_lower:
-                skill_matches.append(skill)
-            else:
-                # 확장된 키워드 매칭 (유사어, 다른 표기법)
-                skill_variations = self._get_skill_variations(skill_lower)
-                for variation in skill_variations:
-                    if variation in job_lower:
-                        skill_matches.append(skill)
-                        break
+        # 스킬 어휘 id로 정규화한 뒤 공고 등장 마스크로 한 번에 매칭 (여러 표기법과 유사어 고려)
+        skill_ids = SKILL_VOCABULARY.skill_ids(all_user_skills)
+        skill_matches = [all_user_skills[i] for i in np.flatnonzero(self._skill_match_mask(skill_ids, job_text.lower()))]
         
         skill_score = len(skill_matches) / len(all_user_skills) if all_user_skills else 0
-        scores['skill_match'] = skill_score * 0.25
-        
-        print(f"[DEBUG] All user skills: {all_user_skills}")
-        print(f"[DEBUG] Skill matches found: {skill_matches}")
-        print(f"[DEBUG] Skill match rate: {skill_score} ({len(skill_matches)}/{len(all_user_skills)})")
-        
-        # 2. 직무/역할 매칭 (30% 가중치) - AI 기반으로 개선
-        role_score = self._calculate_role_match_score(user_context, job_text)
-        scores['role_match'] = role_score * 0.3
-        
-        # 3. 경력 요구사항 체크 (15% 가중치)
-        # 경력 요구사항 패턴 찾기 (예: "3+ years", "5년 이상" 등)
-        experience_patterns = [
-            r'(\d+)\+?\s*years?',  # 3+ years, 5 years
-            r'(\d+)년\s*이상',     # 3년 이상
-            r'(\d+)년\s*경력',     # 3년 경력
-        ]
-        
-        required_years = 0
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, job_lower)
-            if matches:
-                required_years = max(int(match) for match in matches)
-                break
-        
-        if required_years == 0:
-            experience_score = 0.5  # 경력 요구사항이 명시되지 않은 경우 중간 점수
-        else:
-            # 전체 경력 계산 (산업별 경력 합계)
-            total_experience = sum(user_context.experience_by_industry.values()) if user_context.experience_by_industry else 0
-            experience_score = min(1.0, total_experience / required_years)
         
-        scores['experience_match'] = experience_score * 0.15
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("All user skills: %s", all_user_skills)
+            logger.debug("Skill matches found: %s", skill_matches)
+            logger.debug("Skill match rate: %s (%s/%s)", skill_score, len(skill_matches), len(all_user_skills))
+        return skill_score
+    
+    def _experience_match_score(self, user_context: UserContext, job_text: str) -> float:
+        """공고의 요구 경력(범위면 하한) 대비 사용자 경력 비율"""
+        required_years = extract_requirements(job_text).min_years
+        if not required_years:
+            return 0.5  # 경력 요구사항이 명시되지 않은 경우 중간 점수
+        # 전체 경력 계산 (산업별 경력 합계)
+        total_experience = sum(user_context.experience_by_industry.values()) if user_context.experience_by_industry else 0
+        return min(1.0, total_experience / required_years)
+    
+    def _language_requirement_score(self, user_context: UserContext, job_text: str) -> float:
+        """공고가 요구하는 언어를 사용자가 요구 수준 이상으로 구사하는지"""
+        required = extract_requirements(job_text).language_levels
+        if not required:
+            # 추출 대상이 아닌 언어는 기존처럼 언어/수준 언급 여부로 판단
+            normalized_job = normalize(job_text)
+            for lang, level in user_context.languages.items():
+                if normalized_job.contains(lang) or normalized_job.contains(level):
+                    return 1.0
+            return 0.0
         
-        # 4. 언어 요구사항 체크 (10% 가중치)
-        language_score = 0
+        best = 0.0
         for lang, level in user_context.languages.items():
-            if lang.lower() in job_lower or level.lower() in job_lower:
-                language_score = 1.0
-                break
-        
-        scores['language_requirement'] = language_score * 0.1
-        
-        # 5. 교육/학위 매칭 (10% 가중치)
-        education_score = 0
+            language = canonical_language(lang)
+            if language not in required:
+                continue
+            required_level = required[language]
+            user_level = proficiency_rank(level)
+            # 요구 수준 미기재 또는 사용자 수준을 알 수 없으면 충족으로 간주, 미달이면 절반
+            best = max(best, 1.0 if not required_level or not user_level or user_level >= required_level else 0.5)
+        return best
+    
+    def _education_match_score(self, user_context: UserContext, job_text: str) -> float:
+        """학위/전공/학교 매칭"""
         education_keywords = [
             user_context.education_level.lower() if user_context.education_level else "",
             user_context.major.lower() if user_context.major else "",
             user_context.university.lower() if user_context.university else ""
         ]
         
+        normalized_job = normalize(job_text)
         for edu_keyword in education_keywords:
-            if edu_keyword and edu_keyword in job_lower:
-                education_score = 1.0
-                break
-        
-        # 일반적인 학위 키워드도 체크
-        degree_keywords = ['bachelor', 'master', 'phd', '학사', '석사', '박사', '대학교', '대학원']
-        if not education_score:
-            for keyword in degree_keywords:
-                if keyword in job_lower:
-                    if user_context.education_level and any(deg in user_context.education_level.lower() for deg in ['bachelor', 'master', 'phd', '학사', '석사', '박사']):
-                        education_score = 0.7
-                        break
-        
-        scores['education_match'] = education_score * 0.1
-        
-        # 6. Additional Notes 기반 AI 매칭 (10% 가중치)
-        additional_score = self._calculate_additional_notes_score(user_context, job_text)
-        scores['additional_notes_match'] = additional_score * 0.1
-        
-        return scores
+            if edu_keyword and normalized_job.contains(edu_keyword):
+                return 1.0
+        
+        # 공고의 최소 학위 요건과 사용자 학위 수준 비교
+        required_degree = extract_requirements(job_text).degree_level
+        user_degree = degree_rank(user_context.education_level)
+        if required_degree and user_degree:
+            return 0.7 if user_degree >= required_degree else 0.35
+        return 0.0
     
     def _get_skill_variations(self, skill_lower: str) -> List[str]:
         """스킬의 다양한 표기법과 유사어를 반환"""
         variations = set()
         
-        # 공통 매핑 사전
-        skill_mapping = {
-            # 프로그래밍 언어
-            'python': ['파이썬', 'python3', 'python2'],
-            'javascript': ['js', '자바스크립트', 'java script', 'ecmascript'],
-            'java': ['자바'],
-            'sql': ['에스큐엘', 'structured query language', 'sequel'],
-            'r': ['r language', 'r programming'],
-            'c++': ['cpp', 'c plus plus', 'cplusplus'],
-            'c#': ['csharp', 'c sharp'],
-            'golang': ['go', 'go language'],
-            'php': ['php7', 'php8'],
-            
-            # AI/ML/Data 기술
-            'rag': ['retrieval augmented generation', '검색 증강 생성', 'retrieval-augmented generation'],
-            'mcp': ['model context protocol'],
-            'llm': ['large language model', '대형 언어 모델', 'large language models'],
-            'nlp': ['natural language processing', '자연어 처리', 'natural language'],
-            'transformers': ['transformer', 'huggingface transformers', 'transformer models'],
-            'pytorch': ['torch', 'pytorch framework'],
-            'tensorflow': ['tf', 'tensor flow', 'tensorflow2'],
-            'scikit-learn': ['sklearn', 'scikit learn', 'sci-kit learn'],
-            'opencv': ['cv2', 'open cv', 'computer vision'],
-            'pandas': ['pd', 'pandas dataframe'],
-            'numpy': ['np', 'numerical python'],
-            
-            # 클라우드/인프라
-            'aws': ['amazon web services', 'amazon aws'],
-            'gcp': ['google cloud platform', 'google cloud'],
-            'azure': ['microsoft azure', 'azure cloud'],
-            'docker': ['containerization', '도커'],
-            'kubernetes': ['k8s', 'k8', '쿠버네티스'],
-            
-            # 데이터베이스
-            'mysql': ['my sql', 'mysql database'],
-            'postgresql': ['postgres', 'postgre sql', 'postgresql database'],
-            'mongodb': ['mongo db', 'mongo database'],
-            'redis': ['redis database', 'redis cache'],
-            
-            # 도구/프레임워크
-            'power bi': ['powerbi', '파워 BI', '파워비아이', 'microsoft power bi'],
-            'excel': ['엑셀', 'microsoft excel', 'ms excel', 'excel spreadsheet'],
-            'tableau': ['tableau desktop', 'tableau public'],
-            'git': ['github', 'git version control', 'version control'],
-            'react': ['reactjs', 'react.js', 'react framework'],
-            'vue': ['vuejs', 'vue.js', 'vue framework'],
-            'angular': ['angularjs', 'angular framework'],
-            'node.js': ['nodejs', 'node js', 'node'],
-            'django': ['django framework', 'django python'],
-            'flask': ['flask framework', 'flask python'],
-            'fastapi': ['fast api', 'fastapi framework'],
-            
-            # 기타
-            'api': ['rest api', 'restful api', 'web api'],
-            'html': ['html5', 'hypertext markup language'],
-            'css': ['css3', 'cascading style sheets'],
-            'json': ['javascript object notation'],
-            'xml': ['extensible markup language'],
-        }
-        
         # 매핑에서 찾기
-        if skill_lower in skill_mapping:
-            variations.update(skill_mapping[skill_lower])
+        if skill_lower in SKILL_MAPPING:
+            variations.update(SKILL_MAPPING[skill_lower])
         
         # 역방향 매핑 (값에서 키 찾기)
-        for key, values in skill_mapping.items():
-            if skill_lower in values:
-                variations.add(key)
-                variations.update(values)
+        key = _SKILL_REVERSE_MAPPING.get(skill_lower)
+        if key:
+            variations.add(key)
+            variations.update(SKILL_MAPPING[key])
         
-        # 기본 변형 패턴
-        variations.add(skill_lower.replace(' ', ''))  # 공백 제거
-        variations.add(skill_lower.replace('-', ''))  # 하이픈 제거
-        variations.add(skill_lower.replace('_', ''))  # 언더스코어 제거
-        variations.add(skill_lower.replace('.', ''))  # 점 제거
+        # 기본 변형 패턴 (공백/하이픈/언더스코어/점 제거)
+        variations.update(basic_variations(skill_lower))
         
         # 원본 스킬 제거
         variations.discard(skill_lower)
         
         return list(variations)
     
+    def _user_skills(self, user_context: UserContext) -> List[str]:
+        """Skills와 Programming Languages를 합친 사용자 기술 스택"""
+        all_user_skills = []
+        if user_context.skills:
+            all_user_skills.extend(user_context.skills)
+        if user_context.programming_languages:
+            all_user_skills.extend(user_context.programming_languages)
+        return all_user_skills
+    
+    def _skill_match_mask(self, skill_ids: np.ndarray, job_lower: str) -> np.ndarray:
+        """사용자 스킬 id별 공고 등장 여부 (bool 배열)"""
+        if skill_ids.size == 0:
+            return np.zeros(0, dtype=bool)
+        return SKILL_VOCABULARY.posting_mask(job_lower)[skill_ids]
+    
     def _calculate_role_match_score(self, user_context: UserContext, job_text: str) -> float:
         """직무/역할 매칭 스코어 계산 (AI 기반 + 키워드 fallback)"""
         if not user_context.target_roles:
@@ -229,66 +371,49 @@ class JobMatcher:
     def _ai_analyze_role_match(self, target_roles: List[str], job_text: str) -> float:
         """AI를 활용한 역할 매칭 분석"""
         try:
-            prompt = f"""
-사용자가 원하는 직무와 채용 공고의 직무 간 매칭도를 0-1 사이의 점수로 평가해주세요.
-
-**사용자 희망 직무:**
-{', '.join(target_roles)}
-
-**채용 공고 (일부):**
-{job_text[:1500]}
-
-평가 기준:
-1. 직무명이 정확히 일치하지 않아도 업무 내용이나 요구 역량이 유사한가?
-2. 사용자가 원하는 직무의 핵심 업무와 공고의 업무가 얼마나 관련성이 있는가?
-3. 커리어 발전 경로상 연관성이 있는가?
-
-예: "NLP Engineer"와 "AI Research Scientist"는 높은 관련성
-예: "Data Scientist"와 "Machine Learning Engineer"는 높은 관련성
-예: "Frontend Developer"와 "Backend Developer"는 중간 관련성
-
-응답 형식: 숫자만 반환 (예: 0.8)
-"""
-            
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert career counselor. Analyze the relevance between user's target roles and job posting. Consider semantic similarity, not just exact keyword matches. Return only a number between 0 and 1."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=50,
-                temperature=0.3
+            # 고정 prefix (지침 + 희망 직무) 뒤에 공고를 붙여 provider 측 prompt 캐시를 재사용
+            messages = build_prefixed_messages(
+                ROLE_MATCH_SYSTEM_PROMPT,
+                f"**사용자 희망 직무:**\n{', '.join(target_roles)}",
+                f"**채용 공고 (주요 요구사항):**\n{job_excerpt_for(job_text, 'role_match', 'gpt-3.5-turbo')}"
             )
+            with span("gpt.role_match", model="gpt-3.5-turbo") as gpt_span:
+                record_prompt_tokens(gpt_span, messages, "gpt-3.5-turbo")
+                response = chat_completion(
+                    self.openai_client,
+                    model="gpt-3.5-turbo",
+                    messages=messages,
+                    max_tokens=50,
+                    temperature=0.3
+                )
+                record_usage(gpt_span, response)
             
             score_text = response.choices[0].message.content.strip()
             
             # 숫자 추출
-            import re
-            numbers = re.findall(r'0?\.\d+|0|1', score_text)
+            numbers = SCORE_PATTERN.findall(score_text)
             if numbers:
                 score = float(numbers[0])
                 score = max(0.0, min(1.0, score))  # 0-1 범위 강제
-                print(f"[DEBUG] AI Role Match Score: {score}")
+                logger.debug("AI Role Match Score: %s", score)
                 return score
             else:
-                print(f"[DEBUG] AI returned invalid role score: {score_text}")
+                logger.debug("AI returned invalid role score: %s", score_text)
+                mark_uncacheable()
                 return self._keyword_analyze_role_match(target_roles, job_text)
                 
         except Exception as e:
-            print(f"[DEBUG] AI role analysis failed: {e}")
+            logger.warning("AI role analysis failed: %s", e)
+            mark_uncacheable()
             return self._keyword_analyze_role_match(target_roles, job_text)
     
     def _keyword_analyze_role_match(self, target_roles: List[str], job_text: str) -> float:
         """키워드 기반 역할 매칭 (AI 없을 때 fallback)"""
-        job_lower = job_text.lower()
-        role_matches = []
-        
-        for role in target_roles:
-            if role.lower() in job_lower:
-                role_matches.append(role)
+        normalized_job = normalize(job_text)
+        role_matches = [role for role in target_roles if normalized_job.contains(role)]
         
         role_score = len(role_matches) / len(target_roles) if target_roles else 0
-        print(f"[DEBUG] Keyword Role Match Score: {role_score}")
+        logger.debug("Keyword Role Match Score: %s", role_score)
         return role_score
     
     def _calculate_additional_notes_score(self, user_context: UserContext, job_text: str) -> float:
@@ -305,113 +430,210 @@ class JobMatcher:
     def _ai_analyze_additional_notes(self, additional_notes: str, job_text: str) -> float:
         """AI를 활용한 Additional Notes 분석"""
         try:
-            prompt = f"""
-사용자의 추가 정보와 채용 공고 간의 매칭도를 0-1 사이의 점수로 평가해주세요.
-
-**사용자 추가 정보:**
-{additional_notes}
-
-**채용 공고 (일부):**
-{job_text[:1500]}
-
-평가 기준:
-1. 사용자의 관심사, 경험, 목표가 채용 공고의 요구사항이나 업무 내용과 얼마나 관련성이 있는가?
-2. 사용자가 언급한 프로젝트, 기술, 경험이 해당 직무에 얼마나 적합한가?
-3. 사용자의 커리어 목표나 관심 분야가 해당 회사/직무와 얼마나 일치하는가?
-
-응답 형식: 숫자만 반환 (예: 0.7)
-"""
-            
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert career counselor. Analyze the relevance between user's additional notes and job posting. Return only a number between 0 and 1."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=50,
-                temperature=0.3
+            messages = build_prefixed_messages(
+                NOTES_MATCH_SYSTEM_PROMPT,
+                f"**사용자 추가 정보:**\n{truncate_to_tokens(additional_notes, PROMPT_BUDGETS['notes'], 'gpt-3.5-turbo')}",
+                f"**채용 공고 (주요 요구사항):**\n{job_excerpt_for(job_text, 'additional_notes', 'gpt-3.5-turbo')}"
             )
+            with span("gpt.additional_notes", model="gpt-3.5-turbo") as gpt_span:
+                record_prompt_tokens(gpt_span, messages, "gpt-3.5-turbo")
+                response = chat_completion(
+                    self.openai_client,
+                    model="gpt-3.5-turbo",
+                    messages=messages,
+                    max_tokens=50,
+                    temperature=0.3
+                )
+                record_usage(gpt_span, response)
             
             score_text = response.choices[0].message.content.strip()
             
             # 숫자 추출
-            import re
-            numbers = re.findall(r'0?\.\d+|0|1', score_text)
+            numbers = SCORE_PATTERN.findall(score_text)
             if numbers:
                 score = float(numbers[0])
                 score = max(0.0, min(1.0, score))  # 0-1 범위 강제
-                print(f"[DEBUG] AI Additional Notes Score: {score}")
+                logger.debug("AI Additional Notes Score: %s", score)
                 return score
             else:
-                print(f"[DEBUG] AI returned invalid score: {score_text}")
+                logger.debug("AI returned invalid score: %s", score_text)
+                mark_uncacheable()
                 return self._keyword_analyze_additional_notes(additional_notes, job_text)
                 
         except Exception as e:
-            print(f"[DEBUG] AI additional notes analysis failed: {e}")
+            logger.warning("AI additional notes analysis failed: %s", e)
+            mark_uncacheable()
             return self._keyword_analyze_additional_notes(additional_notes, job_text)
     
     def _keyword_analyze_additional_notes(self, additional_notes: str, job_text: str) -> float:
         """키워드 기반 Additional Notes 분석 (AI 없을 때 fallback)"""
-        additional_notes_lower = additional_notes.lower()
-        job_lower = job_text.lower()
-        
-        # Additional Notes의 키워드들을 공고와 비교
-        notes_keywords = re.findall(r'\b\w+\b', additional_notes_lower)
-        job_keywords = re.findall(r'\b\w+\b', job_lower)
+        # Additional Notes의 키워드들을 공고와 비교 (조사 제거된 정규화 토큰 집합)
+        notes_keywords = normalize(additional_notes).token_set
+        job_keywords = normalize(job_text).token_set
         
         if notes_keywords and job_keywords:
             # 교집합 비율 계산
-            common_keywords = set(notes_keywords) & set(job_keywords)
-            additional_score = len(common_keywords) / len(set(notes_keywords)) if notes_keywords else 0
+            common_keywords = notes_keywords & job_keywords
+            additional_score = len(common_keywords) / len(notes_keywords)
             additional_score = min(1.0, additional_score * 2)  # 가중치 적용
-            print(f"[DEBUG] Keyword Additional Notes Score: {additional_score}")
+            logger.debug("Keyword Additional Notes Score: %s", additional_score)
             return additional_score
         
         return 0.0
     
     def calculate_embedding_similarity(self, user_context: UserContext, job_text: str) -> float:
-        """임베딩 유사도 계산"""
+        """임베딩 유사도 계산 (필드별 유사도의 가중 평균)"""
+        similarity, _ = self._calculate_embedding_components(user_context, job_text)
+        return similarity
+
+    def _calculate_embedding_components(self, user_context: UserContext, job_text: str) -> Tuple[float, Dict[str, float]]:
+        """전체 임베딩 유사도와 프로필 필드별 유사도 구성요소 계산"""
         if not self.model:
-            print("[DEBUG] Sentence transformer model not available, using keyword-based fallback")
+            logger.debug("Sentence transformer model not available, using keyword-based fallback")
             # 모델이 없으면 키워드 기반 유사도 계산
-            return self._calculate_keyword_similarity_fallback(user_context, job_text)
-        
+            return self._calculate_keyword_similarity_fallback(user_context, job_text), {}
+
         try:
-            # 사용자 컨텍스트를 텍스트로 변환
-            user_text = self._context_to_text(user_context)
-            
-            # 임베딩 계산
-            user_embedding = self.model.encode([user_text])
-            job_embedding = self.model.encode([job_text])
-            
-            # 코사인 유사도 계산
-            similarity = np.dot(user_embedding[0], job_embedding[0]) / (
-                np.linalg.norm(user_embedding[0]) * np.linalg.norm(job_embedding[0])
-            )
-            
-            return float(similarity)
-            
+            field_similarities = self.calculate_field_similarities(user_context, job_text)
+            return self._aggregate_field_similarities(field_similarities), field_similarities
+
         except Exception as e:
-            print(f"[DEBUG] Embedding similarity calculation failed: {e}")
-            return self._calculate_keyword_similarity_fallback(user_context, job_text)
-    
-    def _calculate_keyword_similarity_fallback(self, user_context: UserContext, job_text: str) -> float:
-        """임베딩 모델이 없을 때 키워드 기반 유사도 계산"""
-        user_text = self._context_to_text(user_context)
-        
-        # 사용자 텍스트와 공고 텍스트를 단어 단위로 분리
-        user_words = set(re.findall(r'\b\w+\b', user_text.lower()))
-        job_words = set(re.findall(r'\b\w+\b', job_text.lower()))
-        
-        # 자카드 유사도 계산
-        if not user_words or not job_words:
+            logger.warning("Embedding similarity calculation failed: %s", e)
+            mark_uncacheable()
+            return self._calculate_keyword_similarity_fallback(user_context, job_text), {}
+
+    def calculate_field_similarities(self, user_context: UserContext, job_text: str) -> Dict[str, float]:
+        """프로필 필드 × 공고 섹션 유사도 행렬로 필드별 유사도 계산"""
+        # 프로필 필드 임베딩은 저장 시 미리 계산된 값을 재사용
+        profile_embeddings = self.get_profile_embeddings(user_context)
+        fields = [field for field in FIELD_WEIGHTS if field in profile_embeddings]
+        if not fields:
+            return {}
+
+        # 같은 공고를 다시 분석하면 청크 임베딩 재사용
+        chunk_key = f"{self.encoder_id}:{text_hash(job_text)}"
+        chunk_embeddings = _job_chunk_embedding_cache.get(chunk_key)
+        if chunk_embeddings is None:
+            # 요구사항 섹션만 남기고, 모델 입력 길이를 넘지 않도록 섹션 단위 창으로 분할
+            count_tokens, max_tokens = encoder_token_budget(self.model)
+            job_chunks = chunk_job_text(get_focus_text(job_text), max_tokens=max_tokens,
+                                        count_tokens=count_tokens) or [job_text]
+
+            # 모든 청크를 한 번의 배치로 임베딩 (정규화된 벡터)
+            with span("encode.job_chunks", chunks=len(job_chunks)):
+                chunk_embeddings = self.model.encode(job_chunks, normalize_embeddings=True)
+            _remember_embedding(_job_chunk_embedding_cache, chunk_key, chunk_embeddings, _JOB_CHUNK_CACHE_SIZE)
+
+        # (필드 수 × 청크 수) 코사인 유사도 행렬을 한 번의 행렬곱으로 계산 후 필드별 top-k 평균 풀링
+        field_matrix = np.stack([profile_embeddings[field] for field in fields])
+        similarity_matrix = field_matrix @ np.asarray(chunk_embeddings).T
+        pooled = self._pool_similarities(similarity_matrix)
+
+        return {field: float(score) for field, score in zip(fields, pooled)}
+
+    def _aggregate_field_similarities(self, field_similarities: Dict[str, float]) -> float:
+        """필드별 유사도를 가중 평균 (비어 있는 필드의 가중치는 나머지에 재분배)"""
+        if not field_similarities:
             return 0.0
-        
-        intersection = user_words & job_words
-        union = user_words | job_words
-        
-        similarity = len(intersection) / len(union) if union else 0.0
-        return min(1.0, similarity * 3)  # 0-1 범위로 정규화
+        weights = np.array([FIELD_WEIGHTS[field] for field in field_similarities])
+        scores = np.array(list(field_similarities.values()))
+        return float(np.dot(weights, scores) / weights.sum())
+
+    def _profile_field_texts(self, user_context: UserContext) -> Dict[str, str]:
+        """임베딩할 프로필 필드별 텍스트 (비어 있는 필드는 제외)"""
+        field_texts = {}
+
+        if user_context.target_roles:
+            field_texts['roles'] = f"Target roles: {', '.join(user_context.target_roles)}"
+        if user_context.experience_by_industry:
+            experience_text = ", ".join([f"{industry}({years}년)" for industry, years in user_context.experience_by_industry.items()])
+            field_texts['experience'] = f"Experience: {experience_text}"
+
+        all_skills = list(user_context.skills or []) + list(user_context.programming_languages or [])
+        if all_skills:
+            field_texts['skills'] = f"Skills: {', '.join(all_skills)}"
+        if user_context.languages:
+            field_texts['languages'] = f"Languages: {', '.join([f'{lang}({level})' for lang, level in user_context.languages.items()])}"
+        if user_context.projects:
+            field_texts['projects'] = f"Projects: {self._format_projects(user_context.projects)}"
+        if user_context.certifications:
+            field_texts['certifications'] = f"Certifications: {', '.join(user_context.certifications)}"
+        if user_context.additional_notes and user_context.additional_notes.strip():
+            field_texts['notes'] = f"Additional notes: {user_context.additional_notes}"
+
+        return field_texts
+
+    def _encode_profile_fields(self, user_context: UserContext) -> Dict[str, np.ndarray]:
+        """프로필 필드별 텍스트를 한 번의 배치로 임베딩 (텍스트가 그대로인 필드는 이전 벡터 재사용)"""
+        field_texts = self._profile_field_texts(user_context)
+        embeddings = {}
+        missing = []
+        for field, text in field_texts.items():
+            vector = _field_embedding_cache.get(f"{self.encoder_id}:{text_hash(text)}")
+            if vector is None:
+                missing.append(field)
+            else:
+                embeddings[field] = vector
+        if missing:
+            with span("encode.profile_fields", fields=len(missing), reused=len(embeddings)):
+                vectors = self.model.encode([field_texts[field] for field in missing], normalize_embeddings=True)
+            for field, vector in zip(missing, vectors):
+                embeddings[field] = vector
+                _remember_embedding(_field_embedding_cache, f"{self.encoder_id}:{text_hash(field_texts[field])}",
+                                    vector, _FIELD_EMBEDDING_CACHE_SIZE)
+        # 필드 순서는 항상 _profile_field_texts 순서로 유지
+        return {field: embeddings[field] for field in field_texts}
+
+    def get_profile_embeddings(self, user_context: UserContext, context_path: Optional[str] = None) -> Optional[Dict[str, np.ndarray]]:
+        """프로필 필드별 임베딩 반환 (메모리 캐시 → 저장된 파일 → 새로 계산 순)"""
+        if not self.model:
+            return None
+
+        content_hash = profile_content_hash(user_context)
+        cache_key = f"{self.encoder_id}:{content_hash}"
+        cached = _profile_embedding_cache.get(cache_key)
+        if cached is not None:
+            _profile_embedding_cache.move_to_end(cache_key)
+            return cached
+
+        if context_path is None:
+            context_path = os.path.join("data/user_contexts", get_context_filename(user_context))
+
+        embeddings = load_profile_embeddings(context_path, content_hash, self.encoder_id)
+        if embeddings is None:
+            logger.debug("Precomputed profile embeddings missing or stale, encoding profile")
+            embeddings = self._encode_profile_fields(user_context)
+
+        _remember_profile_embeddings(cache_key, embeddings)
+        return embeddings
+
+    def precompute_profile_embeddings(self, user_context: UserContext, context_path: str) -> Optional[str]:
+        """프로필 저장 시 필드별 임베딩을 미리 계산하여 JSON 옆에 저장"""
+        if not self.model:
+            return None
+
+        content_hash = profile_content_hash(user_context)
+        embeddings = self._encode_profile_fields(user_context)
+        _remember_profile_embeddings(f"{self.encoder_id}:{content_hash}", embeddings)
+        return save_profile_embeddings(context_path, content_hash, self.encoder_id, embeddings)
+
+    def _pool_similarities(self, similarities: np.ndarray, pooling: str = "topk", top_k: int = 3) -> np.ndarray:
+        """청크별 유사도를 마지막 축 기준으로 집계 (max 또는 top-k 평균)"""
+        if pooling == "max":
+            return np.max(similarities, axis=-1)
+
+        k = min(top_k, similarities.shape[-1])
+        top_scores = np.partition(similarities, -k, axis=-1)[..., -k:]
+        return np.mean(top_scores, axis=-1)
+
+    def _calculate_keyword_similarity_fallback(self, user_context: UserContext, job_text: str) -> float:
+        """임베딩 모델이 없을 때 공고 코퍼스 IDF 기반 TF-IDF 코사인 유사도"""
+        return JOB_INDEX.similarity(self._context_to_text(user_context), job_text)
+
+    def prefilter_jobs(self, user_context: UserContext, job_texts: List[str], top_k: int = PREFILTER_TOP_K) -> List[int]:
+        """임베딩/GPT 분석 전에 BM25 점수로 후보 공고를 추림 (job_texts 안의 위치 목록)"""
+        with span("lexical.prefilter", jobs=len(job_texts), top_k=top_k):
+            return JOB_INDEX.top_k(self._context_to_text(user_context), job_texts, top_k)
     
     def _context_to_text(self, user_context: UserContext) -> str:
         """사용자 컨텍스트를 텍스트로 변환"""
@@ -436,20 +658,7 @@ class JobMatcher:
             text_parts.append(f"Education: {user_context.education_level} in {user_context.major}")
         
         if user_context.projects:
-            project_texts = []
-            for project in user_context.projects:
-                if isinstance(project, dict):
-                    project_info = project.get('name', '')
-                    if project.get('description'):
-                        project_info += f": {project.get('description', '')}"
-                    if project.get('tech_stack'):
-                        project_info += f" (기술: {project.get('tech_stack', '')})"
-                    if project.get('organization'):
-                        project_info += f" @ {project.get('organization', '')}"
-                    project_texts.append(project_info)
-                else:
-                    project_texts.append(str(project))
-            text_parts.append(f"Projects: {', '.join(project_texts)}")
+            text_parts.append(f"Projects: {self._format_projects(user_context.projects)}")
         
         if user_context.certifications:
             text_parts.append(f"Certifications: {', '.join(user_context.certifications)}")
@@ -461,66 +670,86 @@ class JobMatcher:
             text_parts.append(f"Additional notes: {user_context.additional_notes}")
         
         return " ".join(text_parts)
+
+    def _format_projects(self, projects: List) -> str:
+        """프로젝트 목록을 텍스트로 변환"""
+        project_texts = []
+        for project in projects:
+            if isinstance(project, Mapping):
+                project_info = project.get('name', '')
+                if project.get('description'):
+                    project_info += f": {project.get('description', '')}"
+                if project.get('tech_stack'):
+                    project_info += f" (기술: {project.get('tech_stack', '')})"
+                if project.get('organization'):
+                    project_info += f" @ {project.get('organization', '')}"
+                project_texts.append(project_info)
+            else:
+                project_texts.append(str(project))
+        return ', '.join(project_texts)
     
+    @traced("calculate_match_score")
     def calculate_overall_score(self, user_context: UserContext, job_text: str) -> Dict[str, any]:
-        """전체 매칭 점수 계산"""
-        # 키워드 기반 점수 계산
-        keyword_scores = self.calculate_keyword_score(user_context, job_text)
-        keyword_total = sum(keyword_scores.values())
-        
-        # 임베딩 유사도 계산
-        embedding_similarity = self.calculate_embedding_similarity(user_context, job_text)
-        
-        # 최종 점수 계산 (키워드 70% + 임베딩 30%)
-        final_score = (keyword_total * 0.7) + (embedding_similarity * 0.3)
-        
-        # 디버깅 정보 출력
-        print(f"[DEBUG] Keyword scores: {keyword_scores}")
-        print(f"[DEBUG] Keyword total: {keyword_total}")
-        print(f"[DEBUG] Embedding similarity: {embedding_similarity}")
-        print(f"[DEBUG] Final score: {final_score}")
-        print(f"[DEBUG] Model loaded: {self.model is not None}")
-        
-        return {
-            'overall_score': round(final_score * 100, 1),  # 백분율로 변환
-            'keyword_score': round(keyword_total * 100, 1),
-            'embedding_similarity': round(embedding_similarity * 100, 1),
-            'detailed_scores': keyword_scores,
-            'matched_skills': self._get_matched_skills(user_context, job_text),
-            'missing_skills': self._get_missing_skills(user_context, job_text)
-        }
+        """전체 매칭 점수 계산 (이전 분석과 입력이 같은 구성요소는 캐시 재사용)"""
+        return self.score_pairs([(user_context, job_text)])[0]
+
+    def score_pairs(self, pairs: List[Tuple[UserContext, str]],
+                    weights: Optional[ScoringWeights] = None) -> List[Dict[str, any]]:
+        """(프로필, 공고) 쌍 배치의 매칭 결과 (구성요소 행렬 한 번 계산 후 가중합으로 집계)"""
+        batch = [ScoreInputs(user_context, job_text) for user_context, job_text in pairs]
+        # 분석한 공고를 어휘 인덱스에 추가 (IDF 증분 갱신)
+        JOB_INDEX.add_many([job_text for _, job_text in pairs])
+        
+        # 키워드 구성요소 + 임베딩 유사도 (모델이 없으면 키워드 유사도) 점수 행렬
+        keyword_names = SCORING_COMPONENTS.names('keyword')
+        names = keyword_names + SCORING_COMPONENTS.names('embedding')
+        matrix, values = SCORING_COMPONENTS.compute(self, batch, names)
+        aggregated = SCORING_COMPONENTS.aggregate(matrix, names, weights or self.scoring_weights)
+        embedding_column = names.index('embedding')
+        
+        results = []
+        for row, inputs in enumerate(batch):
+            matched_skills = COMPONENT_CACHE.get_or_compute(
+                'matched_skills', inputs, lambda: self._get_matched_skills(inputs.user_context, inputs.job_text))
+            missing_skills = COMPONENT_CACHE.get_or_compute(
+                'missing_skills', inputs, lambda: self._get_missing_skills(inputs.user_context, inputs.job_text),
+                self._analysis_mode())
+            keyword_total = float(aggregated['keyword_total'][row])
+            embedding_similarity = float(matrix[row, embedding_column])
+            final_score = float(aggregated['final'][row])
+            _, embedding_components = values['embedding'][row]
+            
+            # 디버깅 정보 출력 (DEBUG 레벨이 꺼져 있으면 인자 평가도 생략)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Keyword scores: %s", dict(zip(keyword_names, aggregated['weighted'][row])))
+                logger.debug("Keyword total: %s", keyword_total)
+                logger.debug("Embedding similarity: %s", embedding_similarity)
+                logger.debug("Final score: %s", final_score)
+                logger.debug("Model loaded: %s", self.model is not None)
+            
+            results.append({
+                'overall_score': round(final_score * 100, 1),  # 백분율로 변환
+                'keyword_score': round(keyword_total * 100, 1),
+                'embedding_similarity': round(embedding_similarity * 100, 1),
+                'detailed_scores': {name: float(aggregated['weighted'][row, column])
+                                    for column, name in enumerate(keyword_names)},
+                'embedding_components': {field: round(score * 100, 1) for field, score in embedding_components.items()},
+                'matched_skills': matched_skills,
+                'missing_skills': missing_skills
+            })
+        
+        active_span = current_span()
+        if active_span is not None:
+            active_span.set('components_reused', sum(inputs.reused for inputs in batch))
+            active_span.set('components_computed', sum(inputs.computed for inputs in batch))
+        return results
     
     def _get_matched_skills(self, user_context: UserContext, job_text: str) -> List[str]:
-        """매칭된 스킬 목록 반환 (강화된 키워드 매칭 사용)"""
-        job_lower = job_text.lower()
-        matched = []
-        all_user_skills = []
-        
-        # 모든 스킬 통합
-        if user_context.skills:
-            all_user_skills.extend(user_context.skills)
-        if user_context.programming_languages:
-            all_user_skills.extend(user_context.programming_languages)
-        
-        # 강화된 키워드 매칭으로 매칭된 스킬 찾기
-        for skill in all_user_skills:
-            skill_lower = skill.lower()
-            skill_matched = False
-            
-            # 기본 매칭
-            if skill_lower in job_lower:
-                matched.append(skill)
-                skill_matched = True
-            else:
-                # 확장된 키워드 매칭
-                skill_variations = self._get_skill_variations(skill_lower)
-                for variation in skill_variations:
-                    if variation in job_lower:
-                        matched.append(skill)
-                        skill_matched = True
-                        break
-        
-        return matched
+        """매칭된 스킬 목록 반환 (스킬 어휘 id + 공고 마스크 사용)"""
+        all_user_skills = self._user_skills(user_context)
+        skill_ids = SKILL_VOCABULARY.skill_ids(all_user_skills)
+        mask = self._skill_match_mask(skill_ids, job_text.lower())
+        return [all_user_skills[i] for i in np.flatnonzero(mask)]
     
     def _get_missing_skills(self, user_context: UserContext, job_text: str) -> List[str]:
         """공고에서 요구하지만 사용자가 없는 스킬 목록"""
@@ -540,44 +769,24 @@ class JobMatcher:
             if user_context.programming_languages:
                 user_all_skills.extend(user_context.programming_languages)
             
-            prompt = f"""
-다음 채용 공고에서 요구하는 기술들 중에서 사용자가 보유하지 않은 기술들을 찾아주세요.
-
-**사용자 보유 기술:**
-{', '.join(user_all_skills) if user_all_skills else '없음'}
-
-**채용 공고 (일부):**
-{job_text[:1500]}
-
-중요한 지침:
-1. 채용 공고에서 명시적으로 요구하거나 언급된 기술들을 식별하세요
-2. 사용자가 이미 보유한 기술은 절대 포함하지 마세요
-3. 유사한 기술은 같은 것으로 취급하세요:
-   - "RAG" = "Retrieval Augmented Generation" = "검색 증강 생성"
-   - "MCP" = "Model Context Protocol" 
-   - "Power BI" = "PowerBI" = "파워 BI"
-   - "Excel" = "엑셀" = "Microsoft Excel"
-   - "Python" = "파이썬"
-   - "SQL" = "에스큐엘" = "Structured Query Language"
-4. 대소문자나 표기법이 다른 경우도 같은 기술로 취급하세요
-5. 사용자가 보유한 기술과 겹치는 것은 절대 "부족한 기술"로 분류하지 마세요
-
-응답 형식: 콤마로 구분된 기술 이름만 반환 (예: Docker, Kubernetes, React)
-사용자가 필요한 기술을 모두 보유했다면 "없음"이라고 반환하세요.
-"""
-            
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert technical recruiter. Analyze job postings to identify required skills that candidates lack. Be precise and avoid false positives."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=200,
-                temperature=0.3
+            messages = build_prefixed_messages(
+                MISSING_SKILLS_SYSTEM_PROMPT,
+                f"**사용자 보유 기술:**\n{', '.join(user_all_skills) if user_all_skills else '없음'}",
+                f"**채용 공고 (주요 요구사항):**\n{job_excerpt_for(job_text, 'missing_skills', 'gpt-3.5-turbo')}"
             )
+            with span("gpt.missing_skills", model="gpt-3.5-turbo") as gpt_span:
+                record_prompt_tokens(gpt_span, messages, "gpt-3.5-turbo")
+                response = chat_completion(
+                    self.openai_client,
+                    model="gpt-3.5-turbo",
+                    messages=messages,
+                    max_tokens=200,
+                    temperature=0.3
+                )
+                record_usage(gpt_span, response)
             
             result = response.choices[0].message.content.strip()
-            print(f"[DEBUG] AI missing skills analysis: {result}")
+            logger.debug("AI missing skills analysis: %s", result)
             
             if result.lower() in ['없음', 'none', 'no missing skills']:
                 return []
@@ -586,11 +795,12 @@ class JobMatcher:
             missing_skills = [skill.strip() for skill in result.split(',') if skill.strip()]
             missing_skills = missing_skills[:5]  # 최대 5개
             
-            print(f"[DEBUG] AI identified missing skills: {missing_skills}")
+            logger.debug("AI identified missing skills: %s", missing_skills)
             return missing_skills
             
         except Exception as e:
-            print(f"[DEBUG] AI missing skills analysis failed: {e}")
+            logger.warning("AI missing skills analysis failed: %s", e)
+            mark_uncacheable()
             return self._keyword_analyze_missing_skills(user_context, job_text)
     
     def _keyword_analyze_missing_skills(self, user_context: UserContext, job_text: str) -> List[str]:
@@ -598,64 +808,92 @@ class JobMatcher:
         job_lower = job_text.lower()
         
         # 사용자의 모든 스킬 통합
-        user_all_skills = []
-        if user_context.skills:
-            user_all_skills.extend(user_context.skills)
-        if user_context.programming_languages:
-            user_all_skills.extend(user_context.programming_languages)
-        
-        print(f"[DEBUG] User skills (keyword fallback): {user_all_skills}")
+        user_all_skills = self._user_skills(user_context)
         
-        # 핵심 기술들과 변형 확인
-        core_skills = [
-            'Python', 'Java', 'JavaScript', 'SQL', 'R', 'TensorFlow', 'PyTorch', 
-            'AWS', 'Docker', 'Kubernetes', 'React', 'Vue.js', 'Node.js', 
-            'MongoDB', 'PostgreSQL', 'MySQL', 'RAG', 'MCP', 'Power BI', 'Excel'
-        ]
+        logger.debug("User skills (keyword fallback): %s", user_all_skills)
         
-        missing = []
-        for skill in core_skills:
-            skill_lower = skill.lower()
-            
-            # 공고에 이 스킬이 언급되어 있는지 확인
-            skill_mentioned = False
-            if skill_lower in job_lower:
-                skill_mentioned = True
-            else:
-                # 변형 확인
-                variations = self._get_skill_variations(skill_lower)
-                for variation in variations:
-                    if variation in job_lower:
-                        skill_mentioned = True
-                        break
-            
-            if skill_mentioned:
-                # 사용자가 이 스킬을 보유하고 있는지 확인
-                user_has_skill = False
-                for user_skill in user_all_skills:
-                    user_skill_lower = user_skill.lower()
-                    if (user_skill_lower == skill_lower or 
-                        skill_lower in self._get_skill_variations(user_skill_lower) or
-                        user_skill_lower in self._get_skill_variations(skill_lower)):
-                        user_has_skill = True
-                        break
-                
-                if not user_has_skill:
-                    missing.append(skill)
-                    print(f"[DEBUG] Keyword missing skill found: {skill}")
+        # 공고에 언급된 핵심 기술 중 사용자 스킬 id에 없는 것 (어휘 마스크 집합 연산)
+        posting_mask = SKILL_VOCABULARY.posting_mask(job_lower)
+        user_ids = SKILL_VOCABULARY.skill_ids(user_all_skills)
+        core_ids = SKILL_VOCABULARY.core_ids
+        missing_mask = posting_mask[core_ids] & ~np.isin(core_ids, user_ids)
+        missing = [SKILL_VOCABULARY.core_skill_names[i] for i in np.flatnonzero(missing_mask)]
         
-        print(f"[DEBUG] Keyword final missing skills: {missing}")
+        logger.debug("Keyword missing skills: %s", missing)
         return missing[:5]
 
-# 전역 인스턴스 (API 키 없이)
-_global_matcher = JobMatcher()
+def _cached_component(component: str, method, by_mode: bool = False):
+    """JobMatcher 메서드(user_context, job_text)를 구성요소 캐시를 거쳐 배치에 적용하는 구성요소 함수"""
+    def compute(matcher: JobMatcher, batch: List[ScoreInputs]) -> List[float]:
+        # GPT 사용 여부에 따라 결과가 달라지는 구성요소는 분석 방식별로 따로 캐시
+        variant = matcher._analysis_mode() if by_mode else ""
+        return [COMPONENT_CACHE.get_or_compute(
+                    component, inputs, lambda inputs=inputs: method(matcher, inputs.user_context, inputs.job_text),
+                    variant)
+                for inputs in batch]
+    return compute
+
+def _embedding_component(matcher: JobMatcher, batch: List[ScoreInputs]) -> List[Tuple[float, Dict[str, float]]]:
+    """(임베딩 유사도, 필드별 유사도) 목록 (모델이 없으면 키워드 유사도)"""
+    component = 'embedding' if matcher.model else 'keyword_similarity'
+    return [COMPONENT_CACHE.get_or_compute(
+                component, inputs,
+                lambda inputs=inputs: matcher._calculate_embedding_components(inputs.user_context, inputs.job_text),
+                matcher.encoder_id)
+            for inputs in batch]
+
+# 등록 순서가 detailed_scores 순서 (가중치는 utils/scoring.py 설정)
+SCORING_COMPONENTS.register('skill_match', _cached_component('skill_match', JobMatcher._skill_match_score))
+SCORING_COMPONENTS.register('role_match', _cached_component('role_match', JobMatcher._calculate_role_match_score, by_mode=True))
+SCORING_COMPONENTS.register('experience_match', _cached_component('experience_match', JobMatcher._experience_match_score))
+SCORING_COMPONENTS.register('language_requirement',
+                            _cached_component('language_requirement', JobMatcher._language_requirement_score))
+SCORING_COMPONENTS.register('education_match', _cached_component('education_match', JobMatcher._education_match_score))
+SCORING_COMPONENTS.register('additional_notes_match',
+                            _cached_component('additional_notes_match', JobMatcher._calculate_additional_notes_score,
+                                              by_mode=True))
+SCORING_COMPONENTS.register('embedding', _embedding_component, group='embedding', to_score=lambda value: value[0])
 
-def calculate_match_score(user_context: UserContext, job_text: str, api_key: Optional[str] = None) -> Dict[str, any]:
+# 공고 코퍼스(IDF)를 읽는 구성요소는 인덱스가 바뀌면 캐시를 쓰지 않음
+register_state_version(('keyword_similarity',), lambda: JOB_INDEX.version)
+
+# 전역 인스턴스 (API 키 없이, 모듈 import 시 모델 로드를 피하기 위해 첫 호출 시 생성)
+_global_matcher: Optional[JobMatcher] = None
+
+def _get_global_matcher() -> JobMatcher:
+    """전역 JobMatcher 인스턴스 반환"""
+    global _global_matcher
+    if _global_matcher is None:
+        _global_matcher = JobMatcher()
+    return _global_matcher
+
+def clear_score_caches() -> None:
+    """구성요소 결과, 공고 청크 임베딩, 텍스트 정규화 캐시 비우기 (벤치마크에서 매번 새로 계산할 때 사용)"""
+    COMPONENT_CACHE.clear()
+    _job_chunk_embedding_cache.clear()
+    normalize.cache_clear()
+
+def _match_request_key(user_context: UserContext, job_text: str, api_key: Optional[str] = None,
+                       base_url: Optional[str] = None) -> str:
+    """같은 프로필 × 같은 공고 × 같은 API 설정이면 같은 키"""
+    return text_hash(f"{profile_content_hash(user_context)}|{text_hash(job_text)}|{text_hash(api_key or '')}|{base_url or ''}")
+
+@single_flight("match_score", _match_request_key)
+def calculate_match_score(user_context: UserContext, job_text: str, api_key: Optional[str] = None,
+                          base_url: Optional[str] = None) -> Dict[str, any]:
     """매칭 점수 계산 함수 (외부에서 호출용)"""
     if api_key:
         # API 키가 있으면 새로운 인스턴스 생성 (AI 분석 포함)
-        matcher = JobMatcher(api_key=api_key)
+        matcher = JobMatcher(api_key=api_key, base_url=base_url)
         return matcher.calculate_overall_score(user_context, job_text)
     else:
         # API 키가 없으면 전역 인스턴스 사용 (키워드 기반)
-        return _global_matcher.calculate_overall_score(user_context, job_text) 
\ No newline at end of file
+        return _get_global_matcher().calculate_overall_score(user_context, job_text)
+
+def precompute_profile_embeddings(user_context: UserContext, context_path: str) -> Optional[str]:
+    """프로필 임베딩 사전 계산 함수 (프로필 저장 직후 호출용)"""
+    return _get_global_matcher().precompute_profile_embeddings(user_context, context_path)
+
+def prefilter_jobs(user_context: UserContext, job_texts: List[str], top_k: int = PREFILTER_TOP_K) -> List[int]:
+    """여러 공고 중 BM25 상위 후보의 위치 (전체 분석 전 사전 필터용)"""
+    return _get_global_matcher().prefilter_jobs(user_context, job_texts, top_k)
@@ -1,7 +1,14 @@
+import sys
 import json
 import os
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, fields
+
+# 저장 형식 버전 (1: schema_version 필드가 없던 기존 파일, 2: 현재 형식)
+SCHEMA_VERSION = 2
 
 @dataclass
 class UserContext:
@@ -29,6 +36,7 @@ class UserContext:
     location_preference: List[str] = None  # e.g., ["서울", "뉴욕", "런던"]
     salary_expectation: str = ""  # e.g., "50M-70M KRW", "100K-150K USD"
     additional_notes: str = ""  # Free text field for additional information
+    schema_version: int = SCHEMA_VERSION  # 저장 형식 버전 (migrate_context_data 참고)
     
     def __post_init__(self):
         # Initialize empty lists if None
@@ -46,101 +54,355 @@ class UserContext:
             self.experience_details = []
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # asdict는 모든 값을 재귀적으로 깊은 복사하므로, 필드 구조에 맞춰 필요한 만큼만 복사
+        return {
+            'name': self.name,
+            'target_roles': _copy_list(self.target_roles),
+            'skills': _copy_list(self.skills),
+            'programming_languages': _copy_list(self.programming_languages),
+            'languages': _copy_dict(self.languages),
+            'work_preference': _copy_list(self.work_preference),
+            'email': self.email,
+            'current_position': self.current_position,
+            'current_role': self.current_role,
+            'current_company': self.current_company,
+            'education_level': self.education_level,
+            'major': self.major,
+            'university': self.university,
+            'graduation_year': self.graduation_year,
+            'experience_by_industry': _copy_dict(self.experience_by_industry),
+            'experience_details': _copy_records(self.experience_details),
+            'projects': _copy_records(self.projects),
+            'certifications': _copy_list(self.certifications),
+            'location_preference': _copy_list(self.location_preference),
+            'salary_expectation': self.salary_expectation,
+            'additional_notes': self.additional_notes,
+            'schema_version': self.schema_version,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'UserContext':
-        # 기존 데이터와의 호환성을 위한 처리
-        processed_data = data.copy()
-        
-        # experience_years를 experience_by_industry로 변환
-        if 'experience_years' in processed_data and 'experience_by_industry' not in processed_data:
-            experience_years = processed_data.pop('experience_years')
-            if experience_years > 0:
-                processed_data['experience_by_industry'] = {"일반": experience_years}
-            else:
-                processed_data['experience_by_industry'] = {}
-        
-        # frameworks 필드가 있으면 제거 (새 스키마에서는 제거됨)
-        if 'frameworks' in processed_data:
-            processed_data.pop('frameworks')
-        
-        # extra_notes를 additional_notes로 변환 (새 스키마에서는 이름이 변경됨)
-        if 'extra_notes' in processed_data and 'additional_notes' not in processed_data:
-            processed_data['additional_notes'] = processed_data.pop('extra_notes')
-        
-        # 필수 필드가 없으면 기본값 설정
-        if 'programming_languages' not in processed_data:
-            processed_data['programming_languages'] = []
+        # 현재 버전으로 저장된 데이터는 변환 없이 바로 생성
+        if data.get('schema_version') == SCHEMA_VERSION:
+            return cls(**data)
         
-        if 'languages' not in processed_data:
-            processed_data['languages'] = {"한국어": "Native", "영어": "Fluent"}
-        
-        if 'work_preference' not in processed_data:
-            processed_data['work_preference'] = ["Remote", "Hybrid"]
-        
-        if 'projects' not in processed_data:
-            processed_data['projects'] = []
+        # 이전 형식은 변환 후 생성 (python -m utils.migrate_profiles로 일괄 변환 가능)
+        return cls(**migrate_context_data(data))
+
+def migrate_context_data(data: Dict) -> Dict:
+    """이전 형식의 프로필 데이터를 현재 스키마 버전으로 변환"""
+    # 기존 데이터와의 호환성을 위한 처리
+    processed_data = data.copy()
+    
+    # experience_years를 experience_by_industry로 변환
+    if 'experience_years' in processed_data and 'experience_by_industry' not in processed_data:
+        experience_years = processed_data.pop('experience_years')
+        if experience_years > 0:
+            processed_data['experience_by_industry'] = {"일반": experience_years}
         else:
-            # 기존 문자열 리스트를 딕셔너리 리스트로 변환
-            if processed_data['projects'] and isinstance(processed_data['projects'][0], str):
-                processed_data['projects'] = [
-                    {"name": project, "description": "", "tech_stack": "", "organization": ""} 
-                    for project in processed_data['projects']
-                ]
-        
-        if 'certifications' not in processed_data:
-            processed_data['certifications'] = []
-        
-        if 'location_preference' not in processed_data:
-            processed_data['location_preference'] = []
-        
-        if 'experience_by_industry' not in processed_data:
             processed_data['experience_by_industry'] = {}
-        
-        if 'university' not in processed_data:
-            processed_data['university'] = ""
-        
-        if 'additional_notes' not in processed_data:
-            processed_data['additional_notes'] = ""
-        
-        return cls(**processed_data)
+    
+    # frameworks 필드가 있으면 제거 (새 스키마에서는 제거됨)
+    if 'frameworks' in processed_data:
+        processed_data.pop('frameworks')
+    
+    # extra_notes를 additional_notes로 변환 (새 스키마에서는 이름이 변경됨)
+    if 'extra_notes' in processed_data and 'additional_notes' not in processed_data:
+        processed_data['additional_notes'] = processed_data.pop('extra_notes')
+    
+    # 필수 필드가 없으면 기본값 설정
+    if 'programming_languages' not in processed_data:
+        processed_data['programming_languages'] = []
+    
+    if 'languages' not in processed_data:
+        processed_data['languages'] = {"한국어": "Native", "영어": "Fluent"}
+    
+    if 'work_preference' not in processed_data:
+        processed_data['work_preference'] = ["Remote", "Hybrid"]
+    
+    if 'projects' not in processed_data:
+        processed_data['projects'] = []
+    else:
+        # 기존 문자열 리스트를 딕셔너리 리스트로 변환
+        if processed_data['projects'] and isinstance(processed_data['projects'][0], str):
+            processed_data['projects'] = [
+                {"name": project, "description": "", "tech_stack": "", "organization": ""} 
+                for project in processed_data['projects']
+            ]
+    
+    if 'certifications' not in processed_data:
+        processed_data['certifications'] = []
+    
+    if 'location_preference' not in processed_data:
+        processed_data['location_preference'] = []
+    
+    if 'experience_by_industry' not in processed_data:
+        processed_data['experience_by_industry'] = {}
+    
+    if 'university' not in processed_data:
+        processed_data['university'] = ""
+    
+    if 'additional_notes' not in processed_data:
+        processed_data['additional_notes'] = ""
+    
+    processed_data['schema_version'] = SCHEMA_VERSION
+    return processed_data
+
+def _copy_list(values) -> Optional[List]:
+    return list(values) if values is not None else None
+
+def _copy_dict(mapping) -> Optional[Dict]:
+    return dict(mapping) if mapping is not None else None
+
+def _copy_records(records) -> Optional[List]:
+    """딕셔너리(또는 매핑) 목록 복사 (기존 문자열 프로젝트 등은 그대로 유지)"""
+    if records is None:
+        return None
+    return [
+        record.to_dict() if isinstance(record, FrozenMapping) else dict(record) if isinstance(record, Mapping) else record
+        for record in records
+    ]
+
+class FrozenMapping(Mapping):
+    """키/값 쌍 튜플로 저장되는 작은 불변 매핑 (CompactUserContext의 dict 필드용)"""
+    __slots__ = ('_pairs',)
+
+    def __init__(self, pairs=()):
+        if isinstance(pairs, Mapping):
+            pairs = pairs.items()
+        self._pairs = tuple(pairs)
+
+    def __getitem__(self, key):
+        for pair_key, value in self._pairs:
+            if pair_key == key:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        return (key for key, _ in self._pairs)
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def __repr__(self) -> str:
+        return f"FrozenMapping({dict(self._pairs)!r})"
+
+    def __reduce__(self):
+        return (FrozenMapping, (self._pairs,))
+
+    def to_dict(self) -> Dict:
+        # Mapping 프로토콜을 거치지 않고 쌍 튜플에서 바로 dict 생성
+        return dict(self._pairs)
+
+def _intern_strings(values) -> Tuple[str, ...]:
+    """반복되는 짧은 문자열(스킬, 직무 등)을 intern하여 프로필 간 공유"""
+    return tuple(sys.intern(value) if isinstance(value, str) else value for value in values or ())
+
+def _intern_mapping(mapping) -> FrozenMapping:
+    return FrozenMapping(
+        (sys.intern(key) if isinstance(key, str) else key, sys.intern(value) if isinstance(value, str) else value)
+        for key, value in (mapping or {}).items()
+    )
+
+def _freeze_records(records) -> Tuple:
+    return tuple(FrozenMapping(record) if isinstance(record, Mapping) else record for record in records or ())
+
+_USER_CONTEXT_FIELDS = tuple(field.name for field in fields(UserContext))
+
+class CompactUserContext:
+    """대량 배치 매칭용 불변 UserContext
+
+    __slots__로 인스턴스 dict를 없애고, 리스트는 튜플로, dict는 FrozenMapping으로 저장하며
+    스킬/직무/언어 등 반복되는 문자열은 intern한다. JobMatcher 등에서 UserContext와
+    같은 속성 이름으로 읽을 수 있다.
+    """
+    __slots__ = _USER_CONTEXT_FIELDS
+
+    def __init__(self, **values):
+        for name in _USER_CONTEXT_FIELDS:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompactUserContext is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("CompactUserContext is immutable")
+
+    def __reduce__(self):
+        return (_compact_from_values, (tuple(getattr(self, name) for name in _USER_CONTEXT_FIELDS),))
+
+    def __repr__(self) -> str:
+        return f"CompactUserContext(name={self.name!r}, skills={self.skills!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactUserContext):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _USER_CONTEXT_FIELDS)
+
+    __hash__ = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CompactUserContext':
+        """저장된 dict에서 UserContext를 거치지 않고 바로 생성"""
+        if data.get('schema_version') != SCHEMA_VERSION:
+            data = migrate_context_data(data)
+        return cls(
+            name=data['name'],
+            target_roles=_intern_strings(data.get('target_roles')),
+            skills=_intern_strings(data.get('skills')),
+            programming_languages=_intern_strings(data.get('programming_languages')),
+            languages=_intern_mapping(data.get('languages')),
+            work_preference=_intern_strings(data.get('work_preference')),
+            email=data.get('email', ""),
+            current_position=data.get('current_position', ""),
+            current_role=data.get('current_role', ""),
+            current_company=data.get('current_company', ""),
+            education_level=sys.intern(data.get('education_level') or ""),
+            major=data.get('major', ""),
+            university=data.get('university', ""),
+            graduation_year=data.get('graduation_year', 0),
+            experience_by_industry=_intern_mapping(data.get('experience_by_industry')),
+            experience_details=_freeze_records(data.get('experience_details')),
+            projects=_freeze_records(data.get('projects')),
+            certifications=_intern_strings(data.get('certifications')),
+            location_preference=_intern_strings(data.get('location_preference')),
+            salary_expectation=data.get('salary_expectation', ""),
+            additional_notes=data.get('additional_notes', ""),
+            schema_version=SCHEMA_VERSION,
+        )
+
+    @classmethod
+    def from_user_context(cls, context: UserContext) -> 'CompactUserContext':
+        return cls.from_dict(context.to_dict())
+
+    def to_user_context(self) -> UserContext:
+        return UserContext(**self.to_dict())
+
+    def to_dict(self) -> Dict:
+        # UserContext.to_dict와 같은 형태의 일반 dict/list로 변환 (JSON 저장 및 해시 호환)
+        return {
+            'name': self.name,
+            'target_roles': list(self.target_roles),
+            'skills': list(self.skills),
+            'programming_languages': list(self.programming_languages),
+            'languages': self.languages.to_dict(),
+            'work_preference': list(self.work_preference),
+            'email': self.email,
+            'current_position': self.current_position,
+            'current_role': self.current_role,
+            'current_company': self.current_company,
+            'education_level': self.education_level,
+            'major': self.major,
+            'university': self.university,
+            'graduation_year': self.graduation_year,
+            'experience_by_industry': self.experience_by_industry.to_dict(),
+            'experience_details': _copy_records(self.experience_details),
+            'projects': _copy_records(self.projects),
+            'certifications': list(self.certifications),
+            'location_preference': list(self.location_preference),
+            'salary_expectation': self.salary_expectation,
+            'additional_notes': self.additional_notes,
+            'schema_version': self.schema_version,
+        }
+
+def _compact_from_values(values: Tuple) -> CompactUserContext:
+    """pickle 복원용 (멀티프로세스 배치 작업)"""
+    return CompactUserContext(**dict(zip(_USER_CONTEXT_FIELDS, values)))
+
+def get_context_filename(context: UserContext) -> str:
+    """사용자 context의 기본 저장 파일명"""
+    return f"{context.name.replace(' ', '_')}_context.json"
 
 def save_user_context(context: UserContext, filename: str = None) -> str:
-    """사용자 context를 JSON 파일로 저장"""
+    """사용자 context를 프로필 저장소에 저장하고 JSON 파일로 내보내기"""
+    from utils.profile_store import get_profile_store
+
     if filename is None:
-        filename = f"{context.name.replace(' ', '_')}_context.json"
+        filename = get_context_filename(context)
+    
+    # 저장소가 원본이므로 먼저 반영
+    store = get_profile_store()
+    store.upsert(filename, context)
+    _invalidate_cached_context(filename)
     
     data_dir = "data/user_contexts"
     os.makedirs(data_dir, exist_ok=True)
     
+    # 임시 파일에 쓴 뒤 교체하여 중간에 실패해도 기존 파일이 깨지지 않도록 함
     filepath = os.path.join(data_dir, filename)
-    with open(filepath, 'w', encoding='utf-8') as f:
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
         json.dump(context.to_dict(), f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, filepath)
+    
+    # 내보낸 파일을 다음 시작 때 다시 가져오지 않도록 시그니처 기록
+    stat = os.stat(filepath)
+    store.record_export(filename, (stat.st_mtime_ns, stat.st_size))
     
     return filepath
 
+# 프로필 파일명 → (저장소 updated_at, 변환이 끝난 UserContext) LRU 캐시 (프로세스 전역)
+_PROFILE_CACHE_SIZE = 64
+_profile_cache: "OrderedDict[str, Tuple[float, UserContext]]" = OrderedDict()
+_profile_cache_lock = threading.Lock()
+
+def _invalidate_cached_context(filename: str) -> None:
+    """저장/삭제된 프로필의 캐시 항목 제거"""
+    with _profile_cache_lock:
+        _profile_cache.pop(filename, None)
+
 def load_user_context(filename: str) -> Optional[UserContext]:
-    """JSON 파일에서 사용자 context 로드"""
-    data_dir = "data/user_contexts"
-    filepath = os.path.join(data_dir, filename)
+    """프로필 저장소에서 사용자 context 로드 (없으면 None)
+
+    저장 시각이 바뀌지 않았다면 이미 파싱·변환된 객체를 그대로 반환하므로
+    반환값을 직접 수정하지 말고 복사해서 사용해야 한다.
+    """
+    from utils.profile_store import get_profile_store
+
+    store = get_profile_store()
+    updated_at = store.updated_at(filename)
+    if updated_at is None:
+        _invalidate_cached_context(filename)
+        return None
     
-    if not os.path.exists(filepath):
+    with _profile_cache_lock:
+        cached = _profile_cache.get(filename)
+        if cached is not None and cached[0] == updated_at:
+            _profile_cache.move_to_end(filename)
+            return cached[1]
+    
+    record = store.get_record(filename)
+    if record is None:
         return None
+    updated_at, data = record
+    context = UserContext.from_dict(json.loads(data))
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with _profile_cache_lock:
+        _profile_cache[filename] = (updated_at, context)
+        _profile_cache.move_to_end(filename)
+        while len(_profile_cache) > _PROFILE_CACHE_SIZE:
+            _profile_cache.popitem(last=False)
     
-    return UserContext.from_dict(data)
+    return context
 
-def list_saved_contexts() -> List[str]:
-    """저장된 context 파일 목록 반환"""
-    data_dir = "data/user_contexts"
-    if not os.path.exists(data_dir):
-        return []
+def delete_user_context(filename: str) -> bool:
+    """프로필 저장소 항목과 내보낸 JSON 파일 삭제"""
+    from utils.profile_store import get_profile_store
+
+    store_deleted = get_profile_store().delete(filename)
+    _invalidate_cached_context(filename)
     
-    files = [f for f in os.listdir(data_dir) if f.endswith('.json')]
-    return files
+    filepath = os.path.join("data/user_contexts", filename)
+    file_deleted = False
+    if os.path.exists(filepath):
+        os.remove(filepath)
+        file_deleted = True
+    return store_deleted or file_deleted
+
+def list_saved_contexts() -> List[str]:
+    """저장된 context 파일 목록 반환 (프로필 저장소 인덱스에서 조회)"""
+    from utils.profile_store import get_profile_store
+    return get_profile_store().list_filenames()
 
 def get_default_context() -> UserContext:
     """기본 사용자 context 반환"""
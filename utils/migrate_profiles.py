@@ -0,0 +1,81 @@
+"""data/user_contexts의 프로필 JSON을 현재 스키마 버전으로 일괄 변환
+
+사용법:
+    python -m utils.migrate_profiles [--dir data/user_contexts] [--workers 8] [--dry-run]
+"""
+import os
+import json
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
+from utils.mcp_schema import SCHEMA_VERSION, UserContext, migrate_context_data
+from utils.log_config import configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+def migrate_profile_file(filepath: str, dry_run: bool = False) -> Tuple[str, str]:
+    """프로필 파일 하나를 현재 버전으로 다시 쓰기 (결과: migrated / current / failed)"""
+    tmp_path = filepath + ".tmp"
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if data.get('schema_version') == SCHEMA_VERSION:
+            return filepath, "current"
+
+        # 생성자를 거쳐 None 기본값까지 채운 뒤 저장
+        context = UserContext(**migrate_context_data(data))
+        if not dry_run:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(context.to_dict(), f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, filepath)
+        return filepath, "migrated"
+
+    except Exception as e:
+        # 쓰다 만 임시 파일은 남기지 않음
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return filepath, f"failed: {e}"
+
+
+def migrate_profiles(data_dir: str = "data/user_contexts", workers: int = None, dry_run: bool = False) -> dict:
+    """디렉토리의 모든 프로필을 병렬로 변환하고 결과 집계"""
+    if not os.path.exists(data_dir):
+        return {'migrated': 0, 'current': 0, 'failed': 0}
+
+    filepaths = [os.path.join(data_dir, f) for f in os.listdir(data_dir) if f.endswith('.json')]
+    summary = {'migrated': 0, 'current': 0, 'failed': 0}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(migrate_profile_file, filepaths, [dry_run] * len(filepaths), chunksize=64)
+        for filepath, status in results:
+            if status.startswith("failed"):
+                summary['failed'] += 1
+                logger.warning("Profile migration %s: %s", filepath, status)
+            else:
+                summary[status] += 1
+
+    # 다시 쓴 파일만 프로필 저장소로 가져오기
+    if summary['migrated'] and not dry_run:
+        from utils.profile_store import get_profile_store
+        get_profile_store().sync_json_dir(data_dir)
+
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=f"Migrate profile JSON files to schema version {SCHEMA_VERSION}")
+    parser.add_argument("--dir", default="data/user_contexts", help="profile directory")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--dry-run", action="store_true", help="report without rewriting files")
+    args = parser.parse_args()
+    configure_logging()
+
+    summary = migrate_profiles(args.dir, workers=args.workers, dry_run=args.dry_run)
+    print(f"migrated: {summary['migrated']}, already current: {summary['current']}, failed: {summary['failed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""OpenAI 클라이언트 공유와 rate limit 인지 호출
+
+API 키/서버 주소별로 클라이언트를 한 번만 만들고 HTTP 연결 풀(httpx.Client)을 모든
+클라이언트가 공유한다. chat completion 호출은 RPM/TPM token bucket을 통과한 뒤 보내며,
+429/5xx/연결 오류는 Retry-After를 존중하는 지터 백오프로 재시도한다.
+
+환경변수:
+    OPENAI_RPM_LIMIT=0          분당 요청 수 한도 (0이면 제한 없음)
+    OPENAI_TPM_LIMIT=0          분당 토큰 수 한도 (프롬프트 추정치 + max_tokens 기준, 0이면 제한 없음)
+    OPENAI_MAX_RETRIES=4        재시도 횟수
+    OPENAI_MAX_CONNECTIONS=20   공유 연결 풀 크기
+"""
+import os
+import time
+import random
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+from openai import OpenAI, APIConnectionError, APIStatusError
+from utils.tracing import current_span
+from utils.prompt_budget import count_message_tokens
+from utils.circuit_breaker import get_breaker, CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+OPENAI_RPM_LIMIT = int(os.getenv('OPENAI_RPM_LIMIT', '0'))
+OPENAI_TPM_LIMIT = int(os.getenv('OPENAI_TPM_LIMIT', '0'))
+OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', '4'))
+OPENAI_MAX_CONNECTIONS = int(os.getenv('OPENAI_MAX_CONNECTIONS', '20'))
+
+# 지터 백오프: min(cap, base * 2^attempt) 구간에서 균등 추출 (full jitter)
+RETRY_BASE_SECONDS = 0.5
+RETRY_MAX_SECONDS = 20.0
+
+_clients: Dict[Tuple[str, Optional[str]], OpenAI] = {}
+_limiters: Dict[Tuple[str, str], "RateLimiter"] = {}
+_shared_http_client = None
+_lock = threading.Lock()
+
+
+class TokenBucket:
+    """분당 capacity만큼 채워지는 token bucket (capacity <= 0이면 제한 없음)"""
+
+    def __init__(self, capacity_per_minute: int):
+        self.capacity = float(capacity_per_minute)
+        self.tokens = self.capacity
+        self.refill_per_second = self.capacity / 60.0
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """amount만큼 미리 차감하고 그만큼 채워질 때까지 기다려야 할 시간(초) 반환"""
+        if self.capacity <= 0:
+            return 0.0
+        self._refill(now)
+        # 한 요청이 bucket 전체보다 크면 가득 찬 bucket 하나로 취급
+        self.tokens -= min(amount, self.capacity)
+        return max(0.0, -self.tokens / self.refill_per_second)
+
+
+class RateLimiter:
+    """요청 수(RPM)와 토큰 수(TPM) 한도를 함께 지키는 limiter, 429 응답 시 전체 호출을 잠시 멈춤"""
+
+    def __init__(self, rpm: int = OPENAI_RPM_LIMIT, tpm: int = OPENAI_TPM_LIMIT):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, estimated_tokens: int) -> float:
+        """호출 한 번의 할당량 확보 (필요하면 대기), 대기한 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self.requests.reserve(1, now), self.tokens.reserve(estimated_tokens, now),
+                       self.paused_until - now)
+        if wait > 0:
+            time.sleep(wait)
+        return max(wait, 0.0)
+
+    def pause(self, seconds: float) -> None:
+        """provider가 한도 초과를 알리면 이 limiter를 쓰는 모든 호출을 seconds 동안 보류"""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+def _key_hash(api_key: str) -> str:
+    # 원본 키를 캐시 키/로그에 남기지 않기 위한 해시
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def _get_http_client():
+    """모든 OpenAI 클라이언트가 공유하는 연결 풀 (keep-alive 연결 재사용)"""
+    global _shared_http_client
+    if _shared_http_client is None:
+        import httpx
+        _shared_http_client = httpx.Client(
+            limits=httpx.Limits(max_connections=OPENAI_MAX_CONNECTIONS,
+                                max_keepalive_connections=OPENAI_MAX_CONNECTIONS),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+    return _shared_http_client
+
+
+def get_openai_client(api_key: str, base_url: Optional[str] = None) -> OpenAI:
+    """API 키/서버 주소별로 캐시된 OpenAI 클라이언트 (재시도는 chat_completion에서 처리)"""
+    cache_key = (_key_hash(api_key), base_url)
+    with _lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            client = OpenAI(api_key=api_key, base_url=base_url, http_client=_get_http_client(), max_retries=0)
+            client._rate_limit_key = cache_key[0]
+            _clients[cache_key] = client
+        return client
+
+
+def get_rate_limiter(client, model: str) -> RateLimiter:
+    """API 키 + 모델별 limiter (캐시 밖에서 만든 클라이언트는 'default' 키를 공유)"""
+    key = (getattr(client, '_rate_limit_key', 'default'), model)
+    with _lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = RateLimiter()
+        return limiter
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    return error.status_code if isinstance(error, APIStatusError) else None
+
+
+def _is_retryable(error: Exception) -> bool:
+    status = _status_code(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    return isinstance(error, APIConnectionError)
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """응답 헤더의 retry-after-ms / retry-after 값 (없거나 해석 불가면 None)"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    for header, scale in (('retry-after-ms', 0.001), ('retry-after', 1.0)):
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            return float(value) * scale
+        except ValueError:
+            continue
+    return None
+
+
+def _backoff_seconds(attempt: int, retry_after: Optional[float]) -> float:
+    jitter = random.uniform(0, min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * (2 ** attempt)))
+    if retry_after is not None:
+        # 동시에 막힌 호출들이 같은 시점에 몰리지 않도록 지정 시간 뒤에 지터를 더함
+        return min(RETRY_MAX_SECONDS, retry_after) + jitter * 0.25
+    return jitter
+
+
+def _is_unhealthy(error: Exception) -> bool:
+    """circuit breaker에 실패로 기록할 오류 (5xx, 연결 오류/timeout; 429와 4xx는 서비스 이상이 아님)"""
+    status = _status_code(error)
+    return status >= 500 if status is not None else isinstance(error, APIConnectionError)
+
+
+def chat_completion(client, model: str, messages: List[Dict[str, str]], max_tokens: int,
+                    max_retries: int = OPENAI_MAX_RETRIES, **kwargs):
+    """rate limit을 지키며 chat completion 호출, 429/5xx/연결 오류는 지터 백오프로 재시도
+
+    모델별 circuit이 열려 있으면 호출 없이 CircuitOpenError를 던지고 (호출부는 fallback 경로 사용),
+    timeout은 최근 응답 p95에 맞춰 조정된다.
+    """
+    limiter = get_rate_limiter(client, model)
+    breaker = get_breaker(f"openai:{model}", 'openai')
+    estimated_tokens = count_message_tokens(messages, model) + max_tokens
+    active_span = current_span()
+    waited = 0.0
+
+    for attempt in range(max_retries + 1):
+        if not breaker.allow():
+            raise CircuitOpenError(breaker.name, breaker.retry_in())
+        waited += limiter.acquire(estimated_tokens)
+        timeout = breaker.timeout()
+        if active_span is not None:
+            active_span.set('timeout_s', round(timeout, 2))
+        start = time.perf_counter()
+        try:
+            response = client.chat.completions.create(model=model, messages=messages, max_tokens=max_tokens,
+                                                      timeout=timeout, **kwargs)
+        except Exception as e:
+            if _is_unhealthy(e):
+                breaker.record(False, time.perf_counter() - start)
+            else:
+                breaker.release()
+            if attempt >= max_retries or not _is_retryable(e):
+                raise
+            retry_after = _retry_after_seconds(e)
+            delay = _backoff_seconds(attempt, retry_after)
+            if _status_code(e) == 429:
+                limiter.pause(delay)
+            logger.info("OpenAI call failed (%s), retry %s/%s in %.2fs", _status_code(e) or type(e).__name__,
+                        attempt + 1, max_retries, delay)
+            time.sleep(delay)
+            waited += delay
+            continue
+
+        breaker.record(True, time.perf_counter() - start)
+        if active_span is not None and (attempt or waited):
+            active_span.set('retries', attempt)
+            active_span.set('rate_limit_wait_ms', round(waited * 1000, 1))
+        return response
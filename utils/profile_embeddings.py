@@ -0,0 +1,74 @@
+import os
+import logging
+import json
+import hashlib
+from typing import Dict, Optional
+import numpy as np
+from utils.mcp_schema import UserContext
+
+logger = logging.getLogger(__name__)
+
+# 임베딩 텍스트 구성이나 필드 목록이 바뀌면 올려서 기존 캐시를 무효화
+PROFILE_EMBEDDING_VERSION = 2
+
+# 프로필 JSON 옆에 저장되는 임베딩 파일 접미사
+EMBEDDING_FILE_SUFFIX = ".embeddings.npz"
+
+
+def profile_content_hash(user_context: UserContext) -> str:
+    """프로필 내용 해시 (내용이 바뀌면 저장된 임베딩을 무효화하는 기준)"""
+    data = user_context.to_dict()
+    # 저장 형식 버전만 바뀐 경우(일괄 마이그레이션)에는 임베딩을 다시 계산할 필요가 없음
+    data.pop('schema_version', None)
+    payload = json.dumps(data, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def get_embedding_path(context_path: str) -> str:
+    """프로필 JSON 경로에 대응하는 임베딩 파일 경로"""
+    return os.path.splitext(context_path)[0] + EMBEDDING_FILE_SUFFIX
+
+
+def save_profile_embeddings(context_path: str, content_hash: str, encoder_id: str,
+                            embeddings: Dict[str, np.ndarray]) -> str:
+    """필드별 임베딩을 프로필 JSON 옆에 저장 (임시 파일 후 교체로 원자적 쓰기)"""
+    embedding_path = get_embedding_path(context_path)
+    meta = {
+        'version': PROFILE_EMBEDDING_VERSION,
+        'content_hash': content_hash,
+        'encoder_id': encoder_id,
+        'fields': list(embeddings.keys())
+    }
+    arrays = {f"field_{field}": np.asarray(vector, dtype=np.float32) for field, vector in embeddings.items()}
+
+    tmp_path = embedding_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, meta=np.array(json.dumps(meta)), **arrays)
+    os.replace(tmp_path, embedding_path)
+    return embedding_path
+
+
+def load_profile_embeddings(context_path: str, content_hash: str, encoder_id: str) -> Optional[Dict[str, np.ndarray]]:
+    """저장된 임베딩 로드 (버전/모델/내용 해시가 다르면 None)"""
+    embedding_path = get_embedding_path(context_path)
+    if not os.path.exists(embedding_path):
+        return None
+
+    try:
+        with np.load(embedding_path, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            if (meta.get('version') != PROFILE_EMBEDDING_VERSION or
+                    meta.get('content_hash') != content_hash or
+                    meta.get('encoder_id') != encoder_id):
+                return None
+            return {field: data[f"field_{field}"] for field in meta.get('fields', [])}
+    except Exception as e:
+        logger.warning("Failed to load profile embeddings: %s", e)
+        return None
+
+
+def remove_profile_embeddings(context_path: str) -> None:
+    """프로필 삭제 시 대응하는 임베딩 파일도 삭제"""
+    embedding_path = get_embedding_path(context_path)
+    if os.path.exists(embedding_path):
+        os.remove(embedding_path)
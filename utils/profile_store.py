@@ -0,0 +1,231 @@
+import os
+import logging
+import json
+import time
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+from utils.mcp_schema import UserContext
+
+logger = logging.getLogger(__name__)
+
+DB_PATH = "data/profiles.db"
+JSON_DIR = "data/user_contexts"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    filename TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_lower TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    file_mtime_ns INTEGER,
+    file_size INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_name ON profiles(name_lower);
+
+CREATE TABLE IF NOT EXISTS unreadable_files (
+    filename TEXT PRIMARY KEY,
+    file_mtime_ns INTEGER NOT NULL,
+    file_size INTEGER NOT NULL
+);
+
+DROP TABLE IF EXISTS profile_skills;
+DROP TABLE IF EXISTS profile_roles;
+"""
+
+
+class ProfileStore:
+    """SQLite 기반 프로필 저장소 (프로필의 원본, JSON 파일은 내보내기 사본)
+
+    쓰기는 저장소에 먼저 반영한 뒤 JSON 파일로 내보내고, 내보낸 파일의 (mtime_ns, size)를
+    기록해 둔다. 앱 밖에서 고친 JSON 파일은 시작 시 한 번 sync_json_dir()로 가져온다.
+    """
+
+    def __init__(self, db_path: str = DB_PATH):
+        self.db_path = db_path
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        # Streamlit은 여러 스레드에서 스크립트를 실행하므로 연결을 공유하고 잠금으로 직렬화
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # 파일 시그니처 열이 없던 이전 DB는 열 추가 (스키마의 CREATE INDEX보다 먼저)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(profiles)")}
+        if columns and 'file_mtime_ns' not in columns:
+            self._conn.execute("ALTER TABLE profiles ADD COLUMN file_mtime_ns INTEGER")
+            self._conn.execute("ALTER TABLE profiles ADD COLUMN file_size INTEGER")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ---- 쓰기 ----
+
+    def _write(self, filename: str, context: UserContext, signature: Optional[Tuple[int, int]] = None) -> None:
+        """트랜잭션 내부에서 프로필 한 건 교체 (signature: 마지막으로 맞춘 JSON 파일의 (mtime_ns, size))"""
+        file_mtime_ns, file_size = signature or (None, None)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO profiles (filename, name, name_lower, data, updated_at, file_mtime_ns, file_size) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (filename, context.name, context.name.lower(),
+             json.dumps(context.to_dict(), ensure_ascii=False), time.time(), file_mtime_ns, file_size)
+        )
+        self._conn.execute("DELETE FROM unreadable_files WHERE filename = ?", (filename,))
+
+    def upsert(self, filename: str, context: UserContext, signature: Optional[Tuple[int, int]] = None) -> None:
+        """프로필 저장 (하나의 트랜잭션으로 원자적으로 반영)"""
+        with self._lock, self._conn:
+            self._write(filename, context, signature)
+
+    def upsert_many(self, contexts: Dict[str, UserContext],
+                    signatures: Optional[Dict[str, Tuple[int, int]]] = None) -> int:
+        """여러 프로필을 하나의 트랜잭션으로 일괄 저장"""
+        signatures = signatures or {}
+        with self._lock, self._conn:
+            for filename, context in contexts.items():
+                self._write(filename, context, signatures.get(filename))
+        return len(contexts)
+
+    def record_export(self, filename: str, signature: Tuple[int, int]) -> None:
+        """내보낸 JSON 파일의 (mtime_ns, size) 기록 (다음 시작 때 다시 가져오지 않도록)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE profiles SET file_mtime_ns = ?, file_size = ? WHERE filename = ?",
+                (signature[0], signature[1], filename)
+            )
+
+    def delete(self, filename: str) -> bool:
+        """프로필 삭제"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM profiles WHERE filename = ?", (filename,))
+        return cursor.rowcount > 0
+
+    # ---- 조회 ----
+
+    def get(self, filename: str) -> Optional[UserContext]:
+        """파일명으로 프로필 조회"""
+        row = self.get_record(filename)
+        return UserContext.from_dict(json.loads(row[1])) if row else None
+
+    def get_record(self, filename: str) -> Optional[Tuple[float, str]]:
+        """(updated_at, 직렬화된 JSON) 조회"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT updated_at, data FROM profiles WHERE filename = ?", (filename,)
+            ).fetchone()
+
+    def updated_at(self, filename: str) -> Optional[float]:
+        """프로필의 마지막 저장 시각 (없으면 None, 본문을 읽지 않아 캐시 확인용으로 저렴함)"""
+        with self._lock:
+            row = self._conn.execute("SELECT updated_at FROM profiles WHERE filename = ?", (filename,)).fetchone()
+        return row[0] if row else None
+
+    def list_filenames(self) -> List[str]:
+        """저장된 프로필 파일명 목록 (JSON 디렉토리 스캔 없이 인덱스에서 조회)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT filename FROM profiles ORDER BY filename").fetchall()
+        return [row[0] for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    # ---- JSON 파일 가져오기 ----
+
+    def _known_signatures(self) -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+        """파일명 → 마지막으로 가져왔거나 내보낸, 또는 읽지 못한 JSON 파일의 (mtime_ns, size)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT filename, file_mtime_ns, file_size FROM profiles").fetchall()
+            rows += self._conn.execute("SELECT filename, file_mtime_ns, file_size FROM unreadable_files").fetchall()
+        return {filename: (mtime_ns, size) for filename, mtime_ns, size in rows}
+
+    def _import_files(self, data_dir: str, files: Dict[str, Tuple[int, int]]) -> int:
+        """JSON 파일들을 읽어 저장, 읽지 못한 파일은 시그니처를 기록해 바뀌기 전까지 다시 경고하지 않음"""
+        contexts = {}
+        unreadable = []
+        for filename in files:
+            try:
+                with open(os.path.join(data_dir, filename), 'r', encoding='utf-8') as f:
+                    contexts[filename] = UserContext.from_dict(json.load(f))
+            except Exception as e:
+                logger.warning("Skipping unreadable profile %s: %s", filename, e)
+                unreadable.append((filename, *files[filename]))
+
+        with self._lock, self._conn:
+            for filename, context in contexts.items():
+                self._write(filename, context, files[filename])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO unreadable_files (filename, file_mtime_ns, file_size) VALUES (?, ?, ?)",
+                unreadable
+            )
+        return len(contexts)
+
+    def import_json_dir(self, data_dir: str = JSON_DIR, overwrite: bool = False) -> int:
+        """data/user_contexts의 JSON 파일들을 저장소로 가져오기 (overwrite가 아니면 이미 있는 프로필은 건너뜀)"""
+        files = scan_json_dir(data_dir)
+        if not overwrite:
+            existing = set(self.list_filenames())
+            files = {filename: signature for filename, signature in files.items() if filename not in existing}
+        return self._import_files(data_dir, files)
+
+    def sync_json_dir(self, data_dir: str = JSON_DIR) -> int:
+        """마지막으로 본 뒤 새로 생기거나 바뀐 JSON 파일만 가져오고 가져온 수 반환
+
+        저장소가 원본이므로 JSON 파일이 없어졌다고 프로필을 지우지는 않는다.
+        """
+        known = self._known_signatures()
+        changed = {filename: signature for filename, signature in scan_json_dir(data_dir).items()
+                   if known.get(filename) != signature}
+        if not changed:
+            return 0
+        imported = self._import_files(data_dir, changed)
+        if imported:
+            logger.info("Imported %s new or edited profile JSON files from %s", imported, data_dir)
+        return imported
+
+
+def scan_json_dir(data_dir: str = JSON_DIR) -> Dict[str, Tuple[int, int]]:
+    """JSON 프로필 파일명 → (mtime_ns, size) (디렉토리가 없으면 빈 사전)"""
+    if not os.path.isdir(data_dir):
+        return {}
+    files = {}
+    for entry in os.scandir(data_dir):
+        if entry.name.endswith('.json') and entry.is_file():
+            stat = entry.stat()
+            files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+_store: Optional[ProfileStore] = None
+_store_lock = threading.Lock()
+
+
+def get_profile_store() -> ProfileStore:
+    """프로세스 전역 프로필 저장소 반환 (처음 열 때 한 번 JSON 디렉토리의 새/수정 파일을 가져옴)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                store = ProfileStore()
+                store.sync_json_dir()
+                _store = store
+    return _store
+
+
+if __name__ == "__main__":
+    import sys
+    from utils.log_config import configure_logging
+
+    configure_logging()
+    # python -m utils.profile_store import [--overwrite]
+    if len(sys.argv) >= 2 and sys.argv[1] == "import":
+        store = ProfileStore()
+        count = store.import_json_dir(overwrite="--overwrite" in sys.argv)
+        print(f"Imported {count} profiles into {store.db_path} ({store.count()} total)")
+    else:
+        print("Usage: python -m utils.profile_store import [--overwrite]")
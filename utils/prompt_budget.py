@@ -0,0 +1,180 @@
+import math
+import hashlib
+import logging
+from functools import lru_cache
+from typing import Dict, List, Optional
+from utils.chunk_text import split_sentences, split_words
+from utils.segment_text import segment_job_posting, MIN_FOCUS_CHARS
+
+logger = logging.getLogger(__name__)
+
+# 호출별 채용 공고 발췌 토큰 예산 (feedback은 프로필/요약을 포함한 프롬프트 전체 예산, notes는 사용자 추가 정보)
+PROMPT_BUDGETS = {
+    'role_match': 350,
+    'additional_notes': 350,
+    'missing_skills': 450,
+    'feedback': 1800,
+    'notes': 200,
+}
+
+# 프롬프트의 나머지 부분이 길어도 공고 발췌에 최소한 남겨 둘 토큰 수
+MIN_JOB_EXCERPT_TOKENS = 200
+
+# 발췌에 포함할 섹션 우선순위 (복지/채용절차 등 상투적인 섹션은 제외)
+EXCERPT_SECTION_PRIORITY = ('requirements', 'responsibilities', 'preferred', 'overview')
+SECTION_LABELS = {
+    'requirements': '자격요건',
+    'responsibilities': '주요업무',
+    'preferred': '우대사항',
+    'overview': '개요',
+}
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(model: str):
+    """모델별 tiktoken 인코딩 (tiktoken이 없으면 None)"""
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken is not installed; prompt budgets use a character-based token estimate")
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _estimate_tokens(text: str) -> int:
+    """tiktoken이 없을 때의 근사치 (영문 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 1토큰)"""
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+@lru_cache(maxsize=2048)
+def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """텍스트의 토큰 수 (tiktoken 우선, 없으면 근사치)"""
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return _estimate_tokens(text)
+    return len(encoding.encode(text))
+
+
+def count_message_tokens(messages: List[Dict[str, str]], model: str = "gpt-4o-mini") -> int:
+    """chat 메시지 목록의 프롬프트 토큰 수 (메시지당 형식 토큰 포함)"""
+    return sum(count_tokens(message.get("content", ""), model) + 4 for message in messages) + 2
+
+
+def _longest_prefix(text: str, max_tokens: int, model: str) -> str:
+    """토큰 수가 max_tokens 이하인 가장 긴 앞부분 (글자 수 기준 이진 탐색)"""
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if count_tokens(text[:middle], model) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low]
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "gpt-4o-mini") -> str:
+    """토큰 예산 안에서 문장 경계를 지키며 앞에서부터 자르기"""
+    if max_tokens <= 0 or not text:
+        return ""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    kept = []
+    used = 0
+    for sentence in split_sentences(text):
+        sentence_tokens = count_tokens(sentence, model) + 1
+        if used + sentence_tokens <= max_tokens:
+            kept.append(sentence)
+            used += sentence_tokens
+            continue
+        if not kept:
+            # 첫 문장부터 예산을 넘으면 단어 단위로 채움
+            for word in split_words(sentence):
+                word_tokens = count_tokens(word, model) + 1
+                if used + word_tokens > max_tokens:
+                    # 공백 없는 한글처럼 한 단어가 남은 예산보다 크면 들어가는 만큼 글자 단위로 자름
+                    prefix = _longest_prefix(word, max_tokens - used - 1 if kept else max_tokens - used, model)
+                    if prefix:
+                        kept.append(prefix)
+                    break
+                kept.append(word)
+                used += word_tokens
+        break
+    return " ".join(kept)
+
+
+@lru_cache(maxsize=128)
+def build_job_excerpt(job_text: str, max_tokens: int, model: str = "gpt-4o-mini") -> str:
+    """요구사항 섹션을 우선으로 토큰 예산에 맞춘 채용 공고 발췌
+
+    자격요건 → 주요업무 → 우대사항 → 개요 순으로 예산을 채우고, 섹션 분할이
+    실패하면 전체 텍스트를 문장 경계에서 자른다.
+    """
+    sections = segment_job_posting(job_text)
+    prioritized = [(section, sections[section]) for section in EXCERPT_SECTION_PRIORITY if section in sections]
+    focus_chars = sum(len(content) for section, content in prioritized if section != 'overview')
+    if focus_chars < MIN_FOCUS_CHARS:
+        return truncate_to_tokens(job_text, max_tokens, model)
+
+    parts = []
+    remaining = max_tokens
+    for section, content in prioritized:
+        label = f"[{SECTION_LABELS[section]}] "
+        label_tokens = count_tokens(label, model)
+        if remaining <= label_tokens + 10:
+            break
+        excerpt = truncate_to_tokens(content, remaining - label_tokens, model)
+        if not excerpt:
+            break
+        parts.append(label + excerpt)
+        remaining -= label_tokens + count_tokens(excerpt, model) + 1
+    return " ".join(parts)
+
+
+def job_excerpt_for(job_text: str, budget_name: str, model: str = "gpt-4o-mini", reserved_text: str = "") -> str:
+    """호출 종류별 예산으로 공고 발췌 생성 (reserved_text: 같은 예산을 쓰는 나머지 프롬프트)"""
+    budget = PROMPT_BUDGETS[budget_name]
+    if reserved_text:
+        budget = max(MIN_JOB_EXCERPT_TOKENS, budget - count_tokens(reserved_text, model))
+    excerpt = build_job_excerpt(job_text, budget, model)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Job excerpt for %s: %s/%s tokens", budget_name, count_tokens(excerpt, model), budget)
+    return excerpt
+
+
+def record_prompt_tokens(current_span, messages: List[Dict[str, str]], model: str) -> Optional[int]:
+    """호출 전 로컬로 센 프롬프트 토큰 수를 span 속성으로 기록"""
+    if current_span is None:
+        return None
+    tokens = count_message_tokens(messages, model)
+    current_span.set('prompt_tokens_est', tokens)
+    current_span.set('prefix_hash', prefix_hash(messages))
+    current_span.set('prefix_tokens_est', count_message_tokens(messages[:-1], model))
+    return tokens
+
+
+def build_prefixed_messages(system_prompt: str, profile_block: str, variable_block: str) -> List[Dict[str, str]]:
+    """캐시 가능한 고정 prefix(지침 + 프로필) 뒤에 호출마다 바뀌는 공고 블록을 붙인 메시지 목록
+
+    provider의 prompt 캐시는 앞부분이 바이트 단위로 같을 때만 적중하므로, 같은 사용자가
+    여러 공고를 분석하는 동안 system/프로필 메시지는 내용과 순서를 바꾸지 않는다.
+    """
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": profile_block},
+        {"role": "user", "content": variable_block},
+    ]
+
+
+def prefix_hash(messages: List[Dict[str, str]]) -> str:
+    """마지막 메시지를 제외한 prefix의 해시 (같은 값이면 캐시 적중 대상)"""
+    digest = hashlib.sha256()
+    for message in messages[:-1]:
+        digest.update(message["role"].encode("utf-8") + b"\0" + message["content"].encode("utf-8") + b"\0")
+    return digest.hexdigest()[:12]
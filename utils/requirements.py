@@ -0,0 +1,161 @@
+"""채용 공고 요구 조건(경력 연수, 학위, 언어/수준) 추출
+
+미리 컴파일한 정규식 하나로 공고를 한 번만 훑어 경력("3년 이상", "3~5년", "5+ years"),
+학위(학사/석사/박사, bachelor/master/phd), 언어와 요구 수준("비즈니스 영어", "English (fluent)")을
+구조화된 JobRequirements로 반환한다. 점수 계산과 피드백 요약에서 함께 사용한다.
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# 학위 표기 → 수준 (1: 학사, 2: 석사, 3: 박사)
+DEGREE_LEVELS = {
+    'bachelor': 1, "bachelor's": 1, 'bachelors': 1, 'b.s.': 1, 'b.a.': 1, '학사': 1, '대졸': 1, '대학교': 1, '4년제': 1,
+    'master': 2, "master's": 2, 'masters': 2, 'm.s.': 2, '석사': 2, '대학원': 2,
+    'phd': 3, 'ph.d': 3, 'ph.d.': 3, 'doctorate': 3, '박사': 3,
+}
+DEGREE_NAMES = {1: '학사', 2: '석사', 3: '박사'}
+
+# 언어 표기 → 대표 이름
+LANGUAGE_NAMES = {
+    'english': 'english', '영어': 'english',
+    'korean': 'korean', '한국어': 'korean',
+    'japanese': 'japanese', '일본어': 'japanese',
+    'chinese': 'chinese', 'mandarin': 'chinese', '중국어': 'chinese',
+    'german': 'german', '독일어': 'german',
+    'french': 'french', '프랑스어': 'french',
+    'spanish': 'spanish', '스페인어': 'spanish',
+    'vietnamese': 'vietnamese', '베트남어': 'vietnamese',
+}
+LANGUAGE_LABELS = {
+    'english': '영어', 'korean': '한국어', 'japanese': '일본어', 'chinese': '중국어',
+    'german': '독일어', 'french': '프랑스어', 'spanish': '스페인어', 'vietnamese': '베트남어',
+}
+
+# 언어 수준 표기 → 순위 (높을수록 유창)
+PROFICIENCY_LEVELS = {
+    'basic': 1, 'beginner': 1, '기초': 1, '초급': 1,
+    'conversational': 2, 'intermediate': 2, '회화': 2, '중급': 2, '일상 회화': 2,
+    'business': 3, 'professional': 3, 'advanced': 3, '비즈니스': 3, '업무': 3, '고급': 3,
+    'fluent': 4, '유창': 4, '능통': 4, '능숙': 4,
+    'native': 5, '원어민': 5, '모국어': 5,
+}
+PROFICIENCY_NAMES = {1: '기초', 2: '회화', 3: '비즈니스', 4: '유창', 5: '원어민'}
+
+
+def _alternation(words) -> str:
+    # 긴 표기부터 시도해야 "bachelor's"가 "bachelor"보다 먼저 잡힘
+    return "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+_LEVEL = _alternation(PROFICIENCY_LEVELS)
+_YEAR_UNIT = r"(?:years?|yrs?|년)"
+# 영문 학위는 단어 경계 안에서만 ("mastery", "team.s" 제외), "Scrum Master"는 직무명이므로 제외
+_DEGREE = (r"(?<!scrum\s)\b(?:" + _alternation(word for word in DEGREE_LEVELS if word.isascii()) + r")(?!\w)"
+           r"|" + _alternation(word for word in DEGREE_LEVELS if not word.isascii()))
+DEGREE_PATTERN = re.compile(_DEGREE, re.IGNORECASE)
+
+# 한 번의 스캔으로 모든 요구 조건 후보를 찾는 결합 패턴 (앞의 대안이 우선)
+REQUIREMENT_PATTERN = re.compile(
+    # 경력 범위: 3~5년, 3-5 years, 3 to 5 yrs
+    # (연수는 앞뒤가 숫자가 아닌 1~2자리만: "2015 years", "2023-2024", "100 years"의 일부를 읽지 않음)
+    rf"(?<!\d)(?P<range_min>\d{{1,2}})\s*(?:~|-|–|to)\s*(?P<range_max>\d{{1,2}})(?!\d)\s*{_YEAR_UNIT}"
+    # 경력 하한: 5+ years, 3 years, 3년 이상, 3년 경력, 3년차
+    rf"|(?<!\d)(?P<years_en>\d{{1,2}})(?!\d)\s*\+?\s*(?:years?|yrs?)\b"
+    rf"|(?<!\d)(?P<years_ko>\d{{1,2}})(?!\d)\s*년\s*(?:이상|경력|차)"
+    # 학위
+    rf"|(?P<degree>{_DEGREE})"
+    # 언어 (앞 또는 뒤에 붙은 수준 표기 포함)
+    rf"|(?:(?P<level_pre>{_LEVEL})\s*(?:수준의?|level)?\s*)?(?P<language>{_alternation(LANGUAGE_NAMES)})"
+    rf"(?:\s*(?:[:(/]|능력|실력)?\s*(?P<level_post>{_LEVEL}))?",
+    re.IGNORECASE,
+)
+
+# GPT 점수 응답에서 0~1 숫자 추출
+SCORE_PATTERN = re.compile(r'0?\.\d+|0|1')
+
+
+@dataclass(frozen=True)
+class JobRequirements:
+    """공고에서 추출한 요구 조건 (값이 없으면 명시되지 않은 것)"""
+    min_years: Optional[int] = None
+    max_years: Optional[int] = None
+    degree_level: Optional[int] = None
+    languages: Tuple[Tuple[str, Optional[int]], ...] = ()
+
+    @property
+    def language_levels(self) -> Dict[str, Optional[int]]:
+        """언어 → 요구 수준 순위 (수준 미기재는 None)"""
+        return dict(self.languages)
+
+    def summary(self) -> str:
+        """피드백 프롬프트용 한 줄 요약"""
+        parts = []
+        if self.min_years is not None:
+            if self.max_years is not None and self.max_years != self.min_years:
+                parts.append(f"경력 {self.min_years}~{self.max_years}년")
+            else:
+                parts.append(f"경력 {self.min_years}년 이상")
+        if self.degree_level:
+            parts.append(f"{DEGREE_NAMES[self.degree_level]} 이상")
+        for language, level in self.languages:
+            label = LANGUAGE_LABELS.get(language, language)
+            parts.append(f"{label}({PROFICIENCY_NAMES[level]})" if level else label)
+        return ", ".join(parts) if parts else "명시된 경력/학위/언어 조건 없음"
+
+
+@lru_cache(maxsize=256)
+def extract_requirements(job_text: str) -> JobRequirements:
+    """공고 텍스트에서 경력/학위/언어 요구 조건 추출 (같은 공고는 캐시)"""
+    year_bounds = []
+    degree_levels = []
+    languages: Dict[str, Optional[int]] = {}
+
+    for match in REQUIREMENT_PATTERN.finditer(job_text):
+        if match.group('range_min'):
+            low, high = sorted((int(match.group('range_min')), int(match.group('range_max'))))
+            year_bounds.append((low, high))
+        elif match.group('years_en') or match.group('years_ko'):
+            year_bounds.append((int(match.group('years_en') or match.group('years_ko')), None))
+        elif match.group('degree'):
+            degree_levels.append(DEGREE_LEVELS[match.group('degree').lower()])
+        elif match.group('language'):
+            language = LANGUAGE_NAMES[match.group('language').lower()]
+            level_text = match.group('level_pre') or match.group('level_post')
+            level = PROFICIENCY_LEVELS[level_text.lower()] if level_text else None
+            # 같은 언어가 여러 번 나오면 가장 높은 요구 수준 유지
+            if language not in languages or (level or 0) > (languages[language] or 0):
+                languages[language] = level
+
+    min_years = max_years = None
+    if year_bounds:
+        # 가장 높은 하한을 요구 경력으로 (범위 상한은 같은 표기의 것)
+        min_years, max_years = max(year_bounds, key=lambda bound: bound[0])
+
+    return JobRequirements(
+        min_years=min_years,
+        max_years=max_years,
+        # 여러 학위가 나오면 (예: "학사 이상, 석사 우대") 가장 낮은 것이 최소 요건
+        degree_level=min(degree_levels) if degree_levels else None,
+        languages=tuple(languages.items()),
+    )
+
+
+def degree_rank(education_level: str) -> int:
+    """사용자 학위 표기의 수준 (알 수 없으면 0)"""
+    if not education_level:
+        return 0
+    ranks = [DEGREE_LEVELS[match.group(0).lower()]
+             for match in DEGREE_PATTERN.finditer(education_level)]
+    return max(ranks) if ranks else 0
+
+
+def proficiency_rank(level: str) -> int:
+    """사용자 언어 수준 표기의 순위 (알 수 없으면 0)"""
+    return PROFICIENCY_LEVELS.get((level or "").strip().lower(), 0)
+
+
+def canonical_language(name: str) -> str:
+    """언어 이름을 대표 이름으로 (모르는 이름은 소문자 그대로)"""
+    return LANGUAGE_NAMES.get((name or "").strip().lower(), (name or "").strip().lower())
@@ -0,0 +1,133 @@
+"""점수 구성요소별 입력 선언과 결과 캐시 (부분 재계산)
+
+각 구성요소는 자신이 읽는 UserContext 필드를 COMPONENT_DEPENDENCIES에 선언하고,
+(구성요소, 선언된 필드 값, 공고 텍스트, 분석 방식) 해시를 키로 결과를 캐시한다.
+프로필에서 한 필드만 고친 뒤 다시 분석하면 그 필드를 읽는 구성요소만 다시 계산된다.
+"""
+import copy
+import json
+import threading
+import contextvars
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+from utils.mcp_schema import UserContext
+from utils.single_flight import text_hash
+
+# 구성요소 → 읽는 UserContext 필드 (공고 쪽 입력은 모두 공고 텍스트 하나)
+COMPONENT_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    'skill_match': ('skills', 'programming_languages'),
+    'role_match': ('target_roles',),
+    'experience_match': ('experience_by_industry',),
+    'language_requirement': ('languages',),
+    'education_match': ('education_level', 'major', 'university'),
+    'additional_notes_match': ('additional_notes',),
+    'embedding': ('target_roles', 'experience_by_industry', 'skills', 'programming_languages', 'languages',
+                  'projects', 'certifications', 'additional_notes'),
+    'keyword_similarity': ('target_roles', 'experience_by_industry', 'skills', 'programming_languages',
+                           'languages', 'work_preference', 'education_level', 'major', 'projects',
+                           'certifications', 'location_preference', 'additional_notes'),
+    'matched_skills': ('skills', 'programming_languages'),
+    'missing_skills': ('skills', 'programming_languages'),
+}
+
+COMPONENT_CACHE_SIZE = 4096
+
+# 구성요소 → 결과에 영향을 주는 공유 상태(어휘 인덱스 IDF, 스킬 어휘 등)의 버전 함수
+_state_versions: Dict[str, List[Callable[[], Any]]] = {}
+
+
+def register_state_version(components: Tuple[str, ...], version: Callable[[], Any]) -> None:
+    """구성요소가 읽는 공유 상태의 버전 함수 등록 (버전이 바뀌면 캐시 키가 달라져 다시 계산)"""
+    for component in components:
+        _state_versions.setdefault(component, []).append(version)
+
+# 계산 중 fallback 경로(GPT 실패 등)를 탄 결과는 일시적인 값이므로 캐시하지 않음
+_uncacheable: contextvars.ContextVar[bool] = contextvars.ContextVar("component_uncacheable", default=False)
+
+
+def mark_uncacheable() -> None:
+    """현재 계산 중인 구성요소 결과를 캐시에 저장하지 않도록 표시"""
+    _uncacheable.set(True)
+
+
+class ScoreInputs:
+    """한 번의 점수 계산 입력 (프로필 직렬화와 공고 해시를 한 번만 계산)"""
+
+    def __init__(self, user_context: UserContext, job_text: str):
+        self.user_context = user_context
+        self.job_text = job_text
+        self.profile = user_context.to_dict()
+        self.job_key = text_hash(job_text)
+        self._field_keys: Dict[str, str] = {}
+        # 이번 계산에서 재사용/새로 계산한 구성요소 수
+        self.reused = 0
+        self.computed = 0
+
+    def field_key(self, field: str) -> str:
+        """필드 값 하나의 해시 (같은 계산 안에서는 재사용)"""
+        key = self._field_keys.get(field)
+        if key is None:
+            payload = json.dumps(self.profile.get(field), ensure_ascii=False, sort_keys=True, default=str)
+            key = self._field_keys[field] = text_hash(payload)
+        return key
+
+    def component_key(self, component: str, variant: str = "") -> str:
+        fields = COMPONENT_DEPENDENCIES[component]
+        versions = [str(version()) for version in _state_versions.get(component, ())]
+        return text_hash("|".join([component, variant, self.job_key] + versions
+                                  + [self.field_key(field) for field in fields]))
+
+
+class ComponentCache:
+    """구성요소 결과 LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: int = COMPONENT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, component: str, inputs: ScoreInputs, compute: Callable[[], Any],
+                       variant: str = "") -> Any:
+        """선언된 입력이 같으면 캐시 결과, 아니면 compute() 결과를 저장 후 반환"""
+        key = inputs.component_key(component, variant)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                inputs.reused += 1
+                return _copy_value(self._entries[key])
+            self.misses += 1
+        inputs.computed += 1
+
+        token = _uncacheable.set(False)
+        try:
+            value = compute()
+            if _uncacheable.get():
+                return value
+        finally:
+            _uncacheable.reset(token)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return _copy_value(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+def _copy_value(value: Any) -> Any:
+    # 목록/사전 결과는 호출부 수정이 캐시에 반영되지 않도록 복사
+    return value if isinstance(value, (int, float, str, type(None))) else copy.deepcopy(value)
+
+
+COMPONENT_CACHE = ComponentCache()
@@ -0,0 +1,116 @@
+"""점수 구성요소 레지스트리와 가중치 설정, 벡터화된 가중합 집계
+
+구성요소는 (프로필, 공고) 쌍 배치를 받아 쌍마다 값 하나를 돌려주는 함수로 등록한다.
+배치의 구성요소 점수는 (쌍 × 구성요소) 행렬 하나로 모으고, 키워드 합계와 최종 점수는
+가중치 벡터와의 행렬 곱 한 번으로 계산한다. 가중치만 바꾼 A/B 비교는 구성요소를 다시
+계산하지 않고 같은 행렬을 aggregate()에 다른 가중치로 넘기면 된다.
+
+환경변수:
+    SCORING_WEIGHTS_PATH=   가중치 JSON 파일 (지정한 값만 기본값을 덮어씀)
+        {"keyword": {"skill_match": 0.25, "role_match": 0.3, ...}, "blend": {"keyword": 0.7, "embedding": 0.3}}
+"""
+import os
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SCORING_WEIGHTS_PATH = os.getenv('SCORING_WEIGHTS_PATH', '')
+
+# 키워드 구성요소별 가중치 (합 1)
+DEFAULT_KEYWORD_WEIGHTS = {
+    'skill_match': 0.25,
+    'role_match': 0.3,
+    'experience_match': 0.15,
+    'language_requirement': 0.1,
+    'education_match': 0.1,
+    'additional_notes_match': 0.1,
+}
+# 최종 점수에서 키워드 점수 합계와 임베딩 유사도의 비율
+DEFAULT_BLEND_WEIGHTS = {'keyword': 0.7, 'embedding': 0.3}
+
+
+@dataclass(frozen=True)
+class ScoringWeights:
+    """키워드 구성요소 가중치와 키워드/임베딩 혼합 비율"""
+    keyword: Dict[str, float]
+    blend: Dict[str, float]
+
+
+def load_scoring_weights(path: Optional[str] = None) -> ScoringWeights:
+    """기본 가중치에 설정 파일 값을 덮어쓴 가중치 (파일이 없거나 읽을 수 없으면 기본값)"""
+    keyword = dict(DEFAULT_KEYWORD_WEIGHTS)
+    blend = dict(DEFAULT_BLEND_WEIGHTS)
+    if path:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            keyword.update({name: float(weight) for name, weight in config.get('keyword', {}).items()})
+            blend.update({name: float(weight) for name, weight in config.get('blend', {}).items()})
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Scoring weights could not be loaded from %s (%s), using defaults", path, e)
+    if abs(sum(keyword.values()) - 1.0) > 1e-6:
+        logger.warning("Keyword weights sum to %.3f, not 1", sum(keyword.values()))
+    return ScoringWeights(keyword=keyword, blend=blend)
+
+
+@dataclass(frozen=True)
+class ScoringComponent:
+    """등록된 점수 구성요소 (compute: (matcher, 입력 배치) → 쌍별 값, to_score: 값 → 0~1 점수)"""
+    name: str
+    group: str
+    compute: Callable[[Any, Sequence[Any]], List[Any]]
+    to_score: Callable[[Any], float] = float
+
+
+class ComponentRegistry:
+    """이름 → 점수 구성요소 (등록 순서가 행렬의 열 순서)"""
+
+    def __init__(self):
+        self._components: Dict[str, ScoringComponent] = {}
+
+    def register(self, name: str, compute: Callable[[Any, Sequence[Any]], List[Any]], group: str = 'keyword',
+                 to_score: Callable[[Any], float] = float) -> None:
+        """구성요소 등록 (group: 'keyword'는 키워드 가중치, 'embedding'은 혼합 비율로 가중)"""
+        self._components[name] = ScoringComponent(name, group, compute, to_score)
+
+    def names(self, group: Optional[str] = None) -> List[str]:
+        return [name for name, component in self._components.items() if group is None or component.group == group]
+
+    def compute(self, matcher, batch: Sequence[Any], names: Sequence[str]) -> Tuple[np.ndarray, Dict[str, List[Any]]]:
+        """배치의 (쌍 × 구성요소) 점수 행렬과 구성요소별 원래 값 목록"""
+        matrix = np.zeros((len(batch), len(names)), dtype=np.float64)
+        values: Dict[str, List[Any]] = {}
+        for column, name in enumerate(names):
+            component = self._components[name]
+            values[name] = list(component.compute(matcher, batch))
+            matrix[:, column] = [component.to_score(value) for value in values[name]]
+        return matrix, values
+
+    def weight_vectors(self, names: Sequence[str], weights: ScoringWeights) -> np.ndarray:
+        """(구성요소 × 2) 가중치 행렬: 0열은 키워드 합계용, 1열은 최종 점수용"""
+        vectors = np.zeros((len(names), 2), dtype=np.float64)
+        for row, name in enumerate(names):
+            if self._components[name].group == 'keyword':
+                vectors[row, 0] = weights.keyword.get(name, 0.0)
+                vectors[row, 1] = vectors[row, 0] * weights.blend.get('keyword', 0.0)
+            else:
+                vectors[row, 1] = weights.blend.get(self._components[name].group, 0.0)
+        return vectors
+
+    def aggregate(self, matrix: np.ndarray, names: Sequence[str], weights: ScoringWeights) -> Dict[str, np.ndarray]:
+        """구성요소 점수 행렬 → 가중 구성요소 점수, 키워드 합계, 최종 점수 (가중합 한 번)"""
+        vectors = self.weight_vectors(names, weights)
+        totals = matrix @ vectors
+        return {
+            'weighted': matrix * vectors[:, 0],
+            'keyword_total': totals[:, 0],
+            'final': totals[:, 1],
+        }
+
+
+SCORING_COMPONENTS = ComponentRegistry()
+SCORING_WEIGHTS = load_scoring_weights(SCORING_WEIGHTS_PATH)
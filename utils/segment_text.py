@@ -0,0 +1,108 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+# 섹션 종류별 헤더 표기 (clean_text가 아포스트로피를 제거하므로 "youll" 형태도 포함)
+SECTION_HEADERS: Dict[str, List[str]] = {
+    'company_intro': [
+        '회사 소개', '회사소개', '기업 소개', '기업소개', '팀 소개', '팀소개',
+        'About us', 'About the company', 'About the team', 'Who we are', 'Company overview',
+    ],
+    'responsibilities': [
+        '주요 업무', '주요업무', '담당 업무', '담당업무', '업무 내용', '업무내용', '합류하면 하게 될 일',
+        'Responsibilities', 'What you will do', 'What youll do', 'Your role', 'The role', 'Job description',
+    ],
+    'requirements': [
+        '자격 요건', '자격요건', '지원 자격', '지원자격', '필수 요건', '필수요건', '필요 역량', '필수 역량',
+        'Requirements', 'Qualifications', 'Minimum qualifications', 'Basic qualifications',
+        'What we are looking for', 'What were looking for', 'Who you are', 'Must have',
+    ],
+    'preferred': [
+        '우대 사항', '우대사항', '우대 조건', '우대조건',
+        'Preferred qualifications', 'Preferred', 'Nice to have', 'Bonus points', 'Pluses',
+    ],
+    'benefits': [
+        '혜택 및 복지', '복지 및 혜택', '혜택복지', '복리후생', '복리 후생',
+        'Benefits', 'Perks', 'What we offer',
+    ],
+    'process': [
+        '채용 절차', '채용절차', '전형 절차', '전형절차', '기타 사항', '근무 조건',
+        'Hiring process', 'Recruitment process', 'Interview process',
+    ],
+}
+
+# 점수 계산과 LLM 프롬프트에 사용할 요구사항 성격의 섹션
+FOCUS_SECTIONS = ('responsibilities', 'requirements', 'preferred')
+
+# 집중 섹션이 이보다 짧으면 분할이 실패한 것으로 보고 전체 텍스트를 사용
+MIN_FOCUS_CHARS = 200
+
+
+def _header_pattern(header: str) -> str:
+    """헤더 표기를 정규식으로 변환
+
+    한글 헤더는 그대로 매칭하고, 영문 헤더는 문장 속 일반 단어("The role is great.")와
+    구분하기 위해 뒤에 콜론이 오거나 한 줄을 통째로 차지하는 경우에만 헤더로 본다.
+    """
+    escaped = re.escape(header).replace(r'\ ', r'\s*')
+    if re.search(r'[가-힣]', header):
+        return escaped
+    return rf'(?:(?:^|(?<=\n))[ \t]*(?i:{escaped})(?=[ \t]*(?:\n|$))|\b(?i:{escaped})(?=[ \t]*:))'
+
+
+def _build_header_index() -> Tuple[re.Pattern, Dict[str, str]]:
+    """모든 헤더를 하나의 정규식으로 합치고 그룹명 → 섹션 종류 매핑 생성"""
+    alternatives = []
+    group_to_section = {}
+    # 긴 헤더를 먼저 시도해야 "Preferred qualifications"가 "Qualifications"보다 우선한다
+    entries = sorted(
+        ((section, header) for section, headers in SECTION_HEADERS.items() for header in headers),
+        key=lambda entry: len(entry[1]),
+        reverse=True
+    )
+    for i, (section, header) in enumerate(entries):
+        group_name = f"h{i}"
+        alternatives.append(f"(?P<{group_name}>{_header_pattern(header)})")
+        group_to_section[group_name] = section
+    return re.compile('|'.join(alternatives)), group_to_section
+
+
+SECTION_HEADER_PATTERN, _GROUP_TO_SECTION = _build_header_index()
+
+
+@lru_cache(maxsize=64)
+def _segment(text: str) -> Tuple[Tuple[str, str], ...]:
+    """헤더 위치를 기준으로 (섹션 종류, 내용) 목록 생성"""
+    segments = []
+    current_section = 'overview'
+    last_end = 0
+    for match in SECTION_HEADER_PATTERN.finditer(text):
+        content = text[last_end:match.start()].strip(' :-\n\t')
+        if content:
+            segments.append((current_section, content))
+        current_section = _GROUP_TO_SECTION[match.lastgroup]
+        last_end = match.end()
+    content = text[last_end:].strip(' :-\n\t')
+    if content:
+        segments.append((current_section, content))
+    return tuple(segments)
+
+
+def segment_job_posting(text: str) -> Dict[str, str]:
+    """채용 공고를 회사소개/주요업무/자격요건/우대사항/복지 등 섹션별로 분리"""
+    sections: Dict[str, str] = {}
+    if not text:
+        return sections
+    for section, content in _segment(text):
+        sections[section] = f"{sections[section]} {content}" if section in sections else content
+    return sections
+
+
+def get_focus_text(text: str) -> str:
+    """요구사항 성격의 섹션만 모은 텍스트 반환 (분할 실패 시 전체 텍스트)"""
+    sections = segment_job_posting(text)
+    focus_parts = [sections[section] for section in FOCUS_SECTIONS if section in sections]
+    focus_text = " ".join(focus_parts)
+    if len(focus_text) < MIN_FOCUS_CHARS:
+        return text
+    return focus_text
@@ -0,0 +1,82 @@
+"""동일한 분석 요청의 in-flight 합치기 (single-flight)
+
+여러 세션(스레드)이 같은 키로 동시에 호출하면 첫 호출만 실제로 실행하고, 나머지는 그 결과
+(또는 예외)를 기다려 함께 받는다. 완료된 결과를 보관하는 캐시가 아니라 실행 중인 호출만 공유한다.
+"""
+import copy
+import hashlib
+import functools
+import threading
+from typing import Any, Callable, Dict, Optional
+from utils.tracing import span
+
+
+class _Call:
+    """진행 중인 호출 하나 (완료 시 event가 set됨)"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """키별로 진행 중인 호출을 공유하는 그룹"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable, *args, **kwargs):
+        """같은 키의 호출이 진행 중이면 기다렸다가 그 결과를 받고, 없으면 직접 실행"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            with span(f"singleflight.{self.name}", shared=True):
+                call.event.wait()
+            if call.error is not None:
+                raise call.error
+            # 호출부가 결과(dict 등)를 수정해도 다른 세션에 영향이 없도록 복사본 반환
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        # 키를 지운 뒤에는 기다리는 호출이 더 늘지 않음. 있으면 그쪽이 복사할 원본을 리더가 고치지 않도록 복사본 반환
+        return copy.deepcopy(call.result) if call.waiters else call.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+def text_hash(text: str) -> str:
+    """긴 텍스트/키 재료를 짧은 고정 길이 키로"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:24]
+
+
+def single_flight(name: str, key_func: Callable[..., str]):
+    """함수 호출을 key_func(*args, **kwargs) 키로 합치는 데코레이터"""
+    group = SingleFlight(name)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return group.do(key_func(*args, **kwargs), func, *args, **kwargs)
+        wrapper.single_flight_group = group
+        return wrapper
+    return decorator
@@ -0,0 +1,183 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List
+import numpy as np
+from utils.text_normalize import normalize
+
+# 공통 스킬 매핑 사전 (대표 표기 → 다른 표기법/유사어)
+SKILL_MAPPING: Dict[str, List[str]] = {
+    # 프로그래밍 언어
+    'python': ['파이썬', 'python3', 'python2'],
+    'javascript': ['js', '자바스크립트', 'java script', 'ecmascript'],
+    'java': ['자바'],
+    'sql': ['에스큐엘', 'structured query language', 'sequel'],
+    'r': ['r language', 'r programming'],
+    'c++': ['cpp', 'c plus plus', 'cplusplus'],
+    'c#': ['csharp', 'c sharp'],
+    'golang': ['go', 'go language'],
+    'php': ['php7', 'php8'],
+
+    # AI/ML/Data 기술
+    'rag': ['retrieval augmented generation', '검색 증강 생성', 'retrieval-augmented generation'],
+    'mcp': ['model context protocol'],
+    'llm': ['large language model', '대형 언어 모델', 'large language models'],
+    'nlp': ['natural language processing', '자연어 처리', 'natural language'],
+    'transformers': ['transformer', 'huggingface transformers', 'transformer models'],
+    'pytorch': ['torch', 'pytorch framework'],
+    'tensorflow': ['tf', 'tensor flow', 'tensorflow2'],
+    'scikit-learn': ['sklearn', 'scikit learn', 'sci-kit learn'],
+    'opencv': ['cv2', 'open cv', 'computer vision'],
+    'pandas': ['pd', 'pandas dataframe'],
+    'numpy': ['np', 'numerical python'],
+
+    # 클라우드/인프라
+    'aws': ['amazon web services', 'amazon aws'],
+    'gcp': ['google cloud platform', 'google cloud'],
+    'azure': ['microsoft azure', 'azure cloud'],
+    'docker': ['containerization', '도커'],
+    'kubernetes': ['k8s', 'k8', '쿠버네티스'],
+
+    # 데이터베이스
+    'mysql': ['my sql', 'mysql database'],
+    'postgresql': ['postgres', 'postgre sql', 'postgresql database'],
+    'mongodb': ['mongo db', 'mongo database'],
+    'redis': ['redis database', 'redis cache'],
+
+    # 도구/프레임워크
+    'power bi': ['powerbi', '파워 BI', '파워비아이', 'microsoft power bi'],
+    'excel': ['엑셀', 'microsoft excel', 'ms excel', 'excel spreadsheet'],
+    'tableau': ['tableau desktop', 'tableau public'],
+    'git': ['github', 'git version control', 'version control'],
+    'react': ['reactjs', 'react.js', 'react framework'],
+    'vue': ['vuejs', 'vue.js', 'vue framework'],
+    'angular': ['angularjs', 'angular framework'],
+    'node.js': ['nodejs', 'node js', 'node'],
+    'django': ['django framework', 'django python'],
+    'flask': ['flask framework', 'flask python'],
+    'fastapi': ['fast api', 'fastapi framework'],
+
+    # 기타
+    'api': ['rest api', 'restful api', 'web api'],
+    'html': ['html5', 'hypertext markup language'],
+    'css': ['css3', 'cascading style sheets'],
+    'json': ['javascript object notation'],
+    'xml': ['extensible markup language'],
+}
+
+# 공고에서 요구 여부를 확인하는 핵심 기술 (부족한 스킬 분석용)
+CORE_SKILLS: List[str] = [
+    'Python', 'Java', 'JavaScript', 'SQL', 'R', 'TensorFlow', 'PyTorch',
+    'AWS', 'Docker', 'Kubernetes', 'React', 'Vue.js', 'Node.js',
+    'MongoDB', 'PostgreSQL', 'MySQL', 'RAG', 'MCP', 'Power BI', 'Excel'
+]
+
+
+def basic_variations(term: str) -> List[str]:
+    """공백/하이픈/언더스코어/점을 제거한 기본 변형 표기"""
+    return [term.replace(' ', ''), term.replace('-', ''), term.replace('_', ''), term.replace('.', '')]
+
+
+class SkillVocabulary:
+    """전역 스킬 어휘 (표기법이 다른 스킬을 하나의 정수 id로 정규화, 스레드 안전)
+
+    프로필은 스킬 id 배열, 공고는 어휘 크기의 boolean 마스크로 표현되며, 매칭·부족·중복
+    계산은 NumPy 인덱싱과 집합 연산으로 처리된다. 사전에 없는 사용자 스킬은 처음 등장할 때
+    새 id로 추가된다.
+    """
+
+    def __init__(self, mapping: Dict[str, List[str]], core_skills: Iterable[str], posting_cache_size: int = 256):
+        # 새 id 등록과 공고 마스크 캐시 갱신을 직렬화 (조회는 잠금 없이 완성된 항목만 읽음)
+        self._lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._names: List[str] = []                # id → 대표 표기
+        self._surface_forms: List[List[str]] = []  # id → 공고에서 찾을 표기 목록
+        self._form_to_id: Dict[str, int] = {}      # 모든 표기(소문자) → id
+
+        for canonical, variations in mapping.items():
+            self._add_term(canonical, [canonical] + list(variations))
+
+        self.core_skill_names = list(core_skills)
+        self.core_ids = np.array([self.intern(skill) for skill in self.core_skill_names], dtype=np.int64)
+
+        # 공고 텍스트 → 스킬 등장 마스크 (마스크 길이 = 검사 당시 어휘 크기)
+        self._posting_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._posting_cache_size = posting_cache_size
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _add_term(self, name: str, forms: List[str]) -> int:
+        """새 스킬 id 등록 (이미 다른 id에 속한 표기는 그대로 둠)
+
+        잠금 없이 읽는 쪽이 반쯤 만든 항목을 보지 않도록 표기 목록 → 이름(어휘 크기) →
+        표기 색인 순서로 공개한다. __init__ 또는 self._lock을 잡은 상태에서만 호출.
+        """
+        term_id = len(self._names)
+        surface_forms = []
+        for form in forms:
+            form = form.lower()
+            for candidate in [form] + basic_variations(form):
+                if candidate and candidate not in surface_forms:
+                    surface_forms.append(candidate)
+        self._surface_forms.append(surface_forms)
+        self._names.append(name)
+        for candidate in surface_forms:
+            self._form_to_id.setdefault(candidate, term_id)
+        return term_id
+
+    def intern(self, skill: str) -> int:
+        """스킬 표기를 id로 변환 (처음 보는 스킬은 새 id로 등록)"""
+        skill_lower = skill.strip().lower()
+        term_id = self._form_to_id.get(skill_lower)
+        if term_id is not None:
+            return term_id
+        with self._lock:
+            term_id = self._form_to_id.get(skill_lower)
+            if term_id is None:
+                term_id = self._add_term(skill_lower, [skill_lower])
+        return term_id
+
+    def skill_ids(self, skills: Iterable[str]) -> np.ndarray:
+        """스킬 목록을 id 배열로 변환 (순서와 중복 유지)"""
+        return np.array([self.intern(skill) for skill in skills], dtype=np.int64)
+
+    def name(self, term_id: int) -> str:
+        return self._names[term_id]
+
+    def posting_mask(self, job_lower: str) -> np.ndarray:
+        """공고(소문자) 텍스트에 등장하는 스킬 id 마스크 (텍스트별로 캐시, 어휘가 늘면 새 id만 검사)
+
+        마스크 길이는 호출 시점의 어휘 크기이므로 그 전에 받은 id로 인덱싱할 수 있다.
+        표기 확인은 정규화된 토큰/n-gram 집합 조회라서 "excellent" 안의 "excel" 같은
+        부분 문자열 오탐이 없고, "파이썬을"처럼 조사가 붙은 한글 표기도 매칭된다.
+        """
+        vocab_size = len(self)
+        with self._cache_lock:
+            cached = self._posting_cache.get(job_lower)
+            if cached is not None and cached.size >= vocab_size:
+                self._posting_cache.move_to_end(job_lower)
+                return cached
+
+        start = cached.size if cached is not None else 0
+        mask = np.zeros(vocab_size, dtype=bool)
+        if cached is not None:
+            mask[:start] = cached
+        normalized = normalize(job_lower)
+        for term_id in range(start, vocab_size):
+            mask[term_id] = any(normalized.contains(form) for form in self._surface_forms[term_id])
+        # 캐시된 마스크를 호출한 쪽이 고치지 못하도록 읽기 전용으로 공개
+        mask.flags.writeable = False
+
+        with self._cache_lock:
+            # 다른 스레드가 더 긴 마스크를 먼저 넣었다면 그대로 둠
+            current = self._posting_cache.get(job_lower)
+            if current is None or current.size < mask.size:
+                self._posting_cache[job_lower] = mask
+            self._posting_cache.move_to_end(job_lower)
+            while len(self._posting_cache) > self._posting_cache_size:
+                self._posting_cache.popitem(last=False)
+        return mask
+
+
+# 전역 스킬 어휘 (스킬 매핑 사전과 핵심 기술 목록으로 초기화)
+SKILL_VOCABULARY = SkillVocabulary(SKILL_MAPPING, CORE_SKILLS)
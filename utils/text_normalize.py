@@ -0,0 +1,92 @@
+"""키워드 매칭용 한국어 인지 정규화/토큰화
+
+텍스트마다 한 번만 (캐시) 다음을 계산한다.
+    - NFKC 정규화 (전각/반각 영숫자·기호 통일) + 소문자 + 공백 정리
+    - 토큰화: 영문/숫자 토큰("node.js", "c++", "c#" 유지)과 한글 토큰을 분리 ("python을" → "python", "을")
+    - 한글 토큰 끝의 조사 제거 ("파이썬을" → "파이썬", "엔지니어로서" → "엔지니어")
+    - 조회용 키 집합: 토큰(원형 + 조사 제거형), 최대 4개 토큰 n-gram, 한글 토큰의 접두어
+      → 스킬/직무 표기 확인이 부분 문자열 검색 대신 집합 조회가 되고, "excellent" 안의 "excel",
+        "email" 안의 "ai" 같은 오탐이 사라진다. 한글 복합어("파이썬개발자")는 접두어로 매칭된다.
+"""
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, Tuple
+
+# 긴 조사부터 제거 (토큰이 조사로만 이루어져 있으면 토큰 자체를 버림)
+KOREAN_PARTICLES = tuple(sorted([
+    '으로서', '으로써', '에서는', '에게서', '이라도', '까지는', '부터는',
+    '에서', '에게', '한테', '으로', '로서', '로써', '까지', '부터', '처럼', '보다', '이나', '이랑', '하고', '이며',
+    '을', '를', '이', '가', '은', '는', '의', '에', '로', '와', '과', '도', '만', '나', '랑', '며',
+], key=len, reverse=True))
+_PARTICLE_SET = frozenset(KOREAN_PARTICLES)
+
+# 조사를 떼고 남는 한글 어간의 최소 길이 ("이" 같은 한 글자 단어 보호)
+MIN_STEM_LENGTH = 2
+MAX_NGRAM = 4
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[.+#][a-z0-9]+)*[+#]*|[가-힣]+")
+_HANGUL_TOKEN = re.compile(r"[가-힣]+")
+
+
+def normalize_text(text: str) -> str:
+    """NFKC + 소문자 + 연속 공백 정리"""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", text or "")).strip().lower()
+
+
+def strip_particle(token: str) -> str:
+    """한글 토큰 끝의 조사 하나 제거 (남는 어간이 너무 짧으면 그대로)"""
+    if not _HANGUL_TOKEN.fullmatch(token):
+        return token
+    for particle in KOREAN_PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= MIN_STEM_LENGTH:
+            return token[:-len(particle)]
+    return token
+
+
+@lru_cache(maxsize=4096)
+def tokenize(text: str) -> Tuple[str, ...]:
+    """정규화 후 조사를 제거한 토큰 목록 (조사만 있는 토큰은 제외)"""
+    return tuple(strip_particle(token) for token in TOKEN_PATTERN.findall(normalize_text(text))
+                 if token not in _PARTICLE_SET)
+
+
+@dataclass(frozen=True)
+class NormalizedText:
+    """텍스트 하나의 정규화 결과"""
+    text: str
+    tokens: Tuple[str, ...]
+    lookup: FrozenSet[str]
+
+    @property
+    def token_set(self) -> FrozenSet[str]:
+        return frozenset(self.tokens)
+
+    def contains(self, term: str) -> bool:
+        """표기(단어/구)가 토큰 경계에 맞춰 등장하는지 (집합 조회)"""
+        term_tokens = tokenize(term)
+        if not term_tokens:
+            return False
+        if len(term_tokens) <= MAX_NGRAM:
+            return " ".join(term_tokens) in self.lookup
+        return f" {' '.join(term_tokens)} " in f" {' '.join(self.tokens)} "
+
+
+@lru_cache(maxsize=512)
+def normalize(text: str) -> NormalizedText:
+    """텍스트 정규화 결과 (같은 텍스트는 캐시)"""
+    normalized = normalize_text(text)
+    raw_tokens = [token for token in TOKEN_PATTERN.findall(normalized) if token not in _PARTICLE_SET]
+    tokens = tuple(strip_particle(token) for token in raw_tokens)
+
+    lookup = set(raw_tokens)
+    lookup.update(tokens)
+    for token in raw_tokens:
+        if _HANGUL_TOKEN.fullmatch(token):
+            # 붙여 쓴 한글 복합어 안의 앞부분 표기 ("파이썬개발자" → "파이썬")
+            lookup.update(token[:end] for end in range(MIN_STEM_LENGTH, len(token)))
+    for size in range(2, MAX_NGRAM + 1):
+        lookup.update(" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1))
+
+    return NormalizedText(normalized, tokens, frozenset(lookup))
@@ -0,0 +1,173 @@
+import json
+import time
+import uuid
+import functools
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, List, Optional
+
+# 현재 활성화된 분석 trace와 부모 span (스레드/Streamlit 세션별로 분리됨)
+_current_trace: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar("current_trace", default=None)
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """파이프라인 단계 하나의 측정 결과 (wall time, CPU time, 결과)"""
+    name: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_time: float = 0.0
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    outcome: str = "ok"
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def set(self, key: str, value: Any) -> None:
+        """span 속성 기록 (문자 수, 모델 이름 등)"""
+        self.attributes[key] = value
+
+    def set_outcome(self, outcome: str) -> None:
+        """결과 기록 (ok / error / empty / fallback 등)"""
+        self.outcome = outcome
+
+
+class Trace:
+    """분석 한 번(URL 추출 → 매칭 → 피드백)에 속한 span 모음"""
+
+    def __init__(self, name: str = "analysis"):
+        self.name = name
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.created_at = time.time()
+        self.spans: List[Span] = []
+
+    @contextmanager
+    def activate(self):
+        """이 trace를 현재 컨텍스트에 연결 (여러 번 나누어 활성화 가능)"""
+        token = _current_trace.set(self)
+        try:
+            yield self
+        finally:
+            _current_trace.reset(token)
+
+    def total_ms(self) -> float:
+        """최상위 span들의 wall time 합계"""
+        return sum(span.wall_ms for span in self.spans if span.parent_id is None)
+
+    def token_usage(self) -> Dict[str, int]:
+        """이번 분석의 GPT 호출 토큰 합계 (응답 usage 기준, 없으면 로컬 추정치)"""
+        totals = {'calls': 0, 'prompt_tokens': 0, 'completion_tokens': 0, 'cached_tokens': 0}
+        for span in self.spans:
+            prompt_tokens = span.attributes.get('prompt_tokens') or span.attributes.get('prompt_tokens_est')
+            if prompt_tokens is None:
+                continue
+            totals['calls'] += 1
+            totals['prompt_tokens'] += prompt_tokens
+            totals['completion_tokens'] += span.attributes.get('completion_tokens') or 0
+            totals['cached_tokens'] += span.attributes.get('cached_tokens') or 0
+        # provider prompt 캐시에서 재사용된 프롬프트 토큰 비율
+        totals['cached_ratio'] = totals['cached_tokens'] / totals['prompt_tokens'] if totals['prompt_tokens'] else 0.0
+        return totals
+
+    def breakdown(self) -> List[Dict[str, Any]]:
+        """단계별 timing 표 (기록 순서, 중첩 깊이 포함)"""
+        depths: Dict[str, int] = {}
+        rows = []
+        for span in sorted(self.spans, key=lambda s: s.start_time):
+            depth = depths.get(span.parent_id, -1) + 1 if span.parent_id else 0
+            depths[span.span_id] = depth
+            rows.append({
+                'stage': "  " * depth + span.name,
+                'wall_ms': round(span.wall_ms, 1),
+                'cpu_ms': round(span.cpu_ms, 1),
+                'outcome': span.outcome,
+                **{key: value for key, value in span.attributes.items() if isinstance(value, (int, float, str, bool))},
+            })
+        return rows
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'trace_id': self.trace_id,
+            'name': self.name,
+            'created_at': self.created_at,
+            'total_ms': round(self.total_ms(), 3),
+            'token_usage': self.token_usage(),
+            'spans': [asdict(span) for span in self.spans],
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """span 목록을 JSON으로 내보내기"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent, default=str)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def current_span() -> Optional[Span]:
+    """현재 측정 중인 span (fallback 경로에서 outcome을 바꿀 때 사용)"""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """단계 측정 context manager (활성 trace가 없으면 측정만 하고 기록하지 않음)
+
+    예외가 발생하면 outcome을 'error'로 기록한 뒤 그대로 다시 던진다.
+    """
+    parent = _current_span.get()
+    current = Span(
+        name=name,
+        span_id=uuid.uuid4().hex[:8],
+        parent_id=parent.span_id if parent else None,
+        start_time=time.time(),
+        attributes=dict(attributes),
+    )
+    token = _current_span.set(current)
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield current
+    except BaseException as e:
+        current.outcome = "error"
+        current.attributes['error'] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.wall_ms = (time.perf_counter() - wall_start) * 1000
+        current.cpu_ms = (time.thread_time() - cpu_start) * 1000
+        _current_span.reset(token)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.spans.append(current)
+
+
+def traced(name: Optional[str] = None, outcome: Optional[Callable[[Any], str]] = None):
+    """함수 호출 전체를 span으로 측정하는 데코레이터
+
+    outcome: 반환값으로 결과 문자열을 정하는 함수 (예: 빈 결과 → 'empty')
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name) as current:
+                result = func(*args, **kwargs)
+                if outcome is not None:
+                    current.set_outcome(outcome(result))
+                return result
+        return wrapper
+    return decorator
+
+
+def record_usage(current: Span, response) -> None:
+    """OpenAI 응답의 토큰 사용량을 span 속성으로 기록"""
+    usage = getattr(response, 'usage', None)
+    if usage is None:
+        return
+    current.set('prompt_tokens', getattr(usage, 'prompt_tokens', None))
+    current.set('completion_tokens', getattr(usage, 'completion_tokens', None))
+    # prompt 캐시 적중 토큰 수 (provider가 지원하지 않으면 0)
+    details = getattr(usage, 'prompt_tokens_details', None)
+    current.set('cached_tokens', getattr(details, 'cached_tokens', None) or 0)